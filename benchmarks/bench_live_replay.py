@@ -0,0 +1,144 @@
+# benchmarks/bench_live_replay.py
+"""
+Live pipeline throughput from a recorded (or synthetic) tick log.
+
+Replays ticks through LiveFeedService -> LivePriceWorker -> TickChannel
+exactly as the live feed would, against a throwaway parquet store, and
+reports ticks/second, how the write-behind queue merged and flushed parquet
+writes, and how many UI updates the coalescing channel produced at the given
+drain rate.
+
+Record a real session with:
+    STOCKDASH_RECORD_TICKS=session.ticks python main.py
+
+Usage:
+    python benchmarks/bench_live_replay.py [--log session.ticks] [--ticks 20000]
+        [--symbols BENCH] [--speed max|1|10] [--flush-ms 500] [--write-interval 5]
+"""
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, ROOT)
+
+import numpy as np
+
+from core.providers import synthetic_ohlcv
+
+
+def synthetic_ticks(count, symbols, rate=10.0, seed=11):
+    """`count` ticks spread over symbols at `rate` ticks/second of recorded time"""
+    rng = np.random.default_rng(seed)
+    start = time.time() - count / rate
+    prices = {s: 100.0 for s in symbols}
+    volumes = {s: 1_000_000 for s in symbols}
+    for i in range(count):
+        symbol = symbols[i % len(symbols)]
+        prices[symbol] *= 1 + rng.normal(0, 0.0005)
+        volumes[symbol] += int(rng.integers(1, 500))
+        yield start + i / rate, {
+            "id": symbol, "price": round(prices[symbol], 4),
+            "day_volume": str(volumes[symbol]), "quote_type": "EQUITY",
+        }
+
+
+def main(log, ticks, symbols, speed, flush_ms, flush_interval=5.0):
+    from PyQt5.QtCore import QCoreApplication, QTimer
+    app = QCoreApplication(sys.argv[:1])
+
+    from core import parquet_store
+    from core.tick_channel import TickChannel
+    from core.tick_log import read_ticks, write_ticks
+    from core.write_behind import WriteBehindQueue
+    from workers.live_feed import LiveFeedService, ReplayWebSocket
+    from workers.live_price_worker import LivePriceWorker
+
+    workdir = tempfile.mkdtemp(prefix="stockdash-replay-")
+    cwd = os.getcwd()
+    os.chdir(workdir)
+    try:
+        os.makedirs(parquet_store.STORE_FOLDER, exist_ok=True)
+        if log is None:
+            log = os.path.join(workdir, "synthetic.ticks")
+            write_ticks(log, synthetic_ticks(ticks, symbols))
+        recorded = list(read_ticks(log))
+        symbols = sorted({m["id"] for _, m in recorded})
+        for symbol in symbols:
+            parquet_store.save(symbol, synthetic_ohlcv(250))
+        versions_before = {s: parquet_store.store_version(s) for s in symbols}
+
+        replay = ReplayWebSocket(recorded, speed=speed)
+        feed = LiveFeedService(socket_factory=lambda: replay)
+        channel = TickChannel()
+        writer = WriteBehindQueue(interval=flush_interval)
+        flushes = {"count": 0}
+
+        def flush():
+            if channel.drain():
+                flushes["count"] += 1
+
+        ui_timer = QTimer()
+        ui_timer.setInterval(flush_ms)
+        ui_timer.timeout.connect(flush)
+
+        workers = []
+        for symbol in symbols:
+            worker = LivePriceWorker(symbol, feed, channel, writer, clock=replay.clock)
+            worker.error.connect(lambda err: print("⚠️", err))
+            worker.start()
+            workers.append(worker)
+
+        t0 = time.perf_counter()
+        feed.start()
+        ui_timer.start()
+        while not replay.finished:
+            app.processEvents()
+            time.sleep(0.001)
+        elapsed = time.perf_counter() - t0
+        app.processEvents()
+        ui_timer.stop()
+        flush()
+
+        feed.stop()
+        feed.wait(2000)
+        writer.close()
+        queue = writer.stats()
+
+        writes = sum(parquet_store.store_version(s) - versions_before[s] for s in symbols)
+        delivered = replay.delivered
+        stats = channel.stats()
+        print(f"📼 Replayed {delivered:,} ticks for {len(symbols)} symbol(s) "
+              f"at {'max' if not speed else f'{speed:g}x'} speed in {elapsed:.2f}s")
+        print(f"   throughput      {delivered / elapsed:,.0f} ticks/s")
+        print(f"   parquet writes  {writes:,} ({queue['merged']:,} merged, "
+              f"max depth {queue['max_depth']}, flush p50 {queue['flush_p50_ms']:.1f} ms "
+              f"/ p95 {queue['flush_p95_ms']:.1f} ms)")
+        print(f"   UI flushes      {flushes['count']:,} (every {flush_ms} ms)")
+        print(f"   coalescing      {stats['coalescing_ratio']:,.1f} ticks per UI update")
+        return {
+            "ticks": delivered, "seconds": elapsed, "ticks_per_s": delivered / elapsed,
+            "parquet_writes": writes, "write_queue": queue, "ui_flushes": flushes["count"],
+            "coalescing_ratio": stats["coalescing_ratio"],
+        }
+    finally:
+        os.chdir(cwd)
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--log", help="tick log to replay (default: synthetic)")
+    parser.add_argument("--ticks", type=int, default=20_000)
+    parser.add_argument("--symbols", nargs="+", default=["BENCH"])
+    parser.add_argument("--speed", default="max", help="'max' or a multiplier (1 = real time)")
+    parser.add_argument("--flush-ms", type=int, default=500)
+    parser.add_argument("--write-interval", type=float, default=5.0, help="write-behind interval (s)")
+    args = parser.parse_args()
+    speed = None if args.speed == "max" else float(args.speed)
+    main(os.path.abspath(args.log) if args.log else None, args.ticks, args.symbols, speed,
+         args.flush_ms, args.write_interval)
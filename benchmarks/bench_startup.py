@@ -0,0 +1,98 @@
+# benchmarks/bench_startup.py
+"""
+Startup benchmark for StockDashboard.
+
+Measures time-to-interactive (imports + window construction + first event loop
+pass) and peak RSS for the lazy page setup versus building every page eagerly,
+which is what the dashboard used to do.
+
+Usage:
+    python benchmarks/bench_startup.py [--runs 5]
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _child(mode):
+    """Runs inside a fresh interpreter so imports and RSS are not shared"""
+    t0 = time.perf_counter()
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    os.environ.setdefault("STOCKDASH_PROVIDER", "local")  # no network in the timings
+    os.chdir(ROOT)
+    sys.path.insert(0, ROOT)
+
+    from PyQt5.QtWidgets import QApplication
+    app = QApplication(sys.argv[:1])
+
+    import main
+    t_import = time.perf_counter()
+
+    window = main.StockDashboard(prebuild_pages=False)
+    if mode == "eager":
+        for name in list(window._page_factories):
+            window._ensure_page(name)
+    window.show()
+    app.processEvents()
+    t_ready = time.perf_counter()
+
+    try:
+        import resource
+        peak_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        if sys.platform == "darwin":
+            peak_kb //= 1024
+    except ImportError:
+        peak_kb = None
+
+    print(json.dumps({
+        "mode": mode,
+        "import_s": t_import - t0,
+        "interactive_s": t_ready - t0,
+        "peak_rss_mb": peak_kb / 1024 if peak_kb else None,
+    }))
+
+
+def run(runs):
+    results = {"lazy": [], "eager": []}
+    for _ in range(runs):
+        for mode in results:
+            out = subprocess.check_output(
+                [sys.executable, os.path.abspath(__file__), "--child", mode],
+                cwd=ROOT,
+            )
+            results[mode].append(json.loads(out.decode().strip().splitlines()[-1]))
+
+    summary = {}
+    for mode, samples in results.items():
+        tti = sorted(s["interactive_s"] for s in samples)
+        rss = [s["peak_rss_mb"] for s in samples if s["peak_rss_mb"] is not None]
+        summary[mode] = {
+            "median_interactive_s": round(tti[len(tti) // 2], 4),
+            "max_rss_mb": round(max(rss), 1) if rss else None,
+        }
+
+    lazy, eager = summary["lazy"], summary["eager"]
+    print(f"{'mode':<8}{'time-to-interactive':>22}{'peak RSS':>14}")
+    for mode, row in summary.items():
+        rss = f"{row['max_rss_mb']} MB" if row["max_rss_mb"] is not None else "n/a"
+        print(f"{mode:<8}{row['median_interactive_s']:>20.3f} s{rss:>14}")
+    saved = eager["median_interactive_s"] - lazy["median_interactive_s"]
+    print(f"\n⏱️ Lazy pages save {saved * 1000:.0f} ms at startup")
+    return summary
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--child", choices=["lazy", "eager"], help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        _child(args.child)
+    else:
+        run(args.runs)
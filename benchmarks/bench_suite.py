@@ -0,0 +1,407 @@
+# benchmarks/bench_suite.py
+"""
+Offline benchmark suite for the data, indicator, chart, forecast, export and
+live-tick hot paths.
+
+Every case runs on synthetic OHLCV from 100 to 1M bars (capped per case
+where a size makes no sense, e.g. Prophet on 1M bars) and on the sample
+histories in `csv_data_files/`. Nothing touches the network: the run uses
+the local data provider (`core.providers.LocalProvider`); the 6mo
+"download" inside `get_stock_data` is the tail of the fixture, and all
+store writes go to a throwaway folder.
+
+Results are written as JSON. With a baseline (`--save-baseline` records
+one) every case is compared against it: cases slower by more than
+`--threshold`, and baseline cases that now error or are missing, count as
+regressions. The exit status is 1 if any regressed or any case errored.
+
+Usage:
+    python benchmarks/bench_suite.py [--sizes 100 1000 ...] [--cases chart export]
+        [--repeat 5] [--no-samples] [--out results.json]
+        [--baseline benchmarks/baseline.json] [--save-baseline] [--threshold 0.2]
+"""
+import argparse
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+os.environ.setdefault("MPLBACKEND", "Agg")
+sys.path.insert(0, ROOT)
+
+import numpy as np
+import pandas as pd
+
+from core.providers import synthetic_ohlcv
+from fixtures import sample_ohlcv, sample_tickers
+
+SIZES = (100, 1_000, 10_000, 100_000, 1_000_000)
+RESULTS_FOLDER = os.path.join(ROOT, "benchmarks", "results")
+BASELINE_PATH = os.path.join(ROOT, "benchmarks", "baseline.json")
+# Differences below this are timer noise, never a regression
+NOISE_FLOOR_MS = 0.5
+DOWNLOAD_BARS = 126  # what the 6mo Yahoo download returns
+
+CASES = {}
+
+
+def case(name, max_bars=None):
+    """Register `fn(df, ticker)`; it may return extra numbers for the report"""
+    def register(fn):
+        CASES[name] = (fn, max_bars)
+        return fn
+    return register
+
+
+# ---------------- Cases ---------------- #
+@case("data.get_stock_data")
+def bench_get_stock_data(df, ticker):
+    """Read the stored history, merge the download, save and republish"""
+    from core import parquet_store
+    from core.data_handler import get_stock_data
+    from core.providers import LocalProvider, set_provider
+
+    class DownloadProvider(LocalProvider):
+        # Offline history is never saved; this one stands in for a download
+        online = True
+
+    if not parquet_store.exists(ticker):
+        parquet_store.save(ticker, df)
+    provider = DownloadProvider(synthetic=False)
+    provider.add_history(ticker, df.tail(DOWNLOAD_BARS))
+    previous = set_provider(provider)
+    try:
+        out = get_stock_data(ticker)
+    finally:
+        set_provider(previous)
+    return {"rows": len(out)}
+
+
+@case("indicators.sma_ema_rsi_macd_bb")
+def bench_indicators(df, ticker):
+    from core.indicators import (
+        calculate_bollinger, calculate_ema, calculate_macd, calculate_rsi, calculate_sma,
+    )
+
+    frame = calculate_ema(calculate_sma(df.copy(deep=False)))
+    close = frame["Close"]
+    calculate_rsi(close)
+    calculate_macd(close)
+    calculate_bollinger(close)
+
+
+@case("indicators.derived")
+def bench_derived(df, ticker):
+    """Snapshot build plus every derived column the chart/forecast/report read"""
+    from core.snapshot import MarketSnapshot
+
+    snapshot = MarketSnapshot.from_frame(ticker, df)
+    for name in ("SMA_20", "SMA_50", "EMA_20", "RSI_14", "MACD_HIST", "BB_UPPER", "BB_LOWER", "RETURNS"):
+        snapshot[name]
+    return {"derived": len(snapshot.derived_names())}
+
+
+@case("indicators.levels")
+def bench_levels(df, ticker):
+    from core.levels import LevelTracker
+
+    return {"levels": len(LevelTracker().update(df))}
+
+
+@case("chart.create_figure", max_bars=20_000)
+def bench_chart_figure(df, ticker):
+    """ChartWorker._create_figure offscreen with every indicator panel on"""
+    import matplotlib.pyplot as plt
+    from widgets.chart_widget import ChartWorker
+
+    options = {
+        "show_sma": True, "show_ema": True, "show_rsi": True, "show_macd": True,
+        "show_bb": True, "show_sr": True, "timeframe": "1d",
+    }
+    fig = ChartWorker(df, ticker, options, is_dark=True)._create_figure()
+    plt.close(fig)
+
+
+@case("forecast.hybrid", max_bars=5_000)
+def bench_forecast(df, ticker):
+    """Whole run plus per-stage times from the forecast's own spans"""
+    from core import perf
+    from core.forecast import HybridForecaster
+
+    was_enabled = perf.enabled()
+    perf.enable()
+    perf.reset()
+    try:
+        forecast, metrics = HybridForecaster(df, periods=30).run()
+        spans = perf.summary()["spans"]
+    finally:
+        perf.enable(was_enabled)
+    _check_forecast(forecast, metrics)
+    return {
+        f"{name.split('.', 1)[1]}_ms": round(s["total_ms"], 3)
+        for name, s in spans.items() if name.startswith("forecast.")
+    }
+
+
+def _check_forecast(forecast, metrics, periods=30):
+    """Fail the case on a forecast that ran but produced nothing usable"""
+    if len(forecast) <= periods or not np.isfinite(forecast["Forecast"].to_numpy()).all():
+        raise RuntimeError("forecast has missing or non-finite values")
+    if not np.isfinite([metrics["MAPE"], metrics["RMSE"]]).all():
+        raise RuntimeError(f"non-finite forecast metrics: {metrics}")
+
+
+@case("forecast.snapshot", max_bars=5_000)
+def bench_forecast_snapshot(df, ticker):
+    """HybridForecaster on a snapshot of store-typed data (seconds dates, float32)"""
+    from core.forecast import HybridForecaster
+    from core.snapshot import MarketSnapshot
+    from core.store_schema import normalize_frame
+
+    snapshot = MarketSnapshot.from_frame(ticker, normalize_frame(df, ticker))
+    forecast, metrics = HybridForecaster(snapshot, periods=30).run()
+    _check_forecast(forecast, metrics)
+    return {"mape": metrics["MAPE"]}
+
+
+@case("forecast.store", max_bars=5_000)
+def bench_forecast_store(df, ticker):
+    """HybridForecaster on history read back from the store, as the CLI and app do"""
+    from core import parquet_store
+    from core.forecast import HybridForecaster
+    from core.history_cache import get_history
+
+    if not parquet_store.exists(ticker):
+        parquet_store.save(ticker, df)
+    forecast, metrics = HybridForecaster(get_history(ticker), periods=30).run()
+    _check_forecast(forecast, metrics)
+    return {"mape": metrics["MAPE"]}
+
+
+def _bench_export(df, ticker, fmt):
+    from workers.export_worker import ExportWorker
+
+    worker = ExportWorker(df, ticker, fmt)
+    paths, errors = [], []
+    worker.finished.connect(lambda path, _: paths.append(path))
+    worker.error.connect(errors.append)
+    worker.run()
+    if errors:
+        raise RuntimeError(errors[0])
+    extra = {"mb": round(os.path.getsize(paths[0]) / 1e6, 3)}
+    if "chart_cached" in worker.summary:
+        # Repeats reuse the chart raster cached by the warm-up run
+        extra["chart_cached"] = worker.summary["chart_cached"]
+    return extra
+
+
+@case("export.csv")
+def bench_export_csv(df, ticker):
+    return _bench_export(df, ticker, "csv")
+
+
+@case("export.parquet")
+def bench_export_parquet(df, ticker):
+    return _bench_export(df, ticker, "parquet")
+
+
+@case("export.pdf", max_bars=100_000)
+def bench_export_pdf(df, ticker):
+    return _bench_export(df, ticker, "pdf")
+
+
+class _NullWriter:
+    """Write-behind stand-in: the case times the tick handler, not the disk"""
+
+    def submit(self, key, job):
+        pass
+
+
+@case("live.tick_handler")
+def bench_tick_handler(df, ticker):
+    """LivePriceWorker._message_handler once per bar's close, as live ticks"""
+    from core.tick_channel import TickChannel
+    from workers.live_price_worker import LivePriceWorker
+
+    worker = LivePriceWorker(ticker, feed=None, channel=TickChannel(), writer=_NullWriter())
+    closes = df["Close"].to_numpy()
+    stamps = df["Date"].to_numpy(dtype="datetime64[ms]").astype("int64")
+    volume = np.cumsum(df["Volume"].to_numpy())
+    t0 = time.perf_counter()
+    for price, ts, vol in zip(closes.tolist(), stamps.tolist(), volume.tolist()):
+        worker._message_handler({"id": ticker, "price": price, "time": ts, "day_volume": vol})
+    per_tick = (time.perf_counter() - t0) / max(1, len(closes))
+    return {"us_per_tick": round(per_tick * 1e6, 3)}
+
+
+# ---------------- Runner ---------------- #
+def _inputs(sizes, use_samples):
+    """(label, ticker, frame) for every synthetic size and bundled sample"""
+    # One ticker per size so store-backed cases never see another size's data
+    inputs = [(f"synthetic-{n}", f"SYN{n}", synthetic_ohlcv(n)) for n in sizes]
+    if use_samples:
+        inputs += [(f"sample-{t}", t, sample_ohlcv(t)) for t in sample_tickers()]
+    return inputs
+
+
+def run_case(fn, df, ticker, repeat):
+    samples, extra = [], {}
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        extra = fn(df, ticker) or {}
+        samples.append((time.perf_counter() - t0) * 1000)
+    samples.sort()
+    return {
+        "bars": len(df), "runs": repeat,
+        "median_ms": round(samples[len(samples) // 2], 3),
+        "min_ms": round(samples[0], 3), "max_ms": round(samples[-1], 3),
+        **extra,
+    }
+
+
+def _meta():
+    try:
+        rev = subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, stderr=subprocess.DEVNULL
+        ).decode().strip()
+    except Exception:
+        rev = None
+    return {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"), "git": rev,
+        "python": platform.python_version(), "platform": platform.platform(),
+        "cpus": os.cpu_count(), "numpy": np.__version__, "pandas": pd.__version__,
+    }
+
+
+def run(sizes, cases, repeat, use_samples):
+    from PyQt5.QtCore import QCoreApplication
+    from core.providers import LocalProvider, set_provider
+    # Worker objects and their signals want an application instance
+    _ = QCoreApplication.instance() or QCoreApplication(sys.argv[:1])
+    previous = set_provider(LocalProvider(synthetic=False))
+
+    inputs = _inputs(sizes, use_samples)
+    results = {}
+    workdir = tempfile.mkdtemp(prefix="stockdash-bench-")
+    cwd = os.getcwd()
+    os.chdir(workdir)  # the store, history cache and reports are relative paths
+    try:
+        os.makedirs("csv_data_files", exist_ok=True)
+        for name in cases:
+            fn, max_bars = CASES[name]
+            for label, ticker, df in inputs:
+                key = f"{name}/{label}"
+                if max_bars is not None and len(df) > max_bars:
+                    continue
+                try:
+                    fn(df, ticker)  # warm-up: imports, caches, first-call costs
+                    results[key] = run_case(fn, df, ticker, repeat)
+                except ImportError as e:
+                    results[key] = {"skipped": f"missing dependency: {e.name}"}
+                except Exception as e:
+                    results[key] = {"error": str(e)}
+                row = results[key]
+                if "median_ms" in row:
+                    print(f"⏱️ {key:<52}{row['median_ms']:>12.2f} ms")
+                else:
+                    print(f"⚠️ {key:<52}{row.get('skipped') or row.get('error')}")
+    finally:
+        set_provider(previous)
+        os.chdir(cwd)
+        shutil.rmtree(workdir, ignore_errors=True)
+    return {
+        "meta": _meta(), "cases": list(cases),
+        "inputs": [label for label, _, _ in inputs], "results": results,
+    }
+
+
+def compare(report, baseline, threshold):
+    """Per-case ratio to the baseline median; returns the regressed keys.
+
+    A case the baseline timed that now errors, or that this run should have
+    covered but did not produce, is a regression too.
+    """
+    regressions = []
+    results = report["results"]
+    print(f"\n{'case':<52}{'baseline':>12}{'now':>12}{'change':>10}")
+    for key, base in baseline.get("results", {}).items():
+        name, _, label = key.partition("/")
+        if "median_ms" not in base or name not in report["cases"] or label not in report["inputs"]:
+            continue
+        row = results.get(key)
+        if row is None or "error" in row:
+            regressions.append(key)
+            reason = "missing" if row is None else f"error: {row['error']}"
+            print(f"{key:<52}{base['median_ms']:>10.2f}ms{'':>12} ⚠️ {reason}")
+    for key, row in results.items():
+        base = baseline.get("results", {}).get(key, {})
+        if "median_ms" not in row or "median_ms" not in base:
+            continue
+        now, before = row["median_ms"], base["median_ms"]
+        change = now / before - 1 if before else 0.0
+        row["baseline_ms"] = before
+        row["change"] = round(change, 4)
+        flag = ""
+        if change > threshold and now - before > NOISE_FLOOR_MS:
+            regressions.append(key)
+            flag = " ⚠️ regression"
+        elif change < -threshold and before - now > NOISE_FLOOR_MS:
+            flag = " ✅ faster"
+        print(f"{key:<52}{before:>10.2f}ms{now:>10.2f}ms{change:>+9.1%}{flag}")
+    report["regressions"] = regressions
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(SIZES))
+    parser.add_argument("--cases", nargs="+", default=None,
+                        help="case names or prefixes (e.g. chart export); default all")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--no-samples", action="store_true", help="skip csv_data_files fixtures")
+    parser.add_argument("--out", default=None, help="result JSON (default: benchmarks/results/)")
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    parser.add_argument("--save-baseline", action="store_true", help="store this run as the baseline")
+    parser.add_argument("--threshold", type=float, default=0.2, help="allowed slowdown (0.2 = 20%%)")
+    args = parser.parse_args(argv)
+
+    cases = [
+        name for name in CASES
+        if not args.cases or any(name == c or name.startswith(f"{c}.") for c in args.cases)
+    ]
+    if not cases:
+        parser.error(f"no such case; choose from {', '.join(CASES)}")
+
+    report = run(args.sizes, cases, max(1, args.repeat), not args.no_samples)
+
+    errors = [key for key, row in report["results"].items() if "error" in row]
+    regressions = []
+    if os.path.exists(args.baseline) and not args.save_baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            regressions = compare(report, json.load(f), args.threshold)
+        print(f"\n{'⚠️' if regressions else '✅'} {len(regressions)} regression(s) "
+              f"beyond {args.threshold:.0%} against {os.path.relpath(args.baseline, ROOT)}")
+
+    out = args.out or os.path.join(RESULTS_FOLDER, f"bench-{time.strftime('%Y%m%d-%H%M%S')}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(out)), exist_ok=True)
+    with open(out, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"💾 Results written to {out}")
+    if args.save_baseline:
+        shutil.copyfile(out, args.baseline)
+        print(f"📌 Baseline updated: {args.baseline}")
+    if errors:
+        print(f"❌ {len(errors)} case(s) failed: {', '.join(errors)}")
+    return 1 if regressions or errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,85 @@
+# benchmarks/bench_theme_switch.py
+"""
+Theme switch latency harness.
+
+Builds the dashboard offscreen, renders a chart from synthetic OHLCV data,
+then times `toggle_theme()` plus the event-loop pass that re-polishes and
+repaints. The chart is re-plotted once per theme; every later switch should
+re-embed the figure kept in the chart cache, and the re-plot count shows it.
+
+Usage:
+    python benchmarks/bench_theme_switch.py [--switches 40] [--bars 500] [--all-pages]
+"""
+import argparse
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+os.environ.setdefault("STOCKDASH_PROVIDER", "local")  # no network in the timings
+sys.path.insert(0, ROOT)
+
+from core.providers import synthetic_ohlcv
+
+
+def wait_for(app, predicate, timeout=30.0):
+    deadline = time.perf_counter() + timeout
+    while not predicate():
+        if time.perf_counter() > deadline:
+            raise TimeoutError("chart did not render in time")
+        app.processEvents()
+        time.sleep(0.01)
+
+
+def main(switches, bars, all_pages):
+    from PyQt5.QtWidgets import QApplication
+    app = QApplication(sys.argv[:1])
+
+    os.chdir(ROOT)
+    from main import StockDashboard
+
+    window = StockDashboard(prebuild_pages=False)
+    if all_pages:
+        for name in list(window._page_factories):
+            window._ensure_page(name)
+    window.show()
+    app.processEvents()
+
+    from core.snapshot import MarketSnapshot
+
+    chart = window.chart_widget
+    # A snapshot like a dashboard load, so the chart cache keeps both themes
+    snapshot = MarketSnapshot.from_frame("BENCH", synthetic_ohlcv(bars))
+    chart.plot_chart(snapshot, "BENCH", show_sma=True, show_rsi=True, show_macd=True)
+    wait_for(app, lambda: chart.fig is not None and chart.worker is None)
+
+    samples = []
+    replots = 0
+    for _ in range(switches):
+        t0 = time.perf_counter()
+        window.toggle_theme()
+        app.processEvents()
+        samples.append((time.perf_counter() - t0) * 1000)
+        if chart.worker is not None or chart._plot_timer.isActive():
+            replots += 1
+            # Let the re-plot land so the next switch can reuse it
+            wait_for(app, lambda: chart.fig is not None and chart.worker is None)
+
+    samples.sort()
+    p50 = samples[len(samples) // 2]
+    p95 = samples[min(len(samples) - 1, int(len(samples) * 0.95))]
+    print(f"🎨 Theme switches: {switches} (pages: {'all' if all_pages else 'dashboard'})")
+    print(f"   p50 {p50:.2f} ms | p95 {p95:.2f} ms | max {samples[-1]:.2f} ms")
+    print(f"   chart re-plots triggered: {replots}")
+    window.close()
+    return {"p50_ms": p50, "p95_ms": p95, "max_ms": samples[-1], "replots": replots}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--switches", type=int, default=40)
+    parser.add_argument("--bars", type=int, default=500)
+    parser.add_argument("--all-pages", action="store_true")
+    args = parser.parse_args()
+    main(args.switches, args.bars, args.all_pages)
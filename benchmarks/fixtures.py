@@ -0,0 +1,34 @@
+# benchmarks/fixtures.py
+"""
+Shared inputs for the benchmarks: the sample histories in
+`csv_data_files/*.parquet`. Synthetic OHLCV of any length comes from
+`core.providers.synthetic_ohlcv`, the generator the local data provider uses.
+"""
+import glob
+import os
+
+import pandas as pd
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SAMPLE_FOLDER = os.path.join(ROOT, "csv_data_files")
+
+
+def sample_tickers(folder=SAMPLE_FOLDER):
+    return sorted(
+        os.path.basename(path)[:-len(".parquet")]
+        for path in glob.glob(os.path.join(folder, "*.parquet"))
+    )
+
+
+def sample_ohlcv(ticker, folder=SAMPLE_FOLDER):
+    """A bundled sample history as a plain OHLCV frame (Date as a column)"""
+    import pyarrow.parquet as pq
+
+    df = pq.read_table(os.path.join(folder, f"{ticker}.parquet")).to_pandas()
+    if "Date" not in df.columns:
+        df = df.reset_index()
+    df = df[["Date", "Open", "High", "Low", "Close", "Volume"]]
+    df["Date"] = pd.to_datetime(df["Date"])
+    for col in ("Open", "High", "Low", "Close", "Volume"):
+        df[col] = df[col].astype("float64")
+    return df.dropna(subset=["Close"]).sort_values("Date").reset_index(drop=True)
@@ -0,0 +1,218 @@
+# cli.py
+"""
+Headless StockDash: refresh, indicators, forecast and export without the GUI.
+
+Drives the same core modules as the dashboard (data_handler, indicators,
+levels, forecast, exporter, pdf_report) and never imports a widget, so it
+runs under cron, in CI, with QT_QPA_PLATFORM=offscreen or without PyQt5
+installed at all.
+
+Progress goes to stderr; stdout gets one JSON summary with per-stage and
+per-ticker timings (or use --summary FILE).
+
+Usage:
+    python cli.py refresh AAPL MSFT --jobs 8
+    python cli.py indicators --all
+    python cli.py forecast AAPL --periods 30 --procs 4
+    python cli.py export --all --format parquet --jobs 4
+    python cli.py nightly --all --jobs 8 --procs 4 --format pdf
+    python cli.py refresh AAPL --offline
+"""
+import argparse
+import contextlib
+import json
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+# Nothing here needs a display; keep anything that pulls in Qt or pyplot headless
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+os.environ.setdefault("MPLBACKEND", "Agg")
+
+import numpy as np
+
+from core import parquet_store
+from core.process_pool import process_pool
+from core.store_schema import to_frame
+
+STAGES = ("refresh", "indicators", "forecast", "export")
+
+
+# ---------------- Per-ticker jobs ---------------- #
+def refresh_one(ticker):
+    from core.data_handler import get_stock_data
+    df = get_stock_data(ticker)
+    if df is None:
+        raise RuntimeError("no data returned")
+    return {"rows": len(df), "version": parquet_store.store_version(ticker)}
+
+
+def _load(ticker):
+    table, version = parquet_store.read_table(ticker)
+    return to_frame(table), version
+
+
+def _last(series):
+    value = series.iloc[-1] if len(series) else np.nan
+    return None if np.isnan(value) else round(float(value), 4)
+
+
+def indicators_one(ticker):
+    from core.indicators import calculate_bollinger, calculate_macd, calculate_rsi
+    from core.levels import LevelTracker
+
+    df, version = _load(ticker)
+    close = df["Close"].astype("float64")
+    macd, signal, hist = calculate_macd(close)
+    bb_upper, bb_lower = calculate_bollinger(close)
+    levels = LevelTracker().update(df)
+    return {
+        "version": version,
+        "close": _last(close),
+        "sma_20": _last(close.rolling(20).mean()),
+        "ema_20": _last(close.ewm(span=20, adjust=False).mean()),
+        "rsi_14": _last(calculate_rsi(close)),
+        "macd": _last(macd), "macd_signal": _last(signal), "macd_hist": _last(hist),
+        "bb_upper": _last(bb_upper), "bb_lower": _last(bb_lower),
+        "levels": [{"price": round(l.price, 4), "kind": l.kind, "touches": l.touches} for l in levels],
+    }
+
+
+def forecast_one(ticker, periods=30):
+    # Runs in a worker process; prophet/xgboost are imported there
+    from core.forecast import HybridForecaster
+
+    df, version = _load(ticker)
+    forecast, metrics = HybridForecaster(df, periods).run()
+    future = forecast.tail(periods)
+    return {
+        "version": version,
+        "metrics": metrics,
+        "forecast": {
+            "dates": [d.strftime("%Y-%m-%d") for d in future.index],
+            "values": [round(float(v), 4) for v in future["Forecast"]],
+        },
+    }
+
+
+def _timed(fn, *args):
+    t0 = time.perf_counter()
+    # Also applies inside worker processes, which inherit the real stdout
+    with contextlib.redirect_stdout(sys.stderr):
+        result = fn(*args)
+    result["ms"] = round((time.perf_counter() - t0) * 1000, 1)
+    return result
+
+
+# ---------------- Stages ---------------- #
+def run_pool(stage, fn, tickers, workers, processes=False, extra=()):
+    """Run `fn(ticker, *extra)` per ticker in a pool; returns the stage summary"""
+    t0 = time.perf_counter()
+    results = {}
+    workers = max(1, min(workers, len(tickers) or 1))
+    if processes:
+        pool = process_pool(workers)
+    else:
+        pool = ThreadPoolExecutor(workers, thread_name_prefix=stage)
+    with pool:
+        futures = {pool.submit(_timed, fn, ticker, *extra): ticker for ticker in tickers}
+        for future in as_completed(futures):
+            ticker = futures[future]
+            try:
+                results[ticker] = future.result()
+                print(f"✅ {stage} {ticker} ({results[ticker]['ms']:.0f} ms)", file=sys.stderr)
+            except Exception as e:
+                results[ticker] = {"error": str(e)}
+                print(f"⚠️ {stage} {ticker}: {e}", file=sys.stderr)
+
+    failed = sum("error" in r for r in results.values())
+    return {
+        "seconds": round(time.perf_counter() - t0, 3),
+        "workers": workers, "mode": "processes" if processes else "threads",
+        "ok": len(results) - failed, "failed": failed,
+        "tickers": dict(sorted(results.items())),
+    }
+
+
+def run_export(tickers, fmt, jobs, procs):
+    t0 = time.perf_counter()
+    if fmt == "pdf":
+        from core.pdf_report import build_reports
+        summary = build_reports(tickers, procs)
+        results = {r["ticker"]: r for r in summary["results"]}
+        mode, workers = "processes", procs
+    else:
+        from core.exporter import export_many
+        summary = export_many(tickers, fmt, max_workers=jobs)
+        results = {r["ticker"]: r for r in summary["results"]}
+        mode, workers = "threads", jobs
+    return {
+        "seconds": round(time.perf_counter() - t0, 3),
+        "workers": workers, "mode": mode, "format": fmt,
+        "ok": summary["exported"], "failed": summary["failed"],
+        "tickers": dict(sorted(results.items())),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("command", choices=STAGES + ("nightly",))
+    parser.add_argument("tickers", nargs="*", help="ticker symbols")
+    parser.add_argument("--all", action="store_true", help="every ticker in the local store")
+    parser.add_argument("--jobs", type=int, default=4, help="threads for I/O-bound stages")
+    parser.add_argument("--procs", type=int, default=os.cpu_count() or 1,
+                        help="processes for forecasts and PDF reports")
+    parser.add_argument("--periods", type=int, default=30, help="forecast horizon in days")
+    parser.add_argument("--format", default="csv", choices=("csv", "parquet", "arrow", "pdf"))
+    parser.add_argument("--summary", default="-", help="where to write the JSON summary (- = stdout)")
+    parser.add_argument("--offline", action="store_true",
+                        help="serve data from local files only (STOCKDASH_PROVIDER=local)")
+    args = parser.parse_args(argv)
+    if args.offline:
+        # Through the environment so pool processes pick the same provider
+        os.environ["STOCKDASH_PROVIDER"] = "local"
+
+    tickers = [t.upper().strip() for t in args.tickers]
+    if args.all:
+        tickers = sorted(set(tickers) | set(parquet_store.tickers()))
+    if not tickers:
+        parser.error("give ticker symbols or --all")
+
+    stages = STAGES if args.command == "nightly" else (args.command,)
+    summary = {"command": args.command, "tickers": tickers, "stages": {}}
+    t0 = time.perf_counter()
+
+    # Library code prints progress to stdout; keep stdout for the JSON
+    with contextlib.redirect_stdout(sys.stderr):
+        for stage in stages:
+            if stage == "refresh":
+                result = run_pool(stage, refresh_one, tickers, args.jobs)
+            elif stage == "indicators":
+                result = run_pool(stage, indicators_one, tickers, args.jobs)
+            elif stage == "forecast":
+                result = run_pool(stage, forecast_one, tickers, args.procs,
+                                  processes=True, extra=(args.periods,))
+            else:
+                result = run_export(tickers, args.format, args.jobs, args.procs)
+            summary["stages"][stage] = result
+            print(f"⏱️ {stage}: {result['ok']} ok, {result['failed']} failed "
+                  f"in {result['seconds']:.2f}s")
+
+    summary["seconds"] = round(time.perf_counter() - t0, 3)
+    summary["failed"] = sum(s["failed"] for s in summary["stages"].values())
+    text = json.dumps(summary, indent=2, default=str)
+    if args.summary == "-":
+        print(text)
+    else:
+        with open(args.summary, "w", encoding="utf-8") as f:
+            f.write(text)
+    return 1 if summary["failed"] else 0
+
+
+if __name__ == "__main__":
+    multiprocessing.freeze_support()
+    sys.exit(main())
@@ -0,0 +1,133 @@
+# core/bar_builder.py
+"""
+Incremental OHLCV bars from live ticks.
+
+`BarBuilder.on_tick()` folds each tick into the open bar of every timeframe
+in O(timeframes). When a tick lands in a new bucket, the finished bar moves
+to an in-memory history (for the chart) and a pending list (for the next
+batched flush to the store). Volume comes from the cumulative `day_volume`
+field of the feed, as a delta against the previous tick.
+
+Buckets are aligned to the exchange's wall-clock time (`tz`, New York by
+default), not the viewer's: a "1d" bar is one trading session wherever the
+app runs, and its date matches the exchange dates already used for daily
+rows in the parquet store.
+"""
+import threading
+from collections import deque
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+import numpy as np
+import pandas as pd
+
+from core.store_schema import OHLCV_COLUMNS
+
+EXCHANGE_TZ = "America/New_York"
+TIMEFRAMES = {"1m": 60, "5m": 300, "15m": 900, "1h": 3600, "1d": 86400}
+INTRADAY_TIMEFRAMES = ("1m", "5m", "15m", "1h")
+
+# Bar layout: [start (exchange-local epoch seconds), open, high, low, close, volume]
+_START, _OPEN, _HIGH, _LOW, _CLOSE, _VOLUME = range(6)
+
+
+def _local_seconds(ts, tz):
+    """UTC epoch seconds -> the same instant as wall-clock seconds in `tz`"""
+    return ts + datetime.fromtimestamp(ts, tz).utcoffset().total_seconds()
+
+
+def bars_to_frame(bars):
+    """List of bar lists -> DataFrame with the store's OHLCV columns"""
+    if not bars:
+        return pd.DataFrame(columns=OHLCV_COLUMNS)
+    arr = np.asarray(bars, dtype="float64")
+    return pd.DataFrame({
+        "Date": arr[:, _START].astype("int64").astype("datetime64[s]"),
+        "Open": arr[:, _OPEN], "High": arr[:, _HIGH], "Low": arr[:, _LOW],
+        "Close": arr[:, _CLOSE], "Volume": arr[:, _VOLUME],
+    })
+
+
+class BarBuilder:
+    def __init__(self, ticker, timeframes=tuple(TIMEFRAMES), history=2000, tz=EXCHANGE_TZ):
+        self.ticker = ticker.upper().strip()
+        self.tz = ZoneInfo(tz) if isinstance(tz, str) else tz
+        self.timeframes = tuple(timeframes)
+        self._current = {tf: None for tf in self.timeframes}
+        self._history = {tf: deque(maxlen=history) for tf in self.timeframes}
+        self._pending = {tf: [] for tf in self.timeframes}
+        self._last_day_volume = None
+        self._day = None
+        self.day_volume = None
+        self.last_volume = 0.0  # volume delta of the most recent tick
+        self.ticks = 0
+        self._lock = threading.Lock()
+
+    def on_tick(self, ts, price, day_volume=None):
+        """Fold one tick in. Returns the timeframes whose bar just closed."""
+        local = _local_seconds(ts, self.tz)
+        day = int(local // 86400)
+        volume = 0.0
+        with self._lock:
+            self.ticks += 1
+            if day != self._day:
+                self._day = day
+                self._last_day_volume = None
+            if day_volume is not None:
+                day_volume = float(day_volume)
+                if self._last_day_volume is not None and day_volume >= self._last_day_volume:
+                    volume = day_volume - self._last_day_volume
+                self._last_day_volume = day_volume
+                self.day_volume = day_volume
+            self.last_volume = volume
+
+            closed = []
+            for tf in self.timeframes:
+                secs = TIMEFRAMES[tf]
+                start = local - local % secs
+                bar = self._current[tf]
+                if bar is not None and bar[_START] == start:
+                    if price > bar[_HIGH]:
+                        bar[_HIGH] = price
+                    if price < bar[_LOW]:
+                        bar[_LOW] = price
+                    bar[_CLOSE] = price
+                    bar[_VOLUME] += volume
+                    continue
+                if bar is not None:
+                    self._history[tf].append(bar)
+                    self._pending[tf].append(bar)
+                    closed.append(tf)
+                self._current[tf] = [start, price, price, price, price, volume]
+            return closed
+
+    def current(self, tf):
+        with self._lock:
+            bar = self._current.get(tf)
+            return list(bar) if bar is not None else None
+
+    def frame(self, tf):
+        """Completed bars kept in memory plus the open one"""
+        with self._lock:
+            bars = [list(b) for b in self._history[tf]]
+            if self._current[tf] is not None:
+                bars.append(list(self._current[tf]))
+        return bars_to_frame(bars)
+
+    def drain(self, timeframes=None):
+        """Take the completed bars not yet flushed: {timeframe: DataFrame}.
+
+        Only `timeframes` are taken when given; the rest stay pending.
+        """
+        with self._lock:
+            pending = {
+                tf: bars for tf, bars in self._pending.items()
+                if bars and (timeframes is None or tf in timeframes)
+            }
+            for tf in pending:
+                self._pending[tf] = []
+        return {tf: bars_to_frame(bars) for tf, bars in pending.items()}
+
+    def has_pending(self):
+        with self._lock:
+            return any(self._pending.values())
@@ -0,0 +1,175 @@
+# core/chart_cache.py
+"""
+Rendered chart states kept for instant ticker switching.
+
+When the chart moves on to another ticker, the outgoing state is parked
+here instead of being closed: the live matplotlib `Figure` plus a raster of
+what was on screen. Coming back to the same (ticker, data, options, theme)
+re-embeds the kept Figure with no rendering at all; if only the raster is
+left it is shown at once while the Figure is rebuilt in the background.
+The raster only counts when the widget is still the size it was grabbed
+at.
+
+Entries are keyed on a content hash of the whole OHLCV history rather than
+the snapshot version: every load makes a new snapshot, but a refetch that
+changed nothing should still hit, and one that adjusted any bar must miss.
+
+Memory is budgeted per entry (estimated Figure bytes + raster bytes) with
+LRU eviction: past `max_figures` the oldest entries give up their Figure
+and keep the raster; past `max_bytes` the oldest entries go entirely.
+`release` is called with every Figure the cache lets go of (the widget
+passes `plt.close`). The cache itself never touches Qt.
+"""
+import hashlib
+import threading
+from collections import OrderedDict
+
+MAX_BYTES = 160 * 1024 * 1024
+MAX_FIGURES = 4
+
+# Rough per-object costs for the Figure estimate
+_BYTES_PER_POINT = 16
+_BYTES_PER_AXES = 64 * 1024
+
+
+def _fingerprint(snapshot):
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(snapshot.index.asi8.tobytes())
+    for name in ("Open", "High", "Low", "Close", "Volume"):
+        digest.update(snapshot[name].tobytes())
+    return digest.hexdigest()
+
+
+def data_fingerprint(snapshot):
+    """Content key for the chart's input: a hash of the dates and every OHLCV bar.
+
+    Hashing whole buffers is cheap next to a render and catches refetches that
+    rewrite older bars (split/dividend adjustments) at the same length.
+    Computed once per snapshot.
+    """
+    return snapshot.derive("chart_fingerprint", _fingerprint)
+
+
+def figure_bytes(fig):
+    """Estimated memory held by a rendered Figure: Agg buffer plus artist data"""
+    width, height = fig.bbox.width, fig.bbox.height
+    points = 0
+    for ax in fig.axes:
+        for line in ax.lines:
+            points += len(line.get_xydata())
+        for collection in ax.collections:
+            points += sum(len(path.vertices) for path in collection.get_paths())
+            points += len(collection.get_offsets())
+        points += 5 * len(ax.patches)
+    return int(width * height * 4 + points * _BYTES_PER_POINT + len(fig.axes) * _BYTES_PER_AXES)
+
+
+class ChartState:
+    __slots__ = ("figure", "raster", "size", "figure_bytes", "raster_bytes")
+
+    def __init__(self, figure, raster, size, figure_bytes, raster_bytes):
+        self.figure = figure
+        self.raster = raster
+        self.size = size
+        self.figure_bytes = figure_bytes if figure is not None else 0
+        self.raster_bytes = raster_bytes if raster is not None else 0
+
+    @property
+    def nbytes(self):
+        return self.figure_bytes + self.raster_bytes
+
+
+class ChartStateCache:
+    """Memory-budgeted LRU of rendered chart states"""
+
+    def __init__(self, max_bytes=MAX_BYTES, max_figures=MAX_FIGURES, release=lambda fig: None):
+        self.max_bytes = max_bytes
+        self.max_figures = max_figures
+        self.release = release
+        self._entries = OrderedDict()  # key -> ChartState
+        self._lock = threading.Lock()
+        self.stats = {
+            "figure_hits": 0, "raster_hits": 0, "misses": 0,
+            "stored": 0, "demoted": 0, "evicted": 0,
+        }
+
+    def put(self, key, figure=None, raster=None, size=None, figure_bytes=0, raster_bytes=0):
+        released = []
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None and old.figure is not None and old.figure is not figure:
+                released.append(old.figure)
+            self._entries[key] = ChartState(figure, raster, size, figure_bytes, raster_bytes)
+            self.stats["stored"] += 1
+            released += self._evict()
+        for fig in released:
+            self.release(fig)
+
+    def take(self, key, size=None):
+        """(figure, raster) for `key`; either may be None.
+
+        A Figure is handed over (the caller embeds it, so it leaves the
+        cache); the raster stays for next time and is only returned when
+        `size` matches the size it was grabbed at.
+        """
+        with self._lock:
+            state = self._entries.get(key)
+            if state is None:
+                self.stats["misses"] += 1
+                return None, None
+            self._entries.move_to_end(key)
+            figure, state.figure, state.figure_bytes = state.figure, None, 0
+            raster = state.raster if state.size == size else None
+            if figure is not None:
+                self.stats["figure_hits"] += 1
+            elif raster is not None:
+                self.stats["raster_hits"] += 1
+            else:
+                self.stats["misses"] += 1
+            return figure, raster
+
+    def _evict(self):
+        """Apply both budgets, oldest first; returns the Figures let go"""
+        released = []
+        figures = sum(state.figure is not None for state in self._entries.values())
+        for state in self._entries.values():
+            if figures <= self.max_figures:
+                break
+            if state.figure is not None:
+                released.append(state.figure)
+                state.figure, state.figure_bytes = None, 0
+                figures -= 1
+                self.stats["demoted"] += 1
+
+        total = sum(state.nbytes for state in self._entries.values())
+        while total > self.max_bytes and len(self._entries) > 1:
+            _, state = self._entries.popitem(last=False)
+            total -= state.nbytes
+            if state.figure is not None:
+                released.append(state.figure)
+            self.stats["evicted"] += 1
+        return released
+
+    def nbytes(self):
+        with self._lock:
+            return sum(state.nbytes for state in self._entries.values())
+
+    def summary(self):
+        with self._lock:
+            entries = list(self._entries.values())
+        return {
+            **self.stats,
+            "entries": len(entries),
+            "figures": sum(state.figure is not None for state in entries),
+            "mb": round(sum(state.nbytes for state in entries) / 1e6, 1),
+        }
+
+    def clear(self):
+        with self._lock:
+            released = [s.figure for s in self._entries.values() if s.figure is not None]
+            self._entries.clear()
+        for fig in released:
+            self.release(fig)
+
+    def __len__(self):
+        return len(self._entries)
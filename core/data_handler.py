@@ -1,306 +1,120 @@
-# # data_handler.py
-# import os
-# import pandas as pd
-# import yfinance as yf
-# import requests
-# import time
-
-# CSV_FOLDER = "./csv_data_files"
-# os.makedirs(CSV_FOLDER, exist_ok=True)
-
-# news_cache = {}
-
-# def get_stock_data(ticker):
-#     ticker = ticker.upper().strip()
-#     csv_path = os.path.join(CSV_FOLDER, f"{ticker}.csv")
-
-#     # Step 1️⃣: Load existing CSV (if exists)
-#     if os.path.exists(csv_path):
-#         df = pd.read_csv(csv_path, header=0)
-
-#         # Ensure correct columns
-#         if "Date" not in df.columns:
-#             df = pd.read_csv(csv_path, header=[0, 1])
-#             df.columns = [c[0] if "Date" not in c[0] else "Date" for c in df.columns]
-
-#         df["Date"] = pd.to_datetime(df["Date"], errors="coerce")
-#         df.dropna(subset=["Date"], inplace=True)
-#     else:
-#         df = pd.DataFrame(columns=["Date", "Open", "High", "Low", "Close", "Volume"])
-
-#     # Step 2️⃣: Fetch last 6 months from Yahoo
-#     try:
-#         new_df = yf.download(ticker, period="6mo", group_by="ticker", progress=False)
-#         if new_df.empty:
-#             return None
-
-#         # Flatten if MultiIndex
-#         if isinstance(new_df.columns, pd.MultiIndex):
-#             new_df.columns = [col[1] for col in new_df.columns]
-
-#         new_df.reset_index(inplace=True)
-#         new_df["Date"] = pd.to_datetime(new_df["Date"], errors="coerce")
-
-#         # Keep only required columns
-#         new_df = new_df[["Date", "Open", "High", "Low", "Close", "Volume"]]
-
-#         # Step 3️⃣: Merge (avoid duplicates)
-#         if not df.empty:
-#             merged_df = pd.concat([df, new_df]).drop_duplicates(subset=["Date"], keep="last")
-#         else:
-#             merged_df = new_df
-
-#         # Step 4️⃣: Sort and save back
-#         merged_df.sort_values("Date", inplace=True)
-#         merged_df.reset_index(drop=True, inplace=True)
-#         merged_df.to_csv(csv_path, index=False)
-#         df = merged_df
-
-#         print(f"✅ Synced {ticker} (6mo history merged, {len(df)} records)")
-#     except Exception as e:
-#         print(f"⚠️ Error updating history for {ticker}: {e}")
-#         return df if not df.empty else None
-
-#     # Step 5️⃣: Final cleaning
-#     expected_cols = {"Date", "Open", "High", "Low", "Close", "Volume"}
-#     if not expected_cols.issubset(df.columns):
-#         print(f"⚠️ Missing columns for {ticker}: {df.columns}")
-#         return None
-
-#     for col in ["Open", "High", "Low", "Close", "Volume"]:
-#         df[col] = pd.to_numeric(df[col], errors="coerce")
-
-#     df.dropna(subset=["Date", "Close"], inplace=True)
-#     return df
-
-# def get_fundamentals(ticker):
-#     try:
-#         stock = yf.Ticker(ticker)
-#         info = stock.info
-#         return {
-#             "Symbol": info.get("symbol"),
-#             "Name": info.get("longName"),
-#             "Sector": info.get("sector"),
-#             "Market Cap": info.get("marketCap"),
-#             "P/E Ratio": info.get("trailingPE"),
-#             "Dividend Yield": info.get("dividendYield"),
-#             "52 Week High": info.get("fiftyTwoWeekHigh"),
-#             "52 Week Low": info.get("fiftyTwoWeekLow"),
-#         }
-#     except Exception as e:
-#         return {"Error": str(e)}
-
-
-# def get_news(ticker, count=10, tab="news"):
-#     ticker = ticker.upper().strip()
-
-#     if ticker in news_cache and time.time() - news_cache[ticker]["time"] < 300:
-#         return news_cache[ticker]["data"]
-
-#     try:
-#         t = yf.Ticker(ticker)
-#         raw_news = t.get_news(count=count, tab=tab)
-#         news_items = []
-#         for item in raw_news:
-#             content = item.get("content", {})
-#             provider = content.get("provider", {})
-#             canonical_url = content.get("canonicalUrl", {})
-#             thumbnail_data = content.get("thumbnail", {})
-
-#             # Accessing the required fields with safe checks
-#             title = content.get("title", "No Title")
-#             link = canonical_url.get("url", "")
-#             publisher = provider.get("displayName", "Unknown")
-#             summary = content.get("summary", "")
-
-#             # Accessing the thumbnail URL
-#             thumbnail_url = ""
-#             if thumbnail_data:
-#                 resolutions = thumbnail_data.get("resolutions", [])
-#                 if resolutions:
-#                     thumbnail_url = resolutions[0].get("url", "")
-
-#             news_items.append(
-#                 {
-#                     "title": title,
-#                     "link": link,
-#                     "publisher": publisher,
-#                     "summary": summary,
-#                     "thumbnail": thumbnail_url,
-#                 }
-#             )
-
-#         news_cache[ticker] = {"time": time.time(), "data": news_items}
-#         return news_items
-
-#     except Exception as e:
-#         return [
-#             {
-#                 "title": "Error fetching news",
-#                 "link": "",
-#                 "publisher": str(e),
-#                 "summary": "",
-#                 "thumbnail": "",
-#             }
-#         ]
-
-
-# def get_details(ticker):
-#     try:
-#         t = yf.Ticker(ticker)
-#         info = t.info
-
-#         details = f"""
-#     🏢 {info.get('longName', ticker)}
-#     Sector: {info.get('sector', 'N/A')}
-#     Industry: {info.get('industry', 'N/A')}
-#     Country: {info.get('country', 'N/A')}
-
-#     📊 Stock Overview
-#     Current Price: {info.get('currentPrice', 'N/A')}
-#     Market Cap: {info.get('marketCap', 'N/A')}
-#     52 Week High: {info.get('fiftyTwoWeekHigh', 'N/A')}
-#     52 Week Low: {info.get('fiftyTwoWeekLow', 'N/A')}
-#     Volume: {info.get('volume', 'N/A')} / Avg: {info.get('averageVolume', 'N/A')}
-
-#     💰 Valuation
-#     P/E Ratio: {info.get('trailingPE', 'N/A')}
-#     Dividend Yield: {info.get('dividendYield', 'N/A')}
-#     EPS: {info.get('trailingEps', 'N/A')}
-#     """
-#         return details
-#     except Exception as e:
-#         print(f"Error: {e}")
-
 # data_handler.py
 import os
 import pandas as pd
-import yfinance as yf
-import time
 
-CSV_FOLDER = "./csv_data_files"
+from core import parquet_store, perf
+from core.history_cache import get_history, put_history
+from core.info_cache import info_cache
+from core.providers import get_provider
+from core.snapshot import MarketSnapshot
+from core.store_schema import OHLCV_COLUMNS
+
+CSV_FOLDER = parquet_store.STORE_FOLDER
 os.makedirs(CSV_FOLDER, exist_ok=True)
 
-news_cache = {}
+_store_migrated = False
 
+def _load_cached(ticker):
+    # Zero-copy view of the shared Arrow mapping; Date is datetime64[ns],
+    # prices float32, Volume uint64
+    df = get_history(ticker) if parquet_store.exists(ticker) else None
+    return df if df is not None else pd.DataFrame(columns=OHLCV_COLUMNS)
+
+@perf.timed("data.get_stock_data")
 def get_stock_data(ticker):
+    global _store_migrated
     ticker = ticker.upper().strip()
-    parquet_path = os.path.join(CSV_FOLDER, f"{ticker}.parquet")
 
-    # Step 1: Load existing Parquet (if exists)
-    if os.path.exists(parquet_path):
-        df = pd.read_parquet(parquet_path)
-        df["Date"] = pd.to_datetime(df["Date"], errors="coerce")
-        df.dropna(subset=["Date"], inplace=True)
-    else:
-        df = pd.DataFrame(columns=["Date", "Open", "High", "Low", "Close", "Volume"])
+    # One-time rewrite of files saved before the compact schema existed
+    if not _store_migrated:
+        parquet_store.migrate_store()
+        _store_migrated = True
 
-    # Step 2: Fetch last 6 months from Yahoo
+    # Step 1: Fetch last 6 months from the provider (outside the store lock,
+    # so the live-price writers aren't blocked on the network). Offline
+    # providers already hold the full history locally.
+    provider = get_provider()
     try:
-        new_df = yf.download(ticker, period="6mo", group_by="ticker", progress=False)
-        if new_df.empty:
-            return None
-
-        # Flatten if MultiIndex
-        if isinstance(new_df.columns, pd.MultiIndex):
-            new_df.columns = [col[1] for col in new_df.columns]
-
-        new_df.reset_index(inplace=True)
-        new_df["Date"] = pd.to_datetime(new_df["Date"], errors="coerce")
-
-        # Keep only required columns
-        new_df = new_df[["Date", "Open", "High", "Low", "Close", "Volume"]]
-
-        # Step 3: Merge (avoid duplicates)
-        if not df.empty:
-            merged_df = pd.concat([df, new_df]).drop_duplicates(subset=["Date"], keep="last")
-        else:
-            merged_df = new_df
-
-        # Step 4: Sort and save back
-        merged_df.sort_values("Date", inplace=True)
-        merged_df.reset_index(drop=True, inplace=True)
-        
-        # Convert types for Parquet compatibility
-        for col in ["Open", "High", "Low", "Close", "Volume"]:
-            merged_df[col] = pd.to_numeric(merged_df[col], errors="coerce")
-        
-        merged_df.to_parquet(parquet_path, index=False, engine="pyarrow")
-        df = merged_df
-
-        print(f"✅ Synced {ticker} (6mo history merged, {len(df)} records)")
+        with perf.span("data.download", ticker=ticker):
+            new_df = provider.history(ticker, period="6mo" if provider.online else "max")
     except Exception as e:
         print(f"⚠️ Error updating history for {ticker}: {e}")
+        new_df = None
+    if new_df is None or new_df.empty:
+        df = _load_cached(ticker)
         return df if not df.empty else None
 
-    # Step 5: Final cleaning
-    expected_cols = {"Date", "Open", "High", "Low", "Close", "Volume"}
-    if not expected_cols.issubset(df.columns):
-        print(f"⚠️ Missing columns for {ticker}: {df.columns}")
-        return None
+    if not provider.online or new_df.attrs.get("synthetic"):
+        # Served as-is, never saved: synthetic prices must not end up under
+        # real history, and re-saving the store's own file would only bump
+        # its version (invalidating the prefetch and chart caches)
+        df = new_df.copy(deep=False)
+        return df.dropna(subset=["Close"]) if df["Close"].isna().any() else df
+
+    # Steps 2-4 are one read-modify-write cycle under the per-ticker write lock
+    with parquet_store.write_lock(ticker):
+        # Step 2: Load existing history
+        df = _load_cached(ticker)
+
+        try:
+            # Step 3: Merge (avoid duplicates)
+            with perf.span("data.merge", ticker=ticker):
+                if not df.empty:
+                    merged_df = pd.concat([df, new_df]).drop_duplicates(subset=["Date"], keep="last")
+                else:
+                    merged_df = new_df
+
+            # Step 4: Sort, coerce to the compact schema and atomically save back
+            table, version = parquet_store.save(ticker, merged_df)
+
+            print(f"✅ Synced {ticker} (6mo history merged, {table.num_rows} records)")
+        except Exception as e:
+            print(f"⚠️ Error updating history for {ticker}: {e}")
+            return df if not df.empty else None
+
+        # Step 5: Hand out the shared read-only view instead of a private frame
+        df = put_history(ticker, table, version)
+
+    if df["Close"].isna().any():
+        df = df.dropna(subset=["Close"])
+    return df
 
-    for col in ["Open", "High", "Low", "Close", "Volume"]:
-        df[col] = pd.to_numeric(df[col], errors="coerce")
+def _cached(kind, key, fetch):
+    # Local providers answer instantly; only network results are worth caching
+    if not get_provider().online:
+        return fetch()
+    return info_cache.get(kind, key, fetch)
 
-    df.dropna(subset=["Date", "Close"], inplace=True)
-    return df
 
+def _fetch_fundamentals(ticker):
+    info = get_provider().info(ticker)
+    return {
+        "Symbol": info.get("symbol"),
+        "Name": info.get("longName"),
+        "Sector": info.get("sector"),
+        "Market Cap": info.get("marketCap"),
+        "P/E Ratio": info.get("trailingPE"),
+        "Dividend Yield": info.get("dividendYield"),
+        "52 Week High": info.get("fiftyTwoWeekHigh"),
+        "52 Week Low": info.get("fiftyTwoWeekLow"),
+    }
+
+
+@perf.timed("data.get_fundamentals")
 def get_fundamentals(ticker):
+    ticker = ticker.upper().strip()
     try:
-        stock = yf.Ticker(ticker)
-        info = stock.info
-        return {
-            "Symbol": info.get("symbol"),
-            "Name": info.get("longName"),
-            "Sector": info.get("sector"),
-            "Market Cap": info.get("marketCap"),
-            "P/E Ratio": info.get("trailingPE"),
-            "Dividend Yield": info.get("dividendYield"),
-            "52 Week High": info.get("fiftyTwoWeekHigh"),
-            "52 Week Low": info.get("fiftyTwoWeekLow"),
-        }
+        return _cached("fundamentals", ticker, lambda: _fetch_fundamentals(ticker))
     except Exception as e:
         return {"Error": str(e)}
 
 
+@perf.timed("data.get_news")
 def get_news(ticker, count=10, tab="news"):
     ticker = ticker.upper().strip()
-
-    if ticker in news_cache and time.time() - news_cache[ticker]["time"] < 300:
-        return news_cache[ticker]["data"]
-
     try:
-        t = yf.Ticker(ticker)
-        raw_news = t.get_news(count=count, tab=tab)
-        news_items = []
-        for item in raw_news:
-            content = item.get("content", {})
-            provider = content.get("provider", {})
-            canonical_url = content.get("canonicalUrl", {})
-            thumbnail_data = content.get("thumbnail", {})
-
-            title = content.get("title", "No Title")
-            link = canonical_url.get("url", "")
-            publisher = provider.get("displayName", "Unknown")
-            summary = content.get("summary", "")
-
-            thumbnail_url = ""
-            if thumbnail_data:
-                resolutions = thumbnail_data.get("resolutions", [])
-                if resolutions:
-                    thumbnail_url = resolutions[0].get("url", "")
-
-            news_items.append({
-                "title": title,
-                "link": link,
-                "publisher": publisher,
-                "summary": summary,
-                "thumbnail": thumbnail_url,
-            })
-
-        news_cache[ticker] = {"time": time.time(), "data": news_items}
-        return news_items
-
+        return _cached("news", f"{ticker}:{tab}:{count}",
+                       lambda: get_provider().news(ticker, count=count, tab=tab))
     except Exception as e:
         return [{
             "title": "Error fetching news",
@@ -311,12 +125,9 @@ def get_news(ticker, count=10, tab="news"):
         }]
 
 
-def get_details(ticker):
-    try:
-        t = yf.Ticker(ticker)
-        info = t.info
-
-        details = f"""
+def _fetch_details(ticker):
+    info = get_provider().info(ticker)
+    details = f"""
     🏢 {info.get('longName', ticker)}
     Sector: {info.get('sector', 'N/A')}
     Industry: {info.get('industry', 'N/A')}
@@ -334,6 +145,42 @@ def get_details(ticker):
     Dividend Yield: {info.get('dividendYield', 'N/A')}
     EPS: {info.get('trailingEps', 'N/A')}
     """
-        return details
+    return details
+
+
+@perf.timed("data.get_details")
+def get_details(ticker):
+    ticker = ticker.upper().strip()
+    try:
+        return _cached("details", ticker, lambda: _fetch_details(ticker))
     except Exception as e:
-        print(f"Error: {e}")
\ No newline at end of file
+        print(f"Error: {e}")
+
+
+def load_market_data(ticker, cancelled=lambda: False):
+    """Everything a dashboard load needs: (snapshot, fundamentals, details, news).
+
+    Returns None when there is no history or `cancelled()` turned True
+    between the network steps. Shared by the DataWorker and the prefetcher.
+    """
+    ticker = ticker.upper().strip()
+    df = get_stock_data(ticker)
+    if cancelled() or df is None or df.empty:
+        return None
+
+    numeric_cols = ["Open", "High", "Low", "Close", "Volume"]
+    for col in numeric_cols:
+        df[col] = pd.to_numeric(df[col], errors="coerce")
+    df.dropna(subset=numeric_cols, inplace=True)
+    # One immutable snapshot is shared by every consumer from here on;
+    # indicators are derived lazily on it (core/derived.py)
+    snapshot = MarketSnapshot.from_frame(
+        ticker, df, store_version=parquet_store.store_version(ticker)
+    )
+
+    if cancelled():
+        return None
+    fundamentals = get_fundamentals(ticker)
+    details = get_details(ticker)
+    news_list = get_news(ticker)
+    return snapshot, fundamentals, details, news_list
@@ -0,0 +1,115 @@
+# core/derived.py
+"""
+Derived columns of a `MarketSnapshot`, declared once and evaluated lazily.
+
+A column is computed the first time a consumer asks for it
+(`snapshot["RSI_14"]`), memoized on that snapshot and shared by every
+later reader - chart, forecast and AI report alike. New bars mean a new
+snapshot (see `MarketSnapshot.append`), which starts with no memos, so
+nothing is ever served stale.
+
+Fixed names are declared with `@derived("MACD")`; parameterised families
+with `@derived_family("SMA")`, which answers to `SMA_20`, `SMA_50`, ...
+A derived column may read others through `snapshot[...]`; they are
+memoized too.
+"""
+import re
+
+import numpy as np
+import pandas as pd
+
+from core.indicators import calculate_rsi
+
+_columns = {}  # name -> compute(snapshot)
+_families = {}  # prefix -> compute(snapshot, n)
+_FAMILY_NAME = re.compile(r"^([A-Z]+)_(\d+)$")
+
+
+def derived(name):
+    def decorator(fn):
+        _columns[name] = fn
+        return fn
+    return decorator
+
+
+def derived_family(prefix):
+    def decorator(fn):
+        _families[prefix] = fn
+        return fn
+    return decorator
+
+
+def resolve(name):
+    """The compute function for `name`; KeyError if nothing declares it"""
+    compute = _columns.get(name)
+    if compute is not None:
+        return compute
+    match = _FAMILY_NAME.match(name)
+    if match and match.group(1) in _families:
+        family, n = _families[match.group(1)], int(match.group(2))
+        return lambda snapshot: family(snapshot, n)
+    raise KeyError(name)
+
+
+def declared():
+    """Fixed names plus family patterns, e.g. ('MACD', ..., 'SMA_<n>')"""
+    return tuple(_columns) + tuple(f"{prefix}_<n>" for prefix in _families)
+
+
+def _close(snapshot):
+    return pd.Series(snapshot["Close"], copy=False)
+
+
+# ---------------- Declarations ---------------- #
+@derived_family("SMA")
+def _sma(snapshot, window):
+    return _close(snapshot).rolling(window=window, min_periods=1).mean()
+
+
+@derived_family("EMA")
+def _ema(snapshot, span):
+    return _close(snapshot).ewm(span=span, adjust=False).mean()
+
+
+@derived_family("STD")
+def _std(snapshot, window):
+    return _close(snapshot).rolling(window=window, min_periods=1).std()
+
+
+@derived_family("RSI")
+def _rsi(snapshot, period):
+    return calculate_rsi(_close(snapshot), period)
+
+
+@derived("MACD")
+def _macd(snapshot):
+    return snapshot["EMA_12"] - snapshot["EMA_26"]
+
+
+@derived("MACD_SIGNAL")
+def _macd_signal(snapshot):
+    return pd.Series(snapshot["MACD"], copy=False).ewm(span=9, adjust=False).mean()
+
+
+@derived("MACD_HIST")
+def _macd_hist(snapshot):
+    return snapshot["MACD"] - snapshot["MACD_SIGNAL"]
+
+
+@derived("BB_UPPER")
+def _bb_upper(snapshot):
+    return snapshot["SMA_20"] + 2 * snapshot["STD_20"]
+
+
+@derived("BB_LOWER")
+def _bb_lower(snapshot):
+    return snapshot["SMA_20"] - 2 * snapshot["STD_20"]
+
+
+@derived("RETURNS")
+def _returns(snapshot):
+    close = snapshot["Close"]
+    returns = np.empty_like(close, dtype="float64")
+    returns[:1] = np.nan
+    np.divide(close[1:], close[:-1], out=returns[1:])
+    return returns - 1
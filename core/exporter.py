@@ -0,0 +1,161 @@
+# core/exporter.py
+"""
+Streaming export of price history to CSV, Parquet or Arrow IPC.
+
+Data moves as Arrow record batches of `chunk_rows` rows: stored tickers are
+read batch by batch straight from their parquet file and each batch is
+written before the next is read, so memory stays flat however long the
+history is. Output goes to a temp file that is renamed into place once
+complete.
+
+`export_many()` exports a set of tickers (default: the whole store) on a
+thread pool; Arrow's readers and writers release the GIL, so the threads
+overlap real work.
+"""
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+import pyarrow.parquet as pq
+
+from core import parquet_store
+
+EXPORT_FOLDER = "reports"
+FORMATS = {"csv": "csv", "parquet": "parquet", "arrow": "arrow"}  # format -> extension
+CHUNK_ROWS = 65_536
+
+
+def export_path(ticker, fmt, folder=EXPORT_FOLDER):
+    return os.path.join(folder, f"{ticker}_reports.{FORMATS[fmt]}")
+
+
+def _plain(batch):
+    """CSV has no dictionary type; decode dictionary columns (e.g. Ticker)"""
+    if not any(pa.types.is_dictionary(f.type) for f in batch.schema):
+        return batch
+    columns = [
+        col.cast(col.type.value_type) if pa.types.is_dictionary(col.type) else col
+        for col in batch.columns
+    ]
+    return pa.RecordBatch.from_arrays(columns, names=batch.schema.names)
+
+
+class _BatchWriter:
+    """One writer interface over the three output formats"""
+
+    def __init__(self, path, fmt, schema):
+        self.fmt = fmt
+        self._sink = pa.OSFile(path, "wb")
+        if fmt == "csv":
+            self._writer = None  # created from the first (decoded) batch
+        elif fmt == "parquet":
+            self._writer = pq.ParquetWriter(self._sink, schema, compression="zstd")
+        else:
+            self._writer = pa.ipc.new_file(self._sink, schema)
+
+    def write(self, batch):
+        if self.fmt == "csv":
+            batch = _plain(batch)
+            if self._writer is None:
+                self._writer = pa_csv.CSVWriter(self._sink, batch.schema)
+        self._writer.write_batch(batch)
+
+    def close(self):
+        if self._writer is not None:
+            self._writer.close()
+        self._sink.close()
+
+
+def write_batches(batches, schema, path, fmt, progress=None):
+    """Stream record batches to `path`; returns the number of rows written"""
+    if fmt not in FORMATS:
+        raise ValueError(f"Unsupported export format: {fmt}")
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp = f"{path}.tmp"
+    rows = 0
+    try:
+        writer = _BatchWriter(tmp, fmt, schema)
+        try:
+            for batch in batches:
+                writer.write(batch)
+                rows += batch.num_rows
+                if progress:
+                    progress(rows)
+        finally:
+            writer.close()
+        os.replace(tmp, path)
+    finally:
+        # Still there unless the replace happened: a failed write or close
+        if os.path.exists(tmp):
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
+    return rows
+
+
+def export_frame(df, path, fmt="csv", chunk_rows=CHUNK_ROWS, progress=None):
+    """Export an in-memory DataFrame (e.g. the dashboard's current view)"""
+    # A RangeIndex is dropped, a real index (e.g. Date) becomes a column
+    table = pa.Table.from_pandas(df)
+    return write_batches(table.to_batches(max_chunksize=chunk_rows), table.schema, path, fmt, progress)
+
+
+def export_ticker(ticker, fmt="csv", folder=EXPORT_FOLDER, chunk_rows=CHUNK_ROWS, progress=None):
+    """Stream one stored ticker from its parquet file. Returns a result dict."""
+    t0 = time.perf_counter()
+    path = export_path(ticker, fmt, folder)
+    # The read lock keeps a concurrent save from replacing the file mid-export
+    with parquet_store.read_lock(ticker):
+        source = pq.ParquetFile(parquet_store.parquet_path(ticker))
+        try:
+            rows = write_batches(
+                source.iter_batches(batch_size=chunk_rows), source.schema_arrow, path, fmt, progress
+            )
+        finally:
+            source.close()
+    return {
+        "ticker": ticker, "path": path, "rows": rows,
+        "bytes": os.path.getsize(path), "seconds": time.perf_counter() - t0,
+    }
+
+
+def export_many(tickers=None, fmt="csv", folder=EXPORT_FOLDER, max_workers=4,
+                chunk_rows=CHUNK_ROWS, progress=None):
+    """Export several stored tickers in parallel.
+
+    `progress(done, total, result)` is called from the pool as each ticker
+    finishes; `result` has an "error" key instead of a path on failure.
+    Returns a summary with per-ticker results and overall throughput.
+    """
+    tickers = list(tickers) if tickers is not None else parquet_store.tickers()
+    t0 = time.perf_counter()
+    results = []
+    with ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix="export") as pool:
+        futures = {
+            pool.submit(export_ticker, ticker, fmt, folder, chunk_rows): ticker
+            for ticker in tickers
+        }
+        for done, future in enumerate(as_completed(futures), 1):
+            try:
+                result = future.result()
+            except Exception as e:
+                result = {"ticker": futures[future], "error": str(e)}
+            results.append(result)
+            if progress:
+                progress(done, len(tickers), result)
+
+    seconds = time.perf_counter() - t0
+    ok = [r for r in results if "error" not in r]
+    rows = sum(r["rows"] for r in ok)
+    size = sum(r["bytes"] for r in ok)
+    return {
+        "format": fmt, "folder": folder, "tickers": len(tickers),
+        "exported": len(ok), "failed": len(results) - len(ok),
+        "rows": rows, "bytes": size, "seconds": seconds,
+        "rows_per_s": rows / seconds if seconds else 0.0,
+        "mb_per_s": size / seconds / 1e6 if seconds else 0.0,
+        "results": sorted(results, key=lambda r: r["ticker"]),
+    }
@@ -1,94 +1,100 @@
-# workers/hybrid_forecast_worker.py
+# core/forecast.py
 """
-Hybrid ML Forecast Worker - Prophet + XGBoost
+Hybrid Prophet + XGBoost forecast model, free of Qt.
+
+Runs in the dashboard scheduler's process pool (via `hybrid_forecast`) and
+in the headless CLI.
 """
+import logging
 
-from PyQt5.QtCore import QThread, pyqtSignal
-import pandas as pd
 import numpy as np
-from prophet import Prophet
-import logging
+import pandas as pd
+
+from core import perf
+from core.snapshot import MarketSnapshot
 
 # Suppress Prophet warnings
 logging.getLogger('prophet').setLevel(logging.WARNING)
 
 
-class HybridForecastWorker(QThread):
+class HybridForecaster:
     """
-    Worker thread for hybrid forecasting using:
+    Hybrid forecasting using:
     - Prophet (trend/seasonality)
     - XGBoost (technical patterns)
-    
+
     Optimized for reliability and speed on 8GB RAM systems
     """
-    forecast_ready = pyqtSignal(object, dict)  # Emits (forecast_df, metrics)
-    progress_update = pyqtSignal(str, int)  # Emits (message, percentage)
-    error_occurred = pyqtSignal(str)
-    
+
     def __init__(self, df, periods=30):
-        super().__init__()
-        self.df = df.copy()
+        # Plain frames (CLI, benchmarks) are wrapped once so the indicator
+        # features come from the same memoized derived columns
+        self.snapshot = df if isinstance(df, MarketSnapshot) else MarketSnapshot.from_frame(None, df)
+        # Date-indexed frame over the snapshot's read-only buffers; numeric
+        # columns only, so a label column can't break fillna/XGBoost
+        self.df = self.snapshot.frame([
+            name for name in self.snapshot.columns if self.snapshot[name].dtype.kind in "fiu"
+        ])
         self.periods = periods
-        self._is_cancelled = False
 
-        if not isinstance(self.df.index, pd.DatetimeIndex):
-            if 'Date' in self.df.columns:
-                self.df['Date'] = pd.to_datetime(self.df['Date'])
-                self.df.set_index('Date', inplace=True)
-            
-    def cancel(self):
-        self._is_cancelled = True
-    
-    def run(self):
-        try:
-            # Step 1: Prophet Forecast
-            self.progress_update.emit("🔮 Running Prophet model...", 15)
+    def run(self, progress=None, cancelled=None):
+        """Returns (forecast_df, metrics), or None if `cancelled()` turned True.
+
+        `progress(message, percentage)` is called before each step.
+        """
+        progress = progress or (lambda message, pct: None)
+        cancelled = cancelled or (lambda: False)
+
+        # Step 1: Prophet Forecast
+        progress("🔮 Running Prophet model...", 15)
+        with perf.span("forecast.prophet", bars=len(self.df)):
             prophet_forecast = self._forecast_prophet()
-            
-            if self._is_cancelled:
-                return
-            
-            # Step 2: Feature Engineering
-            self.progress_update.emit("📊 Engineering features...", 35)
+
+        if cancelled():
+            return None
+
+        # Step 2: Feature Engineering
+        progress("📊 Engineering features...", 35)
+        with perf.span("forecast.features"):
             features_df = self._engineer_features()
-            
-            if self._is_cancelled:
-                return
-            
-            # Step 3: XGBoost Forecast
-            xgboost_forecast = None
-            try:
-                self.progress_update.emit("🚀 Running XGBoost model...", 60)
+
+        if cancelled():
+            return None
+
+        # Step 3: XGBoost Forecast
+        xgboost_forecast = None
+        try:
+            progress("🚀 Running XGBoost model...", 60)
+            with perf.span("forecast.xgboost"):
                 xgboost_forecast = self._forecast_xgboost(features_df)
-            except Exception as e:
-                print(f"⚠️ XGBoost error: {e}")
-                # Fallback to Prophet-only if XGBoost fails
-            
-            if self._is_cancelled:
-                return
-            
-            # Step 4: Ensemble Predictions
-            self.progress_update.emit("🎯 Combining predictions...", 85)
+        except Exception as e:
+            print(f"⚠️ XGBoost error: {e}")
+            # Fallback to Prophet-only if XGBoost fails
+
+        if cancelled():
+            return None
+
+        # Step 4: Ensemble Predictions
+        progress("🎯 Combining predictions...", 85)
+        with perf.span("forecast.ensemble"):
             final_forecast = self._ensemble_predictions(
-                prophet_forecast, 
+                prophet_forecast,
                 xgboost_forecast
             )
-            
-            # Step 5: Calculate Metrics
-            self.progress_update.emit("📈 Calculating metrics...", 95)
+
+        # Step 5: Calculate Metrics
+        progress("📈 Calculating metrics...", 95)
+        with perf.span("forecast.metrics"):
             metrics = self._calculate_metrics(final_forecast, xgboost_forecast)
-            
-            self.progress_update.emit("✅ Forecast complete!", 100)
-            
-            if not self._is_cancelled:
-                self.forecast_ready.emit(final_forecast, metrics)
-                
-        except Exception as e:
-            if not self._is_cancelled:
-                self.error_occurred.emit(f"Forecast error: {str(e)}")
-    
+
+        progress("✅ Forecast complete!", 100)
+        return final_forecast, metrics
+
     def _forecast_prophet(self):
         """Prophet baseline forecast with volume regressor"""
+        # Imported here so the dashboard doesn't pay for prophet/cmdstanpy at startup
+        from prophet import Prophet
+
         prophet_df = self.df.reset_index()[['Date', 'Close']].rename(
             columns={'Date': 'ds', 'Close': 'y'}
         )
@@ -130,13 +136,13 @@ class HybridForecastWorker(QThread):
     
     def _engineer_features(self):
         """Create technical indicator features for XGBoost"""
-        df = self.df.copy()
+        df = self.df.copy(deep=False)
+        # Shared indicators come memoized from the snapshot (core/derived.py)
+        derived = self.snapshot
         
         # Moving Averages
-        df['SMA_20'] = df['Close'].rolling(window=20, min_periods=1).mean()
-        df['SMA_50'] = df['Close'].rolling(window=50, min_periods=1).mean()
-        df['EMA_12'] = df['Close'].ewm(span=12, adjust=False).mean()
-        df['EMA_26'] = df['Close'].ewm(span=26, adjust=False).mean()
+        for name in ('SMA_20', 'SMA_50', 'EMA_12', 'EMA_26'):
+            df[name] = derived[name]
         
         # RSI (Relative Strength Index)
         delta = df['Close'].diff()
@@ -146,18 +152,17 @@ class HybridForecastWorker(QThread):
         df['RSI'] = 100 - (100 / (1 + rs))
         
         # MACD
-        df['MACD'] = df['EMA_12'] - df['EMA_26']
-        df['MACD_Signal'] = df['MACD'].ewm(span=9, adjust=False).mean()
+        df['MACD'] = derived['MACD']
+        df['MACD_Signal'] = derived['MACD_SIGNAL']
         
         # Bollinger Bands
-        bb_mid = df['Close'].rolling(window=20, min_periods=1).mean()
-        bb_std = df['Close'].rolling(window=20, min_periods=1).std()
-        df['BB_Upper'] = bb_mid + (2 * bb_std)
-        df['BB_Lower'] = bb_mid - (2 * bb_std)
+        df['BB_Upper'] = derived['BB_UPPER']
+        df['BB_Lower'] = derived['BB_LOWER']
         df['BB_Width'] = df['BB_Upper'] - df['BB_Lower']
         
         # Volatility
-        df['Volatility'] = df['Close'].pct_change().rolling(window=20, min_periods=1).std()
+        df['Returns'] = derived['RETURNS']
+        df['Volatility'] = df['Returns'].rolling(window=20, min_periods=1).std()
         
         # Volume features
         if 'Volume' in df.columns:
@@ -165,7 +170,6 @@ class HybridForecastWorker(QThread):
             df['Volume_Ratio'] = df['Volume'] / (df['Volume_MA'] + 1)
         
         # Price momentum
-        df['Returns'] = df['Close'].pct_change()
         df['Momentum_5'] = (df['Close'] / df['Close'].shift(5)) - 1
         df['Momentum_10'] = (df['Close'] / df['Close'].shift(10)) - 1
         
@@ -187,9 +191,9 @@ class HybridForecastWorker(QThread):
             return None
         
        
-        # Select feature columns (exclude OHLCV)
+        # Select feature columns (exclude OHLCV and the stored Ticker label)
         feature_cols = [col for col in features_df.columns 
-                       if col not in ['Open', 'High', 'Low', 'Close', 'Volume', 'Date']]
+                       if col not in ['Open', 'High', 'Low', 'Close', 'Volume', 'Date', 'Ticker']]
         
         X = features_df[feature_cols].values
         y = features_df['Close'].values
@@ -305,4 +309,9 @@ class HybridForecastWorker(QThread):
             'Models Used': models_used
         }
         
-        return metrics
\ No newline at end of file
+        return metrics
+
+
+def hybrid_forecast(df, periods=30):
+    """Top-level entry point so the forecast can run in a worker process"""
+    return HybridForecaster(df, periods).run()
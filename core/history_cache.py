@@ -0,0 +1,178 @@
+# core/history_cache.py
+"""
+Read-only, memory-mapped OHLCV history shared by every worker.
+
+Each ticker's parquet file is mirrored to an uncompressed Arrow IPC file that
+is memory-mapped once per process. `get_history()` hands out DataFrames whose
+price and volume columns are zero-copy views over that mapping (the compact
+`core.store_schema` dtypes convert without copying; only Date is widened to
+ns and the Ticker label is left out), so the DataWorker,
+chart, forecast, export and live-price workers all read the same physical
+buffer. The arrays are read-only: a caller that needs to write values in
+place must take its own `.copy()` first. Adding or replacing whole columns
+on the returned frame is fine - every call returns a new (shallow) frame.
+"""
+import os
+import threading
+from collections import OrderedDict
+
+import pyarrow as pa
+import pyarrow.ipc as ipc
+
+from core.parquet_store import STORE_FOLDER, parquet_path, read_lock, read_table, store_version
+from core.store_schema import conform_table, to_frame, to_store_table
+
+ARROW_FOLDER = os.path.join(STORE_FOLDER, ".arrow")
+
+
+class HistoryCache:
+    """Process-wide LRU of memory-mapped Arrow tables, keyed by ticker"""
+
+    def __init__(self, arrow_folder=ARROW_FOLDER, max_tickers=32):
+        self.arrow_folder = arrow_folder
+        self.max_tickers = max_tickers
+        self._lock = threading.Lock()
+        # ticker -> (stamp, frame); frame holds views over the mapped table
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    # ---------------- Paths ---------------- #
+    def _arrow_path(self, ticker, stamp):
+        # Stamp is part of the name so a new version never has to overwrite a
+        # file another thread/process still has mapped (Windows)
+        return os.path.join(self.arrow_folder, f"{ticker}.{stamp}.arrow")
+
+    def _stamp(self, ticker):
+        """Store version counter; parquet mtime for files the store never wrote"""
+        version = store_version(ticker)
+        if version:
+            return version
+        try:
+            return os.stat(parquet_path(ticker)).st_mtime_ns
+        except FileNotFoundError:
+            return None
+
+    # ---------------- Public API ---------------- #
+    def get(self, ticker):
+        """Return a read-only view of the stored history, or None if absent"""
+        ticker = ticker.upper().strip()
+        stamp = self._stamp(ticker)
+        if stamp is None:
+            return None
+
+        with self._lock:
+            entry = self._entries.get(ticker)
+            if entry is not None and entry[0] == stamp:
+                self._entries.move_to_end(ticker)
+                self.hits += 1
+                return entry[1].copy(deep=False)
+
+        # Read under the store's shared lock so a writer can't swap the file
+        # (and its version) between the stamp check and the read
+        with read_lock(ticker):
+            stamp = self._stamp(ticker)
+            if stamp is None:
+                return None
+            with self._lock:
+                self.misses += 1
+                arrow_path = self._arrow_path(ticker, stamp)
+                if not os.path.exists(arrow_path):
+                    table, _ = read_table(ticker)
+                    self._write_arrow(ticker, stamp, table)
+                frame = self._map(arrow_path)
+                self._remember(ticker, stamp, frame)
+                return frame.copy(deep=False)
+
+    def put(self, ticker, df, version=None):
+        """Publish a frame that was just written to `{ticker}.parquet`.
+
+        `version` is the store version returned by `parquet_store.save()`.
+        Returns a read-only view backed by the new mapping, so the caller can
+        drop its private copy.
+        """
+        ticker = ticker.upper().strip()
+        stamp = version or self._stamp(ticker)
+        if stamp is None:
+            return df
+
+        with self._lock:
+            arrow_path = self._write_arrow(ticker, stamp, df)
+            frame = self._map(arrow_path)
+            self._remember(ticker, stamp, frame)
+            return frame.copy(deep=False)
+
+    def invalidate(self, ticker=None):
+        with self._lock:
+            if ticker is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(ticker.upper().strip(), None)
+
+    def stats(self):
+        with self._lock:
+            return {
+                "tickers": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "mapped_bytes": sum(
+                    int(frame.memory_usage(index=False, deep=False).sum())
+                    for _, frame in self._entries.values()
+                ),
+            }
+
+    # ---------------- Internals ---------------- #
+    def _write_arrow(self, ticker, stamp, data):
+        """`data` is a DataFrame or an Arrow table already in STORE_SCHEMA"""
+        os.makedirs(self.arrow_folder, exist_ok=True)
+        if isinstance(data, pa.Table):
+            table = conform_table(data, ticker)
+        else:
+            table = to_store_table(data, ticker)
+        table = table.combine_chunks()
+        path = self._arrow_path(ticker, stamp)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with pa.OSFile(tmp_path, "wb") as sink:
+            with ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+        os.replace(tmp_path, path)
+        self._prune(ticker, keep=path)
+        return path
+
+    def _map(self, path):
+        source = pa.memory_map(path, "r")
+        table = ipc.open_file(source).read_all()
+        # split_blocks keeps one block per column so numeric columns without
+        # nulls wrap the mapped buffers directly instead of being consolidated
+        return to_frame(table, split_blocks=True)
+
+    def _remember(self, ticker, stamp, frame):
+        self._entries[ticker] = (stamp, frame)
+        self._entries.move_to_end(ticker)
+        while len(self._entries) > self.max_tickers:
+            self._entries.popitem(last=False)
+
+    def _prune(self, ticker, keep):
+        """Remove superseded Arrow files; ignore ones still mapped elsewhere"""
+        prefix, suffix = f"{ticker}.", ".arrow"
+        for name in os.listdir(self.arrow_folder):
+            path = os.path.join(self.arrow_folder, name)
+            stamp = name[len(prefix):-len(suffix)]
+            if name.startswith(prefix) and name.endswith(suffix) and stamp.isdigit() and path != keep:
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+
+
+history_cache = HistoryCache()
+
+
+def get_history(ticker):
+    """Zero-copy, read-only view of the locally stored history for `ticker`"""
+    return history_cache.get(ticker)
+
+
+def put_history(ticker, df, version=None):
+    """Publish freshly written history and get back the shared view"""
+    return history_cache.put(ticker, df, version)
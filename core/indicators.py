@@ -1,4 +1,8 @@
 # indicators.py
+import numpy as np
+import pandas as pd
+
+
 def calculate_sma(df, window=20):
     df[f"SMA_{window}"] = df["Close"].rolling(window=window).mean()
     return df
@@ -7,3 +11,29 @@ def calculate_sma(df, window=20):
 def calculate_ema(df, span=20):
     df[f"EMA_{span}"] = df["Close"].ewm(span=span, adjust=False).mean()
     return df
+
+
+def calculate_rsi(series, period=14):
+    delta = series.diff().values
+    gain = np.where(delta > 0, delta, 0)
+    loss = np.where(delta < 0, -delta, 0)
+    alpha = 1 / period
+    avg_gain = pd.Series(gain).ewm(alpha=alpha, min_periods=period).mean()
+    avg_loss = pd.Series(loss).ewm(alpha=alpha, min_periods=period).mean()
+    rs = avg_gain / avg_loss
+    return 100 - (100 / (1 + rs))
+
+
+def calculate_macd(series, short=12, long=26, signal=9):
+    short_ema = series.ewm(span=short, adjust=False).mean()
+    long_ema = series.ewm(span=long, adjust=False).mean()
+    macd = short_ema - long_ema
+    signal_line = macd.ewm(span=signal, adjust=False).mean()
+    hist = macd - signal_line
+    return macd, signal_line, hist
+
+
+def calculate_bollinger(series, window=20, width=2):
+    mid = series.rolling(window=window, min_periods=1).mean()
+    std = series.rolling(window=window, min_periods=1).std()
+    return mid + width * std, mid - width * std
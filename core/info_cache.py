@@ -0,0 +1,204 @@
+# core/info_cache.py
+"""
+Persistent TTL cache for slow-changing network data: fundamentals,
+company details and news.
+
+Values are stored as JSON in one SQLite file next to the parquet store, so
+they survive restarts and are shared by every app instance (WAL mode). Each
+kind has its own TTL and a longer stale limit:
+
+- fresh (younger than the TTL): returned as-is, no network;
+- stale (older, but within the stale limit): returned immediately and a
+  background refresh is queued - stale-while-revalidate;
+- missing or too old: fetched inline like before.
+
+The file is bounded by `max_bytes`; the least recently read entries are
+evicted first. Listeners added with `on_refresh()` get
+`(kind, key, value)` after a background refresh lands (on the refresh
+thread), so the UI can swap in the new value.
+"""
+import json
+import os
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from core import parquet_store, perf
+
+CACHE_PATH = os.path.join(parquet_store.STORE_FOLDER, "info_cache.sqlite")
+MAX_BYTES = 32 * 1024 * 1024
+
+# kind -> (ttl seconds, stale limit seconds)
+POLICIES = {
+    "fundamentals": (24 * 3600, 30 * 24 * 3600),
+    "details": (24 * 3600, 30 * 24 * 3600),
+    "news": (15 * 60, 24 * 3600),
+}
+
+
+class InfoCache:
+    def __init__(self, path=CACHE_PATH, max_bytes=MAX_BYTES, policies=POLICIES, refresh_workers=2):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.policies = policies
+        self._lock = threading.Lock()
+        self._conn = None
+        self._refresher = ThreadPoolExecutor(refresh_workers, thread_name_prefix="info-refresh")
+        self._in_flight = set()
+        self._listeners = []
+        self.stats = {"fresh": 0, "stale": 0, "miss": 0, "refreshed": 0, "evicted": 0, "errors": 0}
+
+    # ---------------- Storage ---------------- #
+    def _db(self):
+        if self._conn is None:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False, timeout=5.0)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                " kind TEXT NOT NULL, key TEXT NOT NULL, value TEXT NOT NULL,"
+                " stored_at REAL NOT NULL, read_at REAL NOT NULL, size INTEGER NOT NULL,"
+                " PRIMARY KEY (kind, key))"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS entries_read_at ON entries (read_at)")
+            self._conn = conn
+        return self._conn
+
+    def peek(self, kind, key):
+        """(value, age seconds) or None; does not touch the read time"""
+        with self._lock:
+            row = self._db().execute(
+                "SELECT value, stored_at FROM entries WHERE kind = ? AND key = ?", (kind, key)
+            ).fetchone()
+        if row is None:
+            return None
+        return json.loads(row[0]), time.time() - row[1]
+
+    def put(self, kind, key, value):
+        text = json.dumps(value, default=str)
+        now = time.time()
+        with self._lock:
+            db = self._db()
+            with db:
+                db.execute(
+                    "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?)",
+                    (kind, key, text, now, now, len(text)),
+                )
+                self._evict(db)
+
+    def _evict(self, db):
+        total = db.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        # Down to 90% so a full cache does not evict on every put
+        target = total - int(self.max_bytes * 0.9)
+        freed = 0
+        doomed = []
+        for kind, key, size in db.execute(
+            "SELECT kind, key, size FROM entries ORDER BY read_at"
+        ).fetchall():
+            doomed.append((kind, key))
+            freed += size
+            if freed >= target:
+                break
+        db.executemany("DELETE FROM entries WHERE kind = ? AND key = ?", doomed)
+        self.stats["evicted"] += len(doomed)
+
+    def _touch(self, kind, key):
+        with self._lock:
+            db = self._db()
+            with db:
+                db.execute(
+                    "UPDATE entries SET read_at = ? WHERE kind = ? AND key = ?",
+                    (time.time(), kind, key),
+                )
+
+    def size(self):
+        with self._lock:
+            return self._db().execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries"
+            ).fetchone()
+
+    def clear(self, kind=None):
+        with self._lock:
+            db = self._db()
+            with db:
+                if kind is None:
+                    db.execute("DELETE FROM entries")
+                else:
+                    db.execute("DELETE FROM entries WHERE kind = ?", (kind,))
+
+    # ---------------- Stale-while-revalidate ---------------- #
+    def get(self, kind, key, fetch):
+        """The cached value for (kind, key), fetching with `fetch()` as needed.
+
+        `fetch` must raise on failure so errors are never cached; when it
+        fails and a stale value exists, the stale value is returned.
+        """
+        ttl, stale_limit = self.policies[kind]
+        cached = self.peek(kind, key)
+        if cached is not None:
+            value, age = cached
+            if age < ttl:
+                self.stats["fresh"] += 1
+                perf.count(f"info_cache.{kind}.fresh")
+                self._touch(kind, key)
+                return value
+            if age < stale_limit:
+                self.stats["stale"] += 1
+                perf.count(f"info_cache.{kind}.stale")
+                self._touch(kind, key)
+                self._revalidate(kind, key, fetch)
+                return value
+
+        self.stats["miss"] += 1
+        perf.count(f"info_cache.{kind}.miss")
+        try:
+            value = fetch()
+        except Exception:
+            self.stats["errors"] += 1
+            if cached is not None:
+                return cached[0]  # past its stale limit, still better than nothing
+            raise
+        self.put(kind, key, value)
+        return value
+
+    def _revalidate(self, kind, key, fetch):
+        with self._lock:
+            if (kind, key) in self._in_flight:
+                return
+            self._in_flight.add((kind, key))
+        self._refresher.submit(self._refresh, kind, key, fetch)
+
+    def _refresh(self, kind, key, fetch):
+        try:
+            value = fetch()
+            self.put(kind, key, value)
+            self.stats["refreshed"] += 1
+        except Exception as e:
+            self.stats["errors"] += 1
+            print(f"⚠️ Background refresh of {kind} for {key} failed: {e}")
+            return
+        finally:
+            with self._lock:
+                self._in_flight.discard((kind, key))
+        for listener in list(self._listeners):
+            try:
+                listener(kind, key, value)
+            except Exception as e:
+                print(f"⚠️ Info cache listener failed: {e}")
+
+    def on_refresh(self, listener):
+        self._listeners.append(listener)
+
+    def close(self):
+        self._refresher.shutdown(wait=False, cancel_futures=True)
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+info_cache = InfoCache()
@@ -0,0 +1,188 @@
+# core/levels.py
+"""
+Support/resistance levels from pivot highs and lows.
+
+Pivots are found with one vectorized rolling max/min over the whole series:
+bar i is a pivot high when its High is the maximum of the `order` bars on
+each side (pivot low likewise on Low). Nearby pivot prices are clustered
+with a tolerance of `atr_mult` x ATR (or `pct_tolerance` of price when no
+range is available). Each cluster is one level, scored by how often price
+touched it and how recently, and only the top-N are returned.
+
+`LevelTracker` keeps the pivots between calls so a chart refresh after new
+or live-updated bars only rescans the last few bars.
+"""
+import hashlib
+import threading
+from collections import OrderedDict, namedtuple
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+Level = namedtuple("Level", "price kind touches first last score")
+
+ATR_PERIOD = 14
+
+
+def pivot_order(n):
+    """Bars on each side a pivot must dominate (matches the old chart default)"""
+    return min(10, n // 4) if n > 20 else 5
+
+
+def find_pivots(high, low, order, start=0):
+    """Indices of pivot highs and lows whose window lies entirely in the series.
+
+    Only pivots at index >= `start` are returned.
+    """
+    high = np.asarray(high, dtype="float64")
+    low = np.asarray(low, dtype="float64")
+    width = 2 * order + 1
+    first = max(start - order, 0)
+    if len(high) - first < width:
+        empty = np.empty(0, dtype="int64")
+        return empty, empty
+
+    centre = np.arange(first + order, len(high) - order)
+    hi_max = sliding_window_view(high[first:], width).max(axis=1)
+    lo_min = sliding_window_view(low[first:], width).min(axis=1)
+    highs = centre[high[centre] >= hi_max]
+    lows = centre[low[centre] <= lo_min]
+    # A flat top yields one pivot per tied bar; keep the first of each run
+    highs = highs[np.r_[True, np.diff(highs) > 1]] if len(highs) else highs
+    lows = lows[np.r_[True, np.diff(lows) > 1]] if len(lows) else lows
+    return highs, lows
+
+
+def average_true_range(high, low, close, period=ATR_PERIOD):
+    high, low, close = (np.asarray(a, dtype="float64") for a in (high, low, close))
+    if len(close) < 2:
+        return float(np.nanmean(high - low)) if len(close) else 0.0
+    prev = close[:-1]
+    tr = np.maximum.reduce([high[1:] - low[1:], np.abs(high[1:] - prev), np.abs(low[1:] - prev)])
+    return float(np.nanmean(tr[-period:]))
+
+
+def cluster_levels(prices, indices, n_bars, last_close, tolerance, top_n=6, recency_weight=2.0):
+    """Group pivot prices within `tolerance` of each other into ranked Levels"""
+    if len(prices) == 0:
+        return []
+    order = np.argsort(prices, kind="stable")
+    prices = np.asarray(prices, dtype="float64")[order]
+    indices = np.asarray(indices)[order]
+
+    # A new cluster starts wherever the gap to the previous price is too wide
+    starts = np.flatnonzero(np.r_[True, np.diff(prices) > tolerance])
+    touches = np.diff(np.r_[starts, len(prices)])
+    level_price = np.add.reduceat(prices, starts) / touches
+    first = np.minimum.reduceat(indices, starts)
+    last = np.maximum.reduceat(indices, starts)
+    score = touches + recency_weight * (last / max(n_bars - 1, 1))
+
+    best = np.argsort(-score, kind="stable")[:top_n]
+    return [
+        Level(
+            float(level_price[i]),
+            "support" if level_price[i] <= last_close else "resistance",
+            int(touches[i]), int(first[i]), int(last[i]), float(score[i]),
+        )
+        for i in sorted(best, key=lambda i: level_price[i])
+    ]
+
+
+class LevelTracker:
+    """Pivots for one series, updated incrementally as bars are appended.
+
+    `update()` detects whether the new frame extends the previous one (same
+    dates and high/low/close up to the last bar, checked by digest) and then
+    only rescans the bars whose pivot status can have changed; anything else,
+    such as a refetch that revised earlier bars, is a full rescan.
+    """
+
+    def __init__(self, order=None, atr_mult=0.5, pct_tolerance=0.01, top_n=6):
+        self.order = order
+        self.atr_mult = atr_mult
+        self.pct_tolerance = pct_tolerance
+        self.top_n = top_n
+        self._order = None
+        self._n = 0
+        self._anchor = None
+        self._highs = np.empty(0, dtype="int64")
+        self._lows = np.empty(0, dtype="int64")
+        self.full_scans = 0
+        self.incremental_scans = 0
+
+    def _anchor_of(self, dates, high, low, close, n):
+        # The bars that must not change between updates: all but the last.
+        # Hashing them is far cheaper than the rolling max/min of a rescan.
+        if n < 2:
+            return None
+        digest = hashlib.blake2b(digest_size=16)
+        for values in (high, low, close):
+            digest.update(np.ascontiguousarray(values[:n - 1]).tobytes())
+        return (dates[0], dates[n - 2], digest.digest())
+
+    def _scan(self, high, low, dates, close):
+        n = len(close)
+        order = self.order or pivot_order(n)
+        extends = (
+            order == self._order and self._n >= 2 and n >= self._n
+            and self._anchor == self._anchor_of(dates, high, low, close, self._n)
+        )
+        if extends:
+            # Pivots within `order` of the previous last bar may have changed
+            # (that bar can be a live, still-forming one); earlier ones cannot
+            start = max(self._n - 1 - order, 0)
+            highs, lows = find_pivots(high, low, order, start)
+            self._highs = np.r_[self._highs[self._highs < start], highs]
+            self._lows = np.r_[self._lows[self._lows < start], lows]
+            self.incremental_scans += 1
+        else:
+            self._highs, self._lows = find_pivots(high, low, order)
+            self.full_scans += 1
+        self._order = order
+        self._n = n
+        self._anchor = self._anchor_of(dates, high, low, close, n)
+
+    def update(self, df):
+        """Top-N levels for an OHLC frame (Date index or column)"""
+        close = df["Close"].to_numpy(dtype="float64")
+        high = df["High"].to_numpy(dtype="float64") if "High" in df else close
+        low = df["Low"].to_numpy(dtype="float64") if "Low" in df else close
+        dates = df["Date"].to_numpy() if "Date" in df else df.index.to_numpy()
+        if len(close) == 0:
+            return []
+
+        self._scan(high, low, dates, close)
+
+        atr = average_true_range(high, low, close)
+        tolerance = self.atr_mult * atr if atr > 0 else self.pct_tolerance * close[-1]
+        prices = np.r_[high[self._highs], low[self._lows]]
+        indices = np.r_[self._highs, self._lows]
+        return cluster_levels(prices, indices, len(close), close[-1], tolerance, self.top_n)
+
+
+class LevelCache:
+    """One LevelTracker per (ticker, timeframe), LRU-bounded"""
+
+    def __init__(self, max_series=32):
+        self.max_series = max_series
+        self._trackers = OrderedDict()
+        self._lock = threading.Lock()
+
+    def levels(self, key, df, top_n=6):
+        with self._lock:
+            tracker = self._trackers.pop(key, None) or LevelTracker(top_n=top_n)
+            self._trackers[key] = tracker
+            while len(self._trackers) > self.max_series:
+                self._trackers.popitem(last=False)
+            # Cheap enough to hold the lock; keeps overlapping redraws consistent
+            tracker.top_n = top_n
+            return tracker.update(df)
+
+    def clear(self):
+        with self._lock:
+            self._trackers.clear()
+
+
+# Shared by chart workers so redraws of the same series scan incrementally
+level_cache = LevelCache()
@@ -0,0 +1,322 @@
+# core/parquet_store.py
+"""
+Concurrency layer for the `{TICKER}.parquet` store.
+
+Three threads (DataWorker, the live-price asyncio loop and the OHLC updater)
+and possibly several app instances read-modify-write the same files, so:
+
+- `write_lock(ticker)` / `read_lock(ticker)` are per-ticker reader/writer locks.
+  Inside a process they are a reentrant RW lock; across processes they hold
+  an `flock` on `.locks/{TICKER}.lock` (exclusive for writers, shared for
+  readers). A thread holding the write lock may take the read lock too, but
+  never upgrade read -> write.
+- `save()` writes through `store_schema.write_store`, which writes a temp file
+  and `os.replace`s it, so a crash never leaves a torn parquet file behind.
+- Every save bumps `.locks/{TICKER}.version`. `store_version()` is one tiny
+  file read, so readers can tell whether a cached frame is stale without
+  touching the parquet file.
+- Live intraday bars go to `intraday/{TICKER}_{tf}.parquet` through
+  `append_bars()`, under the same per-ticker lock.
+
+Typical read-modify-write:
+
+    with write_lock(ticker):
+        df = get_history(ticker).copy()
+        ...modify...
+        save(ticker, df)
+"""
+import os
+import threading
+from contextlib import contextmanager
+
+import pandas as pd
+import pyarrow.parquet as pq
+
+from core.store_schema import OHLCV_COLUMNS, SCHEMA_VERSION, migrate_file, to_frame, write_store
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+STORE_FOLDER = "./csv_data_files"
+LOCK_FOLDER = os.path.join(STORE_FOLDER, ".locks")
+INTRADAY_FOLDER = os.path.join(STORE_FOLDER, "intraday")
+
+# How much intraday history each timeframe keeps on disk
+INTRADAY_RETENTION_DAYS = {"1m": 7, "5m": 30, "15m": 60, "1h": 730}
+
+_MARKER_NAME = ".schema_version"
+
+
+class _RWLock:
+    """Reentrant, writer-preferring reader/writer lock for one ticker"""
+
+    def __init__(self):
+        self._cond = threading.Condition(threading.Lock())
+        self._readers = {}          # thread id -> depth
+        self._writer = None         # thread id
+        self._write_depth = 0
+        self._writers_waiting = 0
+
+    def acquire_read(self):
+        me = threading.get_ident()
+        with self._cond:
+            if self._writer != me and me not in self._readers:
+                while self._writer is not None or self._writers_waiting:
+                    self._cond.wait()
+            self._readers[me] = self._readers.get(me, 0) + 1
+            # Only the outermost acquisition in this process takes the file lock
+            return self._writer != me and self._readers[me] == 1
+
+    def release_read(self):
+        me = threading.get_ident()
+        with self._cond:
+            self._readers[me] -= 1
+            if not self._readers[me]:
+                del self._readers[me]
+                self._cond.notify_all()
+
+    def acquire_write(self):
+        me = threading.get_ident()
+        with self._cond:
+            if self._writer == me:
+                self._write_depth += 1
+                return False
+            if me in self._readers:
+                raise RuntimeError("cannot upgrade a read lock to a write lock")
+            self._writers_waiting += 1
+            try:
+                while self._writer is not None or self._readers:
+                    self._cond.wait()
+            finally:
+                self._writers_waiting -= 1
+            self._writer = me
+            self._write_depth = 1
+            return True
+
+    def release_write(self):
+        with self._cond:
+            self._write_depth -= 1
+            if not self._write_depth:
+                self._writer = None
+                self._cond.notify_all()
+            return not self._write_depth
+
+
+_locks = {}
+_locks_guard = threading.Lock()
+
+
+def _rw_lock(ticker):
+    with _locks_guard:
+        lock = _locks.get(ticker)
+        if lock is None:
+            lock = _locks[ticker] = _RWLock()
+        return lock
+
+
+def _lock_path(ticker):
+    os.makedirs(LOCK_FOLDER, exist_ok=True)
+    return os.path.join(LOCK_FOLDER, f"{ticker}.lock")
+
+
+def _file_lock(ticker, exclusive):
+    fh = open(_lock_path(ticker), "a+b")
+    try:
+        if fcntl is not None:
+            fcntl.flock(fh.fileno(), fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+        elif exclusive:
+            # msvcrt has no shared mode; readers rely on atomic replace instead
+            fh.seek(0)
+            while True:
+                try:
+                    msvcrt.locking(fh.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    continue
+    except Exception:
+        fh.close()
+        raise
+    return fh
+
+
+def _file_unlock(fh):
+    try:
+        if fcntl is not None:
+            fcntl.flock(fh.fileno(), fcntl.LOCK_UN)
+        else:
+            fh.seek(0)
+            try:
+                msvcrt.locking(fh.fileno(), msvcrt.LK_UNLCK, 1)
+            except OSError:
+                pass
+    finally:
+        fh.close()
+
+
+def _normalize(ticker):
+    return ticker.upper().strip()
+
+
+@contextmanager
+def read_lock(ticker):
+    ticker = _normalize(ticker)
+    lock = _rw_lock(ticker)
+    outermost = lock.acquire_read()
+    fh = _file_lock(ticker, exclusive=False) if outermost else None
+    try:
+        yield
+    finally:
+        if fh is not None:
+            _file_unlock(fh)
+        lock.release_read()
+
+
+@contextmanager
+def write_lock(ticker):
+    ticker = _normalize(ticker)
+    lock = _rw_lock(ticker)
+    outermost = lock.acquire_write()
+    fh = _file_lock(ticker, exclusive=True) if outermost else None
+    try:
+        yield
+    finally:
+        if fh is not None:
+            _file_unlock(fh)
+        lock.release_write()
+
+
+# ---------------- Paths & versions ---------------- #
+def parquet_path(ticker):
+    return os.path.join(STORE_FOLDER, f"{_normalize(ticker)}.parquet")
+
+
+def _version_path(ticker):
+    return os.path.join(LOCK_FOLDER, f"{ticker}.version")
+
+
+def store_version(ticker):
+    """Monotonic write counter for `ticker`; 0 if never written by this store"""
+    try:
+        with open(_version_path(_normalize(ticker))) as fh:
+            return int(fh.read().strip() or 0)
+    except (FileNotFoundError, ValueError):
+        return 0
+
+
+def _bump_version(ticker):
+    version = store_version(ticker) + 1
+    path = _version_path(ticker)
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp_path, "w") as fh:
+        fh.write(str(version))
+    os.replace(tmp_path, path)
+    return version
+
+
+# ---------------- Read / write ---------------- #
+def exists(ticker):
+    return os.path.exists(parquet_path(ticker))
+
+
+def tickers():
+    """Every ticker with a daily history in the store"""
+    if not os.path.isdir(STORE_FOLDER):
+        return []
+    return sorted(
+        _normalize(name[:-len(".parquet")])
+        for name in os.listdir(STORE_FOLDER) if name.endswith(".parquet")
+    )
+
+
+def read_table(ticker):
+    """Read the stored Arrow table and its version under a shared lock"""
+    ticker = _normalize(ticker)
+    with read_lock(ticker):
+        return pq.read_table(parquet_path(ticker)), store_version(ticker)
+
+
+def save(ticker, df):
+    """Atomically replace `{ticker}.parquet` and bump its version.
+
+    Takes the write lock itself (reentrant), but callers doing
+    read-modify-write must hold `write_lock(ticker)` around the whole cycle.
+    Returns `(table, version)`.
+    """
+    ticker = _normalize(ticker)
+    with write_lock(ticker):
+        table = write_store(df, ticker, parquet_path(ticker))
+        return table, _bump_version(ticker)
+
+
+# ---------------- Intraday bars ---------------- #
+def intraday_path(ticker, timeframe):
+    return os.path.join(INTRADAY_FOLDER, f"{_normalize(ticker)}_{timeframe}.parquet")
+
+
+def load_bars(ticker, timeframe):
+    """Stored intraday bars for `timeframe`, oldest first (empty if none)"""
+    path = intraday_path(ticker, timeframe)
+    with read_lock(ticker):
+        if not os.path.exists(path):
+            return pd.DataFrame(columns=OHLCV_COLUMNS)
+        return to_frame(pq.read_table(path))
+
+
+def append_bars(ticker, timeframe, bars):
+    """Merge completed bars into `{ticker}_{timeframe}.parquet` in one write.
+
+    Bars with an existing start time replace the stored one; anything older
+    than the timeframe's retention window is dropped.
+    """
+    if bars is None or bars.empty:
+        return 0
+    ticker = _normalize(ticker)
+    os.makedirs(INTRADAY_FOLDER, exist_ok=True)
+    with write_lock(ticker):
+        stored = load_bars(ticker, timeframe)
+        merged = pd.concat([stored, bars]) if not stored.empty else bars
+        merged = merged.drop_duplicates(subset=["Date"], keep="last")
+        keep_days = INTRADAY_RETENTION_DAYS.get(timeframe)
+        if keep_days:
+            cutoff = pd.Timestamp.now() - pd.Timedelta(days=keep_days)
+            merged = merged[pd.to_datetime(merged["Date"]) >= cutoff]
+        table = write_store(merged, ticker, intraday_path(ticker, timeframe))
+        return table.num_rows
+
+
+def migrate_store():
+    """One-time migration of every `{TICKER}.parquet` to the compact schema"""
+    marker = os.path.join(STORE_FOLDER, _MARKER_NAME)
+    try:
+        with open(marker) as fh:
+            if int(fh.read().strip() or 0) >= SCHEMA_VERSION:
+                return 0
+    except (FileNotFoundError, ValueError):
+        pass
+
+    migrated = 0
+    for name in sorted(os.listdir(STORE_FOLDER)):
+        if not name.endswith(".parquet"):
+            continue
+        ticker = _normalize(name[:-len(".parquet")])
+        path = os.path.join(STORE_FOLDER, name)
+        try:
+            with write_lock(ticker):
+                before = os.path.getsize(path)
+                if migrate_file(path, ticker):
+                    _bump_version(ticker)
+                    migrated += 1
+                    print(f"🗜️ Migrated {name}: {before:,} → {os.path.getsize(path):,} bytes")
+        except Exception as e:
+            print(f"⚠️ Could not migrate {name}: {e}")
+
+    with open(marker, "w") as fh:
+        fh.write(str(SCHEMA_VERSION))
+    return migrated
+
+
+if __name__ == "__main__":
+    print(f"✅ {migrate_store()} file(s) migrated in {STORE_FOLDER}")
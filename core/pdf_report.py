@@ -0,0 +1,265 @@
+# core/pdf_report.py
+"""
+PDF stock reports: summary stats, a price/volume chart and the latest rows.
+
+Per-process setup (reportlab imports, fonts, paragraph and table styles)
+happens once in `_resources()`. The chart is rendered once per
+(ticker, data version) to a PNG under `reports/.charts/` and reused by every
+later report of the same data. Tables are formatted column by column from
+NumPy arrays instead of row-by-row.
+
+`build_reports()` fans a list of tickers out to worker processes; each
+report returns a timing breakdown (load/chart/table/build ms).
+
+Usage:
+    python -m core.pdf_report AAPL MSFT [--workers 4]
+"""
+import glob
+import hashlib
+import os
+import time
+from concurrent.futures import as_completed
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+from core import parquet_store
+from core.process_pool import process_pool
+from core.store_schema import to_frame
+
+REPORT_FOLDER = "reports"
+CHART_FOLDER = os.path.join(REPORT_FOLDER, ".charts")
+TABLE_ROWS = 20
+HEADER = ["Date", "Open", "High", "Low", "Close", "Volume"]
+
+
+def report_path(ticker, folder=REPORT_FOLDER):
+    return os.path.join(folder, f"{ticker}_report.pdf")
+
+
+# ---------------- Per-process resources ---------------- #
+@lru_cache(maxsize=None)
+def _resources():
+    """Import reportlab, register fonts and build styles - once per process"""
+    import matplotlib
+    from reportlab.lib import colors
+    from reportlab.lib.styles import getSampleStyleSheet
+    from reportlab.pdfbase import pdfmetrics
+    from reportlab.pdfbase.ttfonts import TTFont
+    from reportlab.platypus import TableStyle
+
+    font, bold = "Helvetica", "Helvetica-Bold"
+    # DejaVu ships with matplotlib and covers far more glyphs than Helvetica
+    font_dir = os.path.join(matplotlib.get_data_path(), "fonts", "ttf")
+    try:
+        pdfmetrics.registerFont(TTFont("DejaVuSans", os.path.join(font_dir, "DejaVuSans.ttf")))
+        pdfmetrics.registerFont(TTFont("DejaVuSans-Bold", os.path.join(font_dir, "DejaVuSans-Bold.ttf")))
+        font, bold = "DejaVuSans", "DejaVuSans-Bold"
+    except Exception as e:
+        print(f"⚠️ PDF fonts unavailable, using Helvetica: {e}")
+
+    styles = getSampleStyleSheet()
+    for name in ("Title", "Heading2"):
+        styles[name].fontName = bold
+    styles["Normal"].fontName = font
+
+    table_style = TableStyle([
+        ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor("#3b82f6")),
+        ("TEXTCOLOR", (0, 0), (-1, 0), colors.whitesmoke),
+        ("ALIGN", (0, 0), (-1, -1), "CENTER"),
+        ("FONTNAME", (0, 0), (-1, 0), bold),
+        ("FONTNAME", (0, 1), (-1, -1), font),
+        ("FONTSIZE", (0, 0), (-1, 0), 10),
+        ("BOTTOMPADDING", (0, 0), (-1, 0), 12),
+        ("GRID", (0, 0), (-1, -1), 1, colors.black),
+    ])
+    return styles, table_style
+
+
+# ---------------- Data ---------------- #
+def _columns(df):
+    """Date plus OHLCV as NumPy arrays, whether Date is a column or the index"""
+    dates = df["Date"] if "Date" in df else df.index
+    cols = {"Date": pd.to_datetime(dates).to_numpy(dtype="datetime64[s]")}
+    for name in HEADER[1:]:
+        cols[name] = df[name].to_numpy(dtype="float64") if name in df else np.full(len(df), np.nan)
+    return cols
+
+
+def _fingerprint(cols):
+    """Stand-in version for data that did not come from the store.
+
+    Hashes every column in full, so a refetch that revises older bars
+    (split/dividend adjustments) gets a new chart.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for name in HEADER:
+        digest.update(np.ascontiguousarray(cols[name]).tobytes())
+    return f"d{digest.hexdigest()}"
+
+
+def _stats(cols):
+    close = cols["Close"]
+    return {
+        "avg": float(np.nanmean(close)), "min": float(np.nanmin(close)),
+        "max": float(np.nanmax(close)), "volume": int(np.nansum(cols["Volume"])),
+    }
+
+
+def table_rows(cols, rows=TABLE_ROWS):
+    """Header + the last `rows` rows, formatted a column at a time"""
+    tail = {name: values[-rows:] for name, values in cols.items()}
+    volume = np.nan_to_num(tail["Volume"]).astype("int64")
+    columns = [
+        np.datetime_as_string(tail["Date"], unit="D"),
+        *(np.char.mod("$%.2f", tail[name]) for name in ("Open", "High", "Low", "Close")),
+        np.array([f"{v:,}" for v in volume.tolist()]),
+    ]
+    return [HEADER] + np.column_stack(columns).tolist()
+
+
+# ---------------- Chart raster cache ---------------- #
+def chart_png(ticker, version, cols, folder=CHART_FOLDER):
+    """PNG of close and volume for this data version; rendered only on a miss.
+
+    Returns `(path, cached)`.
+    """
+    path = os.path.join(folder, f"{ticker}_{version}.png")
+    if os.path.exists(path):
+        return path, True
+
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    os.makedirs(folder, exist_ok=True)
+    fig = Figure(figsize=(7, 3.4), dpi=110)
+    FigureCanvasAgg(fig)
+    ax, ax_vol = fig.subplots(2, 1, sharex=True, gridspec_kw={"height_ratios": [3, 1]})
+    dates, close = cols["Date"], cols["Close"]
+    ax.plot(dates, close, color="#3b82f6", linewidth=1.2)
+    ax.fill_between(dates, close, np.nanmin(close), color="#3b82f6", alpha=0.1)
+    ax.set_title(f"{ticker} close", fontsize=10, loc="left")
+    ax.grid(True, alpha=0.3, linestyle="--")
+    # One filled step artist instead of a bar per day
+    ax_vol.fill_between(dates, np.nan_to_num(cols["Volume"]), step="mid", color="#64748b", alpha=0.6)
+    ax_vol.set_yticks([])
+    fig.tight_layout()
+
+    tmp = f"{path}.tmp.png"
+    fig.savefig(tmp)
+    os.replace(tmp, path)
+    # Older versions of this ticker's chart are dead weight
+    for old in glob.glob(os.path.join(folder, f"{ticker}_*.png")):
+        if old != path:
+            try:
+                os.remove(old)
+            except OSError:
+                pass
+    return path, False
+
+
+# ---------------- Reports ---------------- #
+def build_report(ticker, df=None, path=None, version=None, folder=REPORT_FOLDER):
+    """Write one PDF report. Without `df` the ticker is read from the store.
+
+    Returns the timing breakdown in milliseconds plus the output path.
+    """
+    t0 = time.perf_counter()
+    styles, table_style = _resources()
+    from reportlab.lib.units import inch
+    from reportlab.platypus import Image, Paragraph, SimpleDocTemplate, Spacer, Table
+
+    if df is None:
+        table, version = parquet_store.read_table(ticker)
+        df = to_frame(table)
+    cols = _columns(df.dropna(subset=["Close"]))
+    if version is None:
+        version = _fingerprint(cols)
+    stats = _stats(cols)
+    t_load = time.perf_counter()
+
+    chart, cached = chart_png(ticker, version, cols)
+    t_chart = time.perf_counter()
+
+    data = table_rows(cols)
+    t_table = time.perf_counter()
+
+    path = path or report_path(ticker, folder)
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    story = [
+        Paragraph(f"Stock Report for {ticker}", styles["Title"]),
+        Spacer(1, 12),
+        Paragraph(f"Average Price: ${stats['avg']:.2f}", styles["Normal"]),
+        Paragraph(f"Minimum Price: ${stats['min']:.2f}", styles["Normal"]),
+        Paragraph(f"Maximum Price: ${stats['max']:.2f}", styles["Normal"]),
+        Paragraph(f"Total Volume: {stats['volume']:,}", styles["Normal"]),
+        Spacer(1, 12),
+        Image(chart, width=7 * inch, height=3.4 * inch),
+        Spacer(1, 12),
+        Table(data, style=table_style, repeatRows=1),
+    ]
+    SimpleDocTemplate(path).build(story)
+    t_end = time.perf_counter()
+
+    return {
+        "ticker": ticker, "path": path, "version": version, "chart_cached": cached,
+        "load_ms": (t_load - t0) * 1000, "chart_ms": (t_chart - t_load) * 1000,
+        "table_ms": (t_table - t_chart) * 1000, "build_ms": (t_end - t_table) * 1000,
+        "total_ms": (t_end - t0) * 1000,
+    }
+
+
+def _build_stored(ticker, folder):
+    # Runs in a worker process; fonts/styles are set up once per process
+    return build_report(ticker, folder=folder)
+
+
+def build_reports(tickers=None, max_workers=None, folder=REPORT_FOLDER, progress=None):
+    """PDFs for many stored tickers in parallel processes.
+
+    `progress(done, total, result)` is called as each report finishes.
+    Returns a summary with per-report timings.
+    """
+    tickers = list(tickers) if tickers is not None else parquet_store.tickers()
+    max_workers = max_workers or min(len(tickers), os.cpu_count() or 1) or 1
+    t0 = time.perf_counter()
+    results = []
+    with process_pool(max_workers) as pool:
+        futures = {pool.submit(_build_stored, ticker, folder): ticker for ticker in tickers}
+        for done, future in enumerate(as_completed(futures), 1):
+            try:
+                result = future.result()
+            except Exception as e:
+                result = {"ticker": futures[future], "error": str(e)}
+            results.append(result)
+            if progress:
+                progress(done, len(tickers), result)
+
+    ok = [r for r in results if "error" not in r]
+    return {
+        "format": "pdf", "folder": folder, "tickers": len(tickers),
+        "exported": len(ok), "failed": len(results) - len(ok),
+        "seconds": time.perf_counter() - t0,
+        "charts_cached": sum(r["chart_cached"] for r in ok),
+        "results": sorted(results, key=lambda r: r["ticker"]),
+    }
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Build PDF reports from the local store")
+    parser.add_argument("tickers", nargs="*", help="default: every stored ticker")
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+
+    summary = build_reports(args.tickers or None, args.workers)
+    for r in summary["results"]:
+        if "error" in r:
+            print(f"⚠️ {r['ticker']}: {r['error']}")
+        else:
+            print(f"📄 {r['ticker']}: {r['total_ms']:.0f} ms (load {r['load_ms']:.0f}, "
+                  f"chart {r['chart_ms']:.0f}{' cached' if r['chart_cached'] else ''}, "
+                  f"table {r['table_ms']:.0f}, build {r['build_ms']:.0f})")
+    print(f"✅ {summary['exported']}/{summary['tickers']} reports in {summary['seconds']:.2f}s")
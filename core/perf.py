@@ -0,0 +1,240 @@
+# core/perf.py
+"""
+Span timers and counters for the dashboard's hot paths.
+
+Off by default. While disabled, `span()` returns one shared no-op context
+manager and `@timed` / `count()` return after a single global check, so
+the instrumented code pays next to nothing. Enable with
+STOCKDASH_PERF=1, `perf.enable()`, or the developer panel (Ctrl+Shift+P).
+
+While enabled, every span is kept in a bounded event buffer (for
+`dump_trace()`, Chrome trace JSON - open in chrome://tracing or Perfetto)
+and in a rolling window per span name (for `summary()`: p50/p95/max).
+
+`start_profile()` / `stop_profile()` wrap cProfile for a session on the
+calling (GUI) thread; pool threads are visible through their spans.
+
+    with perf.span("chart.mpf_plot", ticker=ticker):
+        mpf.plot(...)
+
+    @perf.timed("data.get_stock_data")
+    def get_stock_data(ticker): ...
+"""
+import cProfile
+import functools
+import io
+import json
+import os
+import pstats
+import threading
+import time
+from collections import defaultdict, deque
+
+import numpy as np
+
+PERF_FOLDER = os.path.join("reports", "perf")
+MAX_EVENTS = 100_000  # trace buffer; oldest events are dropped first
+WINDOW = 512  # samples per span name behind p50/p95
+
+_enabled = os.getenv("STOCKDASH_PERF") == "1"
+_lock = threading.Lock()
+_events = deque(maxlen=MAX_EVENTS)  # (name, start_ns, dur_ns, pid, tid, args)
+_samples = defaultdict(lambda: deque(maxlen=WINDOW))  # name -> durations (ms)
+_totals = defaultdict(lambda: [0, 0.0])  # name -> [count, total ms]
+_counters = defaultdict(int)
+_t0_ns = time.perf_counter_ns()
+_profiler = None
+
+
+def enabled():
+    return _enabled
+
+
+def enable(on=True):
+    global _enabled
+    _enabled = bool(on)
+
+
+# ---------------- Recording ---------------- #
+def _record(name, start_ns, dur_ns, args, pid=None, tid=None):
+    ms = dur_ns / 1e6
+    with _lock:
+        _events.append((name, start_ns, dur_ns, pid or os.getpid(), tid or threading.get_ident(), args))
+        _samples[name].append(ms)
+        totals = _totals[name]
+        totals[0] += 1
+        totals[1] += ms
+
+
+class _Span:
+    __slots__ = ("name", "args", "start")
+
+    def __init__(self, name, args):
+        self.name = name
+        self.args = args
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc):
+        end = time.perf_counter_ns()
+        _record(self.name, self.start, end - self.start, self.args)
+        return False
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+def span(name, **args):
+    """Time a block under `name`; keyword args end up in the trace event"""
+    if not _enabled:
+        return _NULL_SPAN
+    return _Span(name, args or None)
+
+
+def timed(name=None):
+    """Decorator form of `span()`, named after the function by default"""
+    def decorator(fn):
+        label = name or fn.__qualname__
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return fn(*args, **kwargs)
+            start = time.perf_counter_ns()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                _record(label, start, time.perf_counter_ns() - start, None)
+        return wrapper
+    return decorator
+
+
+def count(name, n=1):
+    if _enabled:
+        with _lock:
+            _counters[name] += n
+
+
+def reset():
+    with _lock:
+        _events.clear()
+        _samples.clear()
+        _totals.clear()
+        _counters.clear()
+
+
+# ---------------- Worker processes ---------------- #
+def run_traced(fn, *args, **kwargs):
+    """Run `fn` in a worker process with spans on; returns `(result, events)`.
+
+    Pair with `merge()` in the parent so process-pool work shows up in the
+    same trace and summary.
+    """
+    enable()
+    reset()
+    result = fn(*args, **kwargs)
+    with _lock:
+        events = list(_events)
+    # perf_counter has no common origin across processes; rebase on wall time
+    offset = time.time_ns() - time.perf_counter_ns()
+    return result, [(e[0], e[1] + offset, *e[2:]) for e in events]
+
+
+def merge(traced):
+    """Record the events from `run_traced()` here; returns the result"""
+    result, events = traced
+    offset = time.perf_counter_ns() - time.time_ns()
+    for name, start_ns, dur_ns, pid, tid, args in events:
+        _record(name, start_ns + offset, dur_ns, args, pid, tid)
+    return result
+
+
+# ---------------- Reporting ---------------- #
+def summary():
+    """{"spans": {name: count/p50/p95/max/total ms}, "counters": {...}}"""
+    with _lock:
+        windows = {name: np.fromiter(s, dtype="float64") for name, s in _samples.items()}
+        totals = {name: tuple(t) for name, t in _totals.items()}
+        counters = dict(_counters)
+    spans = {}
+    for name, window in sorted(windows.items()):
+        if not len(window):
+            continue
+        p50, p95 = np.percentile(window, [50, 95])
+        spans[name] = {
+            "count": totals[name][0], "p50_ms": float(p50), "p95_ms": float(p95),
+            "max_ms": float(window.max()), "total_ms": totals[name][1],
+        }
+    return {"spans": spans, "counters": counters}
+
+
+def trace_events():
+    """Buffered spans as Chrome trace-event dicts ("X" complete events)"""
+    with _lock:
+        events = list(_events)
+    return [
+        {
+            "name": name, "cat": name.split(".", 1)[0], "ph": "X",
+            "ts": (start_ns - _t0_ns) / 1000, "dur": dur_ns / 1000,
+            "pid": pid, "tid": tid, **({"args": args} if args else {}),
+        }
+        for name, start_ns, dur_ns, pid, tid, args in events
+    ]
+
+
+def dump_trace(path=None):
+    """Write Chrome trace JSON (events plus the summary); returns the path"""
+    path = path or os.path.join(PERF_FOLDER, f"trace-{time.strftime('%Y%m%d-%H%M%S')}.json")
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    payload = {
+        "traceEvents": trace_events(),
+        "displayTimeUnit": "ms",
+        "otherData": summary(),
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(payload, f, default=str)
+    return path
+
+
+# ---------------- cProfile ---------------- #
+def profiling():
+    return _profiler is not None
+
+
+def start_profile():
+    global _profiler
+    if _profiler is None:
+        _profiler = cProfile.Profile()
+        _profiler.enable()
+
+
+def stop_profile(folder=PERF_FOLDER, top=40):
+    """Stop the session; writes `.prof` plus a cumulative-time text report.
+
+    Returns the `.prof` path, or None if no session was running.
+    """
+    global _profiler
+    if _profiler is None:
+        return None
+    profiler, _profiler = _profiler, None
+    profiler.disable()
+    os.makedirs(folder, exist_ok=True)
+    path = os.path.join(folder, f"profile-{time.strftime('%Y%m%d-%H%M%S')}.prof")
+    profiler.dump_stats(path)
+    text = io.StringIO()
+    pstats.Stats(profiler, stream=text).sort_stats("cumulative").print_stats(top)
+    with open(path[:-5] + ".txt", "w", encoding="utf-8") as f:
+        f.write(text.getvalue())
+    return path
@@ -0,0 +1,158 @@
+# core/prefetch.py
+"""
+Bookkeeping for warming likely-next tickers: which ones, how much, and
+what was warmed.
+
+- `load_recent()` / `note_viewed()` keep the recently viewed tickers next
+  to the parquet store, most recent first.
+- `candidates()` ranks recent, watchlist and stored tickers in that order.
+- `Budget` caps network calls per rolling window and CPU seconds per round.
+- `PrefetchCache` holds finished loads - the snapshot plus fundamentals,
+  details and news - until the user asks for the ticker or they expire.
+  An entry whose parquet store was written since is dropped, so a hit is
+  never older than what a fresh load would read from disk.
+"""
+import json
+import os
+import threading
+import time
+from collections import OrderedDict, deque
+
+from core import parquet_store
+
+RECENT_PATH = os.path.join(parquet_store.STORE_FOLDER, "recent.json")
+MAX_RECENT = 20
+
+# Network calls behind one prefetched ticker: history, fundamentals, details, news
+CALLS_PER_TICKER = 4
+
+
+# ---------------- Recently viewed ---------------- #
+def load_recent(path=RECENT_PATH):
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return [str(s).upper() for s in json.load(f)][:MAX_RECENT]
+    except FileNotFoundError:
+        return []
+    except (OSError, ValueError) as e:
+        print(f"⚠️ Could not read recent tickers: {e}")
+        return []
+
+
+def note_viewed(recent, ticker, path=RECENT_PATH):
+    """Move `ticker` to the front of `recent` (in place) and persist it"""
+    ticker = ticker.upper().strip()
+    if ticker in recent:
+        recent.remove(ticker)
+    recent.insert(0, ticker)
+    del recent[MAX_RECENT:]
+    try:
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        tmp = f"{path}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(recent, f)
+        os.replace(tmp, path)
+    except OSError as e:
+        print(f"⚠️ Could not save recent tickers: {e}")
+    return recent
+
+
+def candidates(recent, watchlist, stored, exclude=(), limit=4):
+    """Likely-next tickers: recent first, then watchlist, then the local store"""
+    seen = {t.upper() for t in exclude}
+    picked = []
+    for source in (recent, watchlist, stored):
+        for ticker in source:
+            ticker = ticker.upper()
+            if ticker not in seen:
+                seen.add(ticker)
+                picked.append(ticker)
+                if len(picked) >= limit:
+                    return picked
+    return picked
+
+
+# ---------------- Budget ---------------- #
+class Budget:
+    """Network calls per rolling window plus CPU seconds per prefetch round"""
+
+    def __init__(self, max_calls=24, window_s=600, cpu_s_per_round=2.0):
+        self.max_calls = max_calls
+        self.window_s = window_s
+        self.cpu_s_per_round = cpu_s_per_round
+        self._calls = deque()
+        self._lock = threading.Lock()
+
+    def _trim(self, now):
+        while self._calls and now - self._calls[0] > self.window_s:
+            self._calls.popleft()
+
+    def take_calls(self, n):
+        """Reserve `n` network calls; False (nothing reserved) if over budget"""
+        now = time.monotonic()
+        with self._lock:
+            self._trim(now)
+            if len(self._calls) + n > self.max_calls:
+                return False
+            self._calls.extend([now] * n)
+            return True
+
+    def calls_left(self):
+        with self._lock:
+            self._trim(time.monotonic())
+            return self.max_calls - len(self._calls)
+
+    def round_clock(self):
+        """A callable telling whether this round still has CPU time left"""
+        start = time.thread_time()
+        return lambda: time.thread_time() - start < self.cpu_s_per_round
+
+
+# ---------------- Warm results ---------------- #
+class PrefetchCache:
+    """Small LRU of prefetched loads, keyed by ticker, with a freshness TTL"""
+
+    def __init__(self, max_entries=6, ttl_s=300):
+        self.max_entries = max_entries
+        self.ttl_s = ttl_s
+        self._entries = OrderedDict()  # ticker -> (stored_at, result)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def put(self, ticker, result):
+        with self._lock:
+            self._entries[ticker] = (time.monotonic(), result)
+            self._entries.move_to_end(ticker)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def _fresh(self, ticker, entry):
+        stored_at, result = entry
+        return (
+            time.monotonic() - stored_at < self.ttl_s
+            and result[0].store_version == parquet_store.store_version(ticker)
+        )
+
+    def warm(self, ticker):
+        with self._lock:
+            entry = self._entries.get(ticker)
+        return entry is not None and self._fresh(ticker, entry)
+
+    def take(self, ticker):
+        """The prefetched (snapshot, fundamentals, details, news), or None"""
+        with self._lock:
+            entry = self._entries.pop(ticker, None)
+        if entry is None or not self._fresh(ticker, entry):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return entry[1]
+
+    def tickers(self):
+        with self._lock:
+            return list(self._entries)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
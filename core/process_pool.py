@@ -0,0 +1,15 @@
+# core/process_pool.py
+"""
+Process pools for CPU-heavy jobs: forecasts (scheduler, CLI) and PDF reports.
+
+Every pool uses the spawn start method. The dashboard and the CLI run Qt,
+live-feed and writer threads, and a forked child can inherit a lock that one
+of those threads held at fork time and deadlock on it.
+"""
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+
+def process_pool(max_workers=None):
+    """A ProcessPoolExecutor whose workers start as clean interpreters"""
+    return ProcessPoolExecutor(max_workers, mp_context=multiprocessing.get_context("spawn"))
@@ -0,0 +1,399 @@
+# core/providers.py
+"""
+Where market data comes from.
+
+Everything that used to call yfinance directly - history downloads, company
+info, news, the RSS headlines and the live price stream - goes through the
+process-wide provider returned by `get_provider()`:
+
+- `YFinanceProvider` talks to Yahoo (the default).
+- `LocalProvider` serves the same calls from files with no network at all:
+  history from `{folder}/{TICKER}.parquet` (or `.csv`), info and news from
+  `{folder}/offline/info|news/{TICKER}.json`, and live ticks simulated as a
+  random walk from the last close. Tickers with no local history get a
+  deterministic synthetic series (seeded by the symbol), so any ticker
+  loads the same way on every run; those frames carry
+  `attrs["synthetic"] = True`. `add_history()` / `add_info()` /
+  `add_news()` register in-memory data for tests and benchmarks.
+
+Pick one with STOCKDASH_PROVIDER=local|yfinance, or `set_provider()`.
+Offline providers have `online = False`; the data handler then serves their
+history as-is without writing it into the parquet store, and skips the
+persistent info cache, since local data is already instant.
+"""
+import asyncio
+import json
+from abc import ABC, abstractmethod
+import os
+import threading
+import time
+import zlib
+
+import numpy as np
+import pandas as pd
+
+from core import parquet_store
+from core.store_schema import OHLCV_COLUMNS
+
+YAHOO_STREAM_URL = "wss://streamer.finance.yahoo.com/?version=2"
+YAHOO_RSS_URL = "https://feeds.finance.yahoo.com/rss/2.0/headline?s={ticker}&region=US&lang=en-US"
+
+# Business days only reach back ~250 years; longer series use minute bars
+DAILY_MAX_BARS = 20_000
+# Trading days per yfinance period unit ("6mo" -> 126 daily bars)
+_PERIOD_DAYS = {"d": 1, "wk": 5, "mo": 21, "y": 252}
+
+
+def synthetic_ohlcv(bars, seed=7, freq=None):
+    """Geometric random walk with consistent OHLC and volume, oldest first"""
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, bars)))
+    open_ = close * (1 + rng.normal(0, 0.003, bars))
+    high = np.maximum(open_, close) * (1 + rng.random(bars) * 0.01)
+    low = np.minimum(open_, close) * (1 - rng.random(bars) * 0.01)
+    freq = freq or ("B" if bars <= DAILY_MAX_BARS else "min")
+    if freq == "B":
+        dates = pd.bdate_range(end=pd.Timestamp.today().normalize(), periods=bars)
+    else:
+        dates = pd.date_range(end=pd.Timestamp.today().floor(freq), periods=bars, freq=freq)
+    return pd.DataFrame({
+        "Date": dates,
+        "Open": open_, "High": high, "Low": low, "Close": close,
+        "Volume": rng.integers(1_000_000, 50_000_000, bars).astype("float64"),
+    })
+
+
+def period_bars(period):
+    """Daily bars in a yfinance period string; None for "max" """
+    if period == "max":
+        return None
+    for unit in sorted(_PERIOD_DAYS, key=len, reverse=True):
+        if period.endswith(unit) and period[:-len(unit)].isdigit():
+            return int(period[:-len(unit)]) * _PERIOD_DAYS[unit]
+    raise ValueError(f"Unknown period: {period}")
+
+
+class DataProvider(ABC):
+    """The calls the app makes for market data; subclasses implement them all"""
+    name = "base"
+    online = True
+
+    @abstractmethod
+    def history(self, ticker, period="6mo"):
+        """Daily OHLCV with a Date column, oldest first; empty if unknown"""
+
+    @abstractmethod
+    def info(self, ticker):
+        """yfinance-style info dict (longName, currentPrice, marketCap, ...)"""
+
+    @abstractmethod
+    def news(self, ticker, count=10, tab="news"):
+        """[{title, link, publisher, summary, thumbnail}]"""
+
+    @abstractmethod
+    def live_news(self, ticker, limit=10):
+        """[{title, link, summary, published, publisher}] for the live panel"""
+
+    @abstractmethod
+    def live_socket(self):
+        """An AsyncWebSocket-like connection for LiveFeedService, or None"""
+
+
+# ---------------- Yahoo ---------------- #
+class YFinanceProvider(DataProvider):
+    name = "yfinance"
+
+    def history(self, ticker, period="6mo"):
+        import yfinance as yf
+
+        df = yf.download(ticker, period=period, group_by="ticker", progress=False)
+        if df.empty:
+            return pd.DataFrame(columns=OHLCV_COLUMNS)
+
+        # Flatten if MultiIndex
+        if isinstance(df.columns, pd.MultiIndex):
+            df.columns = [col[1] for col in df.columns]
+
+        df.reset_index(inplace=True)
+        df["Date"] = pd.to_datetime(df["Date"], errors="coerce")
+        # Keep only required columns
+        return df[OHLCV_COLUMNS]
+
+    def info(self, ticker):
+        import yfinance as yf
+        return yf.Ticker(ticker).info
+
+    def news(self, ticker, count=10, tab="news"):
+        import yfinance as yf
+
+        raw_news = yf.Ticker(ticker).get_news(count=count, tab=tab)
+        news_items = []
+        for item in raw_news:
+            content = item.get("content", {})
+            provider = content.get("provider", {})
+            canonical_url = content.get("canonicalUrl", {})
+            thumbnail_data = content.get("thumbnail", {})
+
+            title = content.get("title", "No Title")
+            link = canonical_url.get("url", "")
+            publisher = provider.get("displayName", "Unknown")
+            summary = content.get("summary", "")
+
+            thumbnail_url = ""
+            if thumbnail_data:
+                resolutions = thumbnail_data.get("resolutions", [])
+                if resolutions:
+                    thumbnail_url = resolutions[0].get("url", "")
+
+            news_items.append({
+                "title": title,
+                "link": link,
+                "publisher": publisher,
+                "summary": summary,
+                "thumbnail": thumbnail_url,
+            })
+        return news_items
+
+    def live_news(self, ticker, limit=10):
+        import feedparser
+
+        feed = feedparser.parse(YAHOO_RSS_URL.format(ticker=ticker))
+        if not feed or not hasattr(feed, "entries"):
+            print(f"⚠️ No feed data received for {ticker}")
+            return []
+        return [{
+            "title": entry.get("title", "No title"),
+            "link": entry.get("link", ""),
+            "summary": entry.get("summary", ""),
+            "published": entry.get("published", ""),
+            "publisher": "Yahoo Finance",
+        } for entry in feed.entries[:limit]]
+
+    def live_socket(self):
+        try:
+            from yfinance import AsyncWebSocket
+        except ImportError:
+            # AsyncWebSocket not available in this yfinance version
+            return None
+        return AsyncWebSocket(url=YAHOO_STREAM_URL, verbose=False)
+
+
+# ---------------- Local files ---------------- #
+class LocalProvider(DataProvider):
+    """Serves every call from local files (or synthetic data), never the network"""
+    name = "local"
+    online = False
+
+    SYNTHETIC_BARS = 756  # three years of daily bars
+
+    def __init__(self, folder=parquet_store.STORE_FOLDER, synthetic=True, tick_interval=1.0):
+        self.folder = folder
+        self.synthetic = synthetic
+        self.tick_interval = tick_interval
+        self._history = {}
+        self._info = {}
+        self._news = {}
+        self._lock = threading.Lock()
+
+    # In-memory data wins over files; handy for tests and benchmarks
+    def add_history(self, ticker, df):
+        with self._lock:
+            self._history[ticker.upper()] = df
+
+    def add_info(self, ticker, info):
+        with self._lock:
+            self._info[ticker.upper()] = dict(info)
+
+    def add_news(self, ticker, items):
+        with self._lock:
+            self._news[ticker.upper()] = list(items)
+
+    def _read_json(self, kind, ticker):
+        path = os.path.join(self.folder, "offline", kind, f"{ticker}.json")
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+
+    def _full_history(self, ticker):
+        with self._lock:
+            df = self._history.get(ticker)
+        if df is not None:
+            return df
+
+        if os.path.abspath(self.folder) == os.path.abspath(parquet_store.STORE_FOLDER):
+            # The app's own store: reuse the shared memory-mapped view, and
+            # read it again next time so a refreshed store is seen
+            if parquet_store.exists(ticker):
+                from core.history_cache import get_history
+                return get_history(ticker)[OHLCV_COLUMNS]
+        else:
+            path = os.path.join(self.folder, ticker)
+            if os.path.exists(f"{path}.parquet"):
+                df = pd.read_parquet(f"{path}.parquet")
+            elif os.path.exists(f"{path}.csv"):
+                df = pd.read_csv(f"{path}.csv", parse_dates=["Date"])
+            if df is not None and "Date" not in df.columns:
+                df = df.reset_index()
+
+        synthetic = df is None and self.synthetic
+        if synthetic:
+            df = synthetic_ohlcv(self.SYNTHETIC_BARS, seed=zlib.crc32(ticker.encode()))
+        if df is None:
+            return pd.DataFrame(columns=OHLCV_COLUMNS)
+        df = df[OHLCV_COLUMNS]
+        # Made-up prices must never be saved as the ticker's history
+        df.attrs["synthetic"] = synthetic
+        with self._lock:
+            return self._history.setdefault(ticker, df)
+
+    def history(self, ticker, period="6mo"):
+        df = self._full_history(ticker.upper())
+        bars = period_bars(period)
+        return df if bars is None else df.tail(bars).reset_index(drop=True)
+
+    def info(self, ticker):
+        ticker = ticker.upper()
+        with self._lock:
+            info = self._info.get(ticker)
+        if info is None:
+            info = self._read_json("info", ticker)
+        if info is not None:
+            return dict(info)
+
+        # Nothing on disk: what the history itself can tell
+        year = self.history(ticker, "1y")
+        if year.empty:
+            return {"symbol": ticker}
+        return {
+            "symbol": ticker,
+            "longName": self._name(ticker),
+            "currentPrice": round(float(year["Close"].iloc[-1]), 4),
+            "fiftyTwoWeekHigh": round(float(year["High"].max()), 4),
+            "fiftyTwoWeekLow": round(float(year["Low"].min()), 4),
+            "volume": int(year["Volume"].iloc[-1]),
+            "averageVolume": int(year["Volume"].mean()),
+        }
+
+    @staticmethod
+    def _name(ticker):
+        from core.symbols import symbol_index
+
+        for match in symbol_index().search(ticker, limit=1):
+            if match.symbol == ticker and match.name:
+                return match.name
+        return ticker
+
+    def news(self, ticker, count=10, tab="news"):
+        ticker = ticker.upper()
+        with self._lock:
+            items = self._news.get(ticker)
+        if items is None:
+            items = self._read_json("news", ticker) or []
+        return [{
+            "title": item.get("title", "No Title"),
+            "link": item.get("link", ""),
+            "publisher": item.get("publisher", "Unknown"),
+            "summary": item.get("summary", ""),
+            "thumbnail": item.get("thumbnail", ""),
+            **({"published": item["published"]} if "published" in item else {}),
+        } for item in items[:count]]
+
+    def live_news(self, ticker, limit=10):
+        return [{"published": "", **item} for item in self.news(ticker, count=limit)]
+
+    def last_close(self, ticker):
+        recent = self.history(ticker, "5d")
+        return float(recent["Close"].iloc[-1]) if not recent.empty else None
+
+    def live_socket(self):
+        return SimulatedSocket(self.last_close, interval=self.tick_interval)
+
+
+class SimulatedSocket:
+    """AsyncWebSocket stand-in that makes up ticks for subscribed symbols.
+
+    Every `interval` seconds each subscribed symbol moves a small random step
+    from its last close and a message shaped like Yahoo's decoded feed
+    ({"id", "price", "time" in ms, "day_volume"}) is delivered. Each symbol's
+    walk is seeded by its name, so a session is reproducible.
+    """
+
+    def __init__(self, last_close, interval=1.0, volatility=0.0005):
+        self.last_close = last_close  # ticker -> float or None
+        self.interval = interval
+        self.volatility = volatility
+        self.subscribed = set()
+        self.closed = False
+        self.delivered = 0
+        self._walks = {}  # symbol -> [rng, price, day_volume]
+
+    async def subscribe(self, symbols):
+        self.subscribed.update([symbols] if isinstance(symbols, str) else symbols)
+
+    async def unsubscribe(self, symbols):
+        self.subscribed.difference_update([symbols] if isinstance(symbols, str) else symbols)
+
+    def _tick(self, symbol):
+        walk = self._walks.get(symbol)
+        if walk is None:
+            price = self.last_close(symbol)
+            if price is None:
+                return None
+            rng = np.random.default_rng(zlib.crc32(symbol.encode()))
+            walk = self._walks[symbol] = [rng, price, 0]
+        rng = walk[0]
+        walk[1] *= 1 + rng.normal(0, self.volatility)
+        walk[2] += int(rng.integers(100, 5_000))
+        return {
+            "id": symbol,
+            "price": round(walk[1], 4),
+            "time": int(time.time() * 1000),
+            "day_volume": walk[2],
+        }
+
+    async def listen(self, message_handler):
+        while not self.closed:
+            await asyncio.sleep(self.interval)
+            for symbol in sorted(self.subscribed):
+                message = self._tick(symbol)
+                if message is None or self.closed:
+                    continue
+                result = message_handler(message)
+                if asyncio.iscoroutine(result):
+                    await result
+                self.delivered += 1
+
+    async def close(self):
+        self.closed = True
+
+
+# ---------------- Selection ---------------- #
+PROVIDERS = {"yfinance": YFinanceProvider, "local": LocalProvider}
+
+_provider = None
+_provider_lock = threading.Lock()
+
+
+def get_provider():
+    """The process-wide provider; STOCKDASH_PROVIDER picks it on first use"""
+    global _provider
+    with _provider_lock:
+        if _provider is None:
+            name = os.getenv("STOCKDASH_PROVIDER", "yfinance").lower()
+            if name not in PROVIDERS:
+                print(f"⚠️ Unknown STOCKDASH_PROVIDER '{name}', using yfinance")
+                name = "yfinance"
+            _provider = PROVIDERS[name]()
+            if not _provider.online:
+                print(f"📴 Offline: market data served by the {_provider.name} provider")
+        return _provider
+
+
+def set_provider(provider):
+    """Swap the provider (e.g. `LocalProvider()` for tests); returns the old one"""
+    global _provider
+    with _provider_lock:
+        previous, _provider = _provider, provider
+    return previous
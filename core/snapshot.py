@@ -0,0 +1,148 @@
+# core/snapshot.py
+"""
+Immutable, versioned market data handed from the DataWorker to every consumer.
+
+A `MarketSnapshot` owns read-only NumPy columns plus a DatetimeIndex. It is
+built once at the loader boundary (a column is copied only if someone else
+could still write to it; the read-only history-cache buffers are reused)
+and then shared as-is by the chart, forecast, AI report, reports page and
+exports, on any thread, without locks or defensive copies: a stray in-place
+write raises instead of silently changing what another consumer sees.
+
+`frame()` returns a fresh, Date-indexed DataFrame over the same buffers, so
+consumers can still add or replace columns on their own frame. `derive()`
+memoizes values computed from the snapshot, once per snapshot; the
+indicator columns declared in `core.derived` (`SMA_20`, `RSI_14`, `MACD`,
+...) go through it on first `snapshot[name]`. `append()` returns a new
+snapshot, so derived values are never carried past new bars.
+
+Every snapshot gets a process-wide increasing `version`, so caches can key
+on `(ticker, version)` instead of hashing data.
+"""
+import itertools
+import threading
+
+import numpy as np
+import pandas as pd
+
+from core.derived import resolve
+
+_versions = itertools.count(1)
+
+
+def _read_only(values):
+    array = np.asarray(values)
+    if array.flags.writeable:
+        array = array.copy()  # someone may still hold a writable alias
+        array.flags.writeable = False
+    return array
+
+
+class MarketSnapshot:
+    __slots__ = ("ticker", "version", "store_version", "index", "_columns", "_derived", "_lock")
+
+    def __init__(self, ticker, index, columns, store_version=None, version=None):
+        self.ticker = ticker
+        self.version = version or next(_versions)
+        self.store_version = store_version
+        # Always ns: the store hands out seconds, but pandas, Prophet and every
+        # Date-aligned join downstream assume the default unit
+        self.index = pd.DatetimeIndex(index, name="Date").as_unit("ns")
+        self._columns = {name: _read_only(values) for name, values in columns.items()}
+        self._derived = {}
+        self._lock = threading.RLock()  # derived columns may read other derived columns
+
+    @classmethod
+    def from_frame(cls, ticker, df, store_version=None):
+        """Snapshot of an OHLCV frame with Date as a column or as the index"""
+        index = pd.to_datetime(df["Date"] if "Date" in df.columns else df.index)
+        columns = {name: df[name].to_numpy() for name in df.columns if name != "Date"}
+        return cls(ticker, index, columns, store_version)
+
+    # ---------------- Read access ---------------- #
+    @property
+    def columns(self):
+        return tuple(self._columns)
+
+    def __len__(self):
+        return len(self.index)
+
+    def __contains__(self, name):
+        return name in self._columns
+
+    def __getitem__(self, name):
+        """A read-only column array, base or derived (computed on first access)"""
+        try:
+            return self._columns[name]
+        except KeyError:
+            return self.derive(name, resolve(name))
+
+    @property
+    def empty(self):
+        return len(self.index) == 0
+
+    def last(self, name):
+        values = self[name]
+        return float(values[-1]) if len(values) else float("nan")
+
+    def frame(self, columns=None):
+        """A new Date-indexed DataFrame over the snapshot's buffers (no copy)"""
+        names = columns or self._columns
+        return pd.DataFrame(
+            {name: self[name] for name in names}, index=self.index, copy=False
+        )
+
+    def append(self, bars):
+        """A new snapshot with `bars` (Date column or index) after these ones"""
+        bars = MarketSnapshot.from_frame(self.ticker, bars)
+        columns = {}
+        for name, values in self._columns.items():
+            joined = np.concatenate([values, bars[name]])
+            joined.flags.writeable = False  # a fresh buffer, no need to copy it again
+            columns[name] = joined
+        return MarketSnapshot(self.ticker, self.index.append(bars.index), columns, self.store_version)
+
+    # ---------------- Derived values ---------------- #
+    def derive(self, name, compute):
+        """`compute(self)` once per snapshot; later calls return the memo.
+
+        Arrays are made read-only like the base columns.
+        """
+        try:
+            return self._derived[name]
+        except KeyError:
+            pass
+        with self._lock:
+            if name not in self._derived:
+                value = compute(self)
+                if isinstance(value, (np.ndarray, pd.Series)):
+                    # Freshly computed, so nobody else holds it: freeze in place
+                    value = np.asarray(value)
+                    value.flags.writeable = False
+                self._derived[name] = value
+            return self._derived[name]
+
+    def derived_names(self):
+        return tuple(self._derived)
+
+    # ---------------- Pickling (worker processes) ---------------- #
+    def __getstate__(self):
+        # Derived columns already computed travel along instead of being redone
+        with self._lock:
+            derived = dict(self._derived)
+        return self.ticker, self.version, self.store_version, self.index, self._columns, derived
+
+    def __setstate__(self, state):
+        ticker, version, store_version, index, columns, derived = state
+        # Unpickled arrays come back writable; re-freeze them in place
+        for values in (*columns.values(), *derived.values()):
+            if isinstance(values, np.ndarray):
+                values.flags.writeable = False
+        self.ticker, self.version, self.store_version = ticker, version, store_version
+        self.index = index
+        self._columns = columns
+        self._derived = derived
+        self._lock = threading.RLock()
+
+    def __repr__(self):
+        return f"MarketSnapshot({self.ticker!r}, v{self.version}, {len(self)} bars, {list(self._columns)})"
@@ -0,0 +1,148 @@
+# core/store_schema.py
+"""
+Compact on-disk schema for the per-ticker OHLCV parquet store.
+
+    Date    timestamp[s]                (was datetime64[ns] or "%Y-%m-%d" strings)
+    Open    float32                     (was float64)
+    High    float32
+    Low     float32
+    Close   float32
+    Volume  uint64                      (was float64 after pd.to_numeric)
+    Ticker  dictionary<int8, string>    (one entry per file, near-zero cost)
+
+Every writer goes through `write_store()`, so the schema is enforced on write
+and readers never have to re-parse dates. Readers get a plain OHLCV frame back
+with `to_frame()`: the Ticker label is dropped (it is the same on every row,
+and a categorical breaks numeric code such as `fillna(0)`) and Date comes back
+as datetime64[ns] like any other pandas timestamp. Locking, versioning and the
+one-time migration of older files live in `core.parquet_store`.
+"""
+import os
+import threading
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from core import perf
+
+SCHEMA_VERSION = 1
+PRICE_COLUMNS = ["Open", "High", "Low", "Close"]
+OHLCV_COLUMNS = ["Date"] + PRICE_COLUMNS + ["Volume"]
+
+STORE_SCHEMA = pa.schema([
+    pa.field("Date", pa.timestamp("s"), nullable=False),
+    pa.field("Open", pa.float32()),
+    pa.field("High", pa.float32()),
+    pa.field("Low", pa.float32()),
+    pa.field("Close", pa.float32()),
+    pa.field("Volume", pa.uint64()),
+    pa.field("Ticker", pa.dictionary(pa.int8(), pa.string())),
+])
+
+def normalize_frame(df, ticker):
+    """Return a new DataFrame with exactly the store columns and dtypes"""
+    out = pd.DataFrame(index=pd.RangeIndex(len(df)))
+
+    dates = pd.to_datetime(df["Date"].to_numpy() if "Date" in df.columns else df.index, errors="coerce")
+    if getattr(dates, "tz", None) is not None:
+        dates = dates.tz_localize(None)
+    out["Date"] = np.asarray(dates, dtype="datetime64[s]")
+
+    for col in PRICE_COLUMNS:
+        values = df[col] if col in df.columns else np.nan
+        prices = pd.to_numeric(pd.Series(values, index=df.index), errors="coerce")
+        out[col] = prices.to_numpy(dtype="float32", na_value=np.nan)
+
+    volume = pd.to_numeric(df["Volume"], errors="coerce") if "Volume" in df.columns else pd.Series(0, index=df.index)
+    out["Volume"] = volume.fillna(0).clip(lower=0).round().to_numpy(dtype="uint64", na_value=0)
+
+    out["Ticker"] = pd.Categorical([ticker.upper().strip()] * len(df))
+
+    out = out[out["Date"].notna()]
+    return out.sort_values("Date", kind="stable").reset_index(drop=True)
+
+
+def to_frame(table, **to_pandas_options):
+    """The stored `table` as an OHLCV DataFrame: no Ticker column, ns dates.
+
+    Only Date is converted; the price and volume columns stay zero-copy where
+    pyarrow allows it.
+    """
+    if "Ticker" in table.column_names:
+        table = table.drop_columns(["Ticker"])
+    return table.to_pandas(coerce_temporal_nanoseconds=True, **to_pandas_options)
+
+
+def to_store_table(df, ticker):
+    """Convert any OHLCV frame into a pyarrow Table matching STORE_SCHEMA"""
+    frame = normalize_frame(df, ticker)
+    return pa.Table.from_pandas(frame, schema=STORE_SCHEMA, preserve_index=False)
+
+
+def write_store(df, ticker, path):
+    """Write `df` to `path` with the compact schema.
+
+    Writes a temp file in the same folder, fsyncs it and `os.replace`s it over
+    `path`, so readers see either the old or the new file, never a torn one.
+    """
+    table = to_store_table(df, ticker)
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with perf.span("parquet.write", ticker=ticker, rows=table.num_rows):
+            with open(tmp_path, "wb") as fh:
+                pq.write_table(table, fh, compression="zstd")
+                fh.flush()
+                os.fsync(fh.fileno())
+            os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    perf.count("parquet.rows_written", table.num_rows)
+    return table
+
+
+def conforms(schema):
+    """True if `schema` only differs from STORE_SCHEMA in ways a cast fixes.
+
+    Parquet has no seconds unit and may widen dictionary indices, so a file
+    written with STORE_SCHEMA can read back as timestamp[ms] / int32 indices.
+    """
+    if schema.names != STORE_SCHEMA.names:
+        return False
+    for field, target in zip(schema, STORE_SCHEMA):
+        if field.type.equals(target.type):
+            continue
+        if pa.types.is_timestamp(field.type) and pa.types.is_timestamp(target.type) and field.type.tz is None:
+            continue
+        if pa.types.is_dictionary(field.type) and pa.types.is_string(field.type.value_type):
+            continue
+        return False
+    return True
+
+
+def conform_table(table, ticker):
+    """Return `table` in STORE_SCHEMA, casting when possible instead of rebuilding"""
+    if table.schema.remove_metadata().equals(STORE_SCHEMA):
+        return table
+    if conforms(table.schema):
+        return table.cast(STORE_SCHEMA)
+    return to_store_table(table.to_pandas(), ticker)
+
+
+def has_store_schema(path):
+    try:
+        return conforms(pq.read_schema(path))
+    except Exception:
+        return False
+
+
+def migrate_file(path, ticker=None):
+    """Rewrite one parquet file in the compact schema. Returns True if changed."""
+    if has_store_schema(path):
+        return False
+    ticker = ticker or os.path.splitext(os.path.basename(path))[0]
+    write_store(pd.read_parquet(path), ticker, path)
+    return True
@@ -0,0 +1,190 @@
+# core/symbols.py
+"""
+Local symbol index behind the ticker autocomplete.
+
+`csv_data_files/symbols.csv` (symbol, name, exchange) is loaded once into
+sorted NumPy string arrays: one of symbols and one of (name word -> row)
+pairs. A prefix lookup is two `searchsorted` calls, so completions stay
+well under a millisecond for tens of thousands of rows; drop a bigger
+listing file in place to widen the index.
+
+`search()` ranks symbols that already have local history first, then
+exact and prefix symbol matches, then company-name word prefixes, then
+symbols one or two edits away (typos past the first character).
+`check()` screens what the user typed before any network work: malformed
+input is rejected outright and an unknown symbol close to a known one
+comes back with a suggestion.
+Unknown but well-formed symbols are allowed through - no bundled list is
+complete.
+"""
+import csv
+import os
+import re
+import threading
+from typing import NamedTuple
+
+import numpy as np
+
+from core import parquet_store
+
+SYMBOLS_PATH = os.path.join(parquet_store.STORE_FOLDER, "symbols.csv")
+
+# Yahoo-style symbols: AAPL, BRK-B, RELIANCE.NS, ^GSPC, BTC-USD, EURUSD=X, GC=F
+SYMBOL_PATTERN = re.compile(r"^\^?[A-Z0-9]{1,10}([.\-][A-Z0-9]{1,5})?(=[XF])?$")
+_WORD = re.compile(r"[A-Z0-9]+")
+
+
+class Match(NamedTuple):
+    symbol: str
+    name: str
+    exchange: str
+    cached: bool
+
+
+def normalize(text):
+    return text.upper().strip()
+
+
+def _edit_distance(a, b, limit):
+    """Levenshtein distance, or limit + 1 once it is certainly above `limit`"""
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    previous = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        current = [i]
+        for j, cb in enumerate(b, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (ca != cb)))
+        if min(current) > limit:
+            return limit + 1
+        previous = current
+    return previous[-1]
+
+
+class SymbolIndex:
+    def __init__(self, rows, cached=()):
+        rows = sorted({normalize(r[0]): r for r in rows if r and r[0].strip()}.values(),
+                      key=lambda r: normalize(r[0]))
+        self.symbols = np.array([normalize(r[0]) for r in rows], dtype=str)
+        self.names = [r[1] if len(r) > 1 else "" for r in rows]
+        self.exchanges = [r[2] if len(r) > 2 else "" for r in rows]
+        self.lengths = np.char.str_len(self.symbols) if len(rows) else np.zeros(0, dtype=int)
+
+        words, owners = [], []
+        for row, name in enumerate(self.names):
+            for word in set(_WORD.findall(name.upper())):
+                words.append(word)
+                owners.append(row)
+        order = np.argsort(np.array(words, dtype=str), kind="stable")
+        self.words = np.array(words, dtype=str)[order]
+        self.word_rows = np.array(owners, dtype=np.int64)[order]
+        self.cached = {normalize(t) for t in cached}
+
+    @classmethod
+    def load(cls, path=SYMBOLS_PATH, cached=()):
+        try:
+            with open(path, "r", encoding="utf-8", newline="") as f:
+                reader = csv.reader(f)
+                next(reader, None)  # header
+                rows = list(reader)
+        except FileNotFoundError:
+            print(f"⚠️ No symbol index at {path}; autocomplete uses local tickers only")
+            rows = []
+        # Local tickers are always known, even if the listing file lacks them
+        known = {normalize(r[0]) for r in rows if r}
+        rows += [[t, "", "LOCAL"] for t in cached if normalize(t) not in known]
+        return cls(rows, cached)
+
+    def __len__(self):
+        return len(self.symbols)
+
+    def __contains__(self, symbol):
+        symbol = normalize(symbol)
+        i = np.searchsorted(self.symbols, symbol)
+        return i < len(self.symbols) and self.symbols[i] == symbol
+
+    def _match(self, row):
+        symbol = str(self.symbols[row])
+        return Match(symbol, self.names[row], self.exchanges[row], symbol in self.cached)
+
+    @staticmethod
+    def _prefix_range(array, prefix):
+        lo = np.searchsorted(array, prefix, side="left")
+        hi = np.searchsorted(array, prefix + "\uffff", side="left")
+        return lo, hi
+
+    def _fuzzy(self, query, limit):
+        """Rows within `limit` edits of `query`, closest first.
+
+        Only symbols with the same first character are scored - typos
+        rarely hit it, and it keeps the scan to one contiguous slice.
+        """
+        lo, hi = self._prefix_range(self.symbols, query[0])
+        near = lo + np.flatnonzero(np.abs(self.lengths[lo:hi] - len(query)) <= limit)
+        scored = []
+        for row in near:
+            distance = _edit_distance(query, str(self.symbols[row]), limit)
+            if distance <= limit:
+                scored.append((distance, int(row)))
+        return [row for _, row in sorted(scored)]
+
+    def search(self, text, limit=10):
+        """Best matches for what the user has typed so far"""
+        query = normalize(text)
+        if not query or not len(self.symbols):
+            return []
+        rows = []  # ordered, de-duplicated below
+
+        lo, hi = self._prefix_range(self.symbols, query)
+        rows.extend(range(lo, hi))  # exact match sorts first within the range
+
+        # Company names: rows with a word starting with every typed word
+        named = None
+        for word in query.split():
+            lo, hi = self._prefix_range(self.words, word)
+            hits = dict.fromkeys(int(r) for r in self.word_rows[lo:hi])
+            named = hits if named is None else {r: None for r in named if r in hits}
+        rows.extend(named or ())
+
+        if len(rows) < limit and SYMBOL_PATTERN.match(query):
+            rows.extend(self._fuzzy(query, 1 if len(query) <= 4 else 2))
+
+        seen, ranked = set(), []
+        for rank, row in enumerate(rows):
+            if row not in seen:
+                seen.add(row)
+                ranked.append((str(self.symbols[row]) not in self.cached, rank, row))
+        ranked.sort()
+        return [self._match(row) for _, _, row in ranked[:limit]]
+
+    def check(self, text):
+        """(ok, suggestion) for a symbol about to be loaded.
+
+        ok is False for malformed input. For an unknown symbol the closest
+        known one (if any is one or two edits away) comes back as the
+        suggestion; None otherwise.
+        """
+        symbol = normalize(text)
+        if not SYMBOL_PATTERN.match(symbol):
+            return False, None
+        if symbol in self or symbol in self.cached:
+            return True, None
+        near = self._fuzzy(symbol, 1 if len(symbol) <= 4 else 2)
+        return True, (str(self.symbols[near[0]]) if near else None)
+
+
+_index = None
+_index_lock = threading.Lock()
+
+
+def symbol_index():
+    """The process-wide index, loaded on first use"""
+    global _index
+    with _index_lock:
+        if _index is None:
+            _index = SymbolIndex.load(cached=parquet_store.tickers())
+        return _index
+
+
+def mark_cached(ticker):
+    """A ticker just got local history; rank it first from now on"""
+    symbol_index().cached.add(normalize(ticker))
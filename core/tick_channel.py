@@ -0,0 +1,96 @@
+# core/tick_channel.py
+"""
+Latest-value-wins hand-off of live ticks from the feed thread to the GUI.
+
+The feed thread `publish()`es every tick; each ticker has one slot that is
+overwritten in place, so a burst of thousands of ticks costs a few float
+updates and never queues Qt signals. The GUI `drain()`s at its own frame
+rate and gets, per ticker, the latest price plus a summary of the ticks that
+were coalesced into it since the previous drain.
+"""
+import threading
+import time
+from collections import namedtuple
+
+TickSummary = namedtuple(
+    "TickSummary", "ticker price ts count high low vwap volume day_volume"
+)
+
+
+class _Slot:
+    __slots__ = ("price", "ts", "count", "high", "low", "pv", "volume", "price_sum", "day_volume")
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.price = None
+        self.ts = 0.0
+        self.count = 0
+        self.high = float("-inf")
+        self.low = float("inf")
+        self.pv = 0.0
+        self.volume = 0.0
+        self.price_sum = 0.0
+        self.day_volume = None
+
+
+class TickChannel:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._slots = {}
+        self.published = 0
+        self.delivered = 0
+        self.drains = 0
+
+    def publish(self, ticker, price, volume=0.0, ts=None, day_volume=None):
+        """Overwrite the ticker's slot; called on the feed thread for every tick"""
+        with self._lock:
+            slot = self._slots.get(ticker)
+            if slot is None:
+                slot = self._slots[ticker] = _Slot()
+            slot.price = price
+            slot.ts = time.time() if ts is None else ts
+            slot.count += 1
+            if price > slot.high:
+                slot.high = price
+            if price < slot.low:
+                slot.low = price
+            slot.pv += price * volume
+            slot.volume += volume
+            slot.price_sum += price
+            if day_volume is not None:
+                slot.day_volume = day_volume
+            self.published += 1
+
+    def drain(self):
+        """Take everything published since the last drain: {ticker: TickSummary}"""
+        out = {}
+        with self._lock:
+            self.drains += 1
+            for ticker, slot in self._slots.items():
+                if not slot.count:
+                    continue
+                # Without volume deltas fall back to the plain mean price
+                vwap = slot.pv / slot.volume if slot.volume else slot.price_sum / slot.count
+                out[ticker] = TickSummary(
+                    ticker, slot.price, slot.ts, slot.count,
+                    slot.high, slot.low, vwap, slot.volume, slot.day_volume,
+                )
+                slot.reset()
+            self.delivered += len(out)
+        return out
+
+    def discard(self, ticker):
+        with self._lock:
+            self._slots.pop(ticker, None)
+
+    def stats(self):
+        """Ticks published vs. summaries delivered; ratio is ticks per UI update"""
+        with self._lock:
+            return {
+                "published": self.published,
+                "delivered": self.delivered,
+                "drains": self.drains,
+                "coalescing_ratio": self.published / self.delivered if self.delivered else 0.0,
+            }
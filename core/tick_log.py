@@ -0,0 +1,139 @@
+# core/tick_log.py
+"""
+Compact binary log of raw live-feed messages, for offline replay.
+
+Layout (little endian):
+
+    b"TICKLOG1"                                   file header
+    0x01  u16 symbol_id  u8 len  utf8 symbol      symbol definition
+    0x02  f64 recv_ts  u16 symbol_id  f64 price   tick
+          u16 extra_len  extra                    remaining fields, compact JSON
+
+Symbols are interned once per file, and the fields replay needs most (receive
+time, symbol, price) are fixed-width. Every other field of the message goes
+into `extra` so replay hands the handler the same dict it saw live.
+"""
+import json
+import math
+import struct
+import threading
+import time
+
+MAGIC = b"TICKLOG1"
+_SYMBOL = 0x01
+_TICK = 0x02
+
+_SYMBOL_HEAD = struct.Struct("<BHB")
+_TICK_HEAD = struct.Struct("<BdHdH")
+
+
+class TickRecorder:
+    """Thread-safe, buffered writer; call `record()` from the feed thread"""
+
+    def __init__(self, path, flush_every=256):
+        self.path = path
+        self.flush_every = flush_every
+        self._fh = open(path, "wb")
+        self._fh.write(MAGIC)
+        self._symbols = {}
+        self._pending = 0
+        self._lock = threading.Lock()
+        self.count = 0
+
+    def record(self, message, recv_ts=None):
+        symbol = message.get("id")
+        if not symbol:
+            return
+        recv_ts = time.time() if recv_ts is None else recv_ts
+        price = message.get("price", message.get("regularMarketPrice"))
+        price = float(price) if price is not None else math.nan
+        extra = {k: v for k, v in message.items() if k not in ("id", "price")}
+        extra = json.dumps(extra, separators=(",", ":"), default=str).encode() if extra else b""
+
+        with self._lock:
+            if self._fh is None:
+                return
+            symbol_id = self._symbols.get(symbol)
+            if symbol_id is None:
+                symbol_id = self._symbols[symbol] = len(self._symbols)
+                name = symbol.encode()
+                self._fh.write(_SYMBOL_HEAD.pack(_SYMBOL, symbol_id, len(name)) + name)
+            self._fh.write(_TICK_HEAD.pack(_TICK, recv_ts, symbol_id, price, len(extra)) + extra)
+            self.count += 1
+            self._pending += 1
+            if self._pending >= self.flush_every:
+                self._fh.flush()
+                self._pending = 0
+
+    def close(self):
+        with self._lock:
+            if self._fh is not None:
+                self._fh.close()
+                self._fh = None
+
+
+def read_ticks(path):
+    """Yield `(recv_ts, message)` in recorded order.
+
+    A truncated tail (the recorder died mid-write) ends the log cleanly at the
+    last complete record.
+    """
+    with open(path, "rb") as fh:
+        data = fh.read()
+    if not data.startswith(MAGIC):
+        raise ValueError(f"{path} is not a tick log")
+
+    symbols = {}
+    pos = len(MAGIC)
+    end = len(data)
+    while pos < end:
+        # A crash mid-write leaves a partial record at the tail; stop there
+        kind = data[pos]
+        if kind == _SYMBOL:
+            if pos + _SYMBOL_HEAD.size > end:
+                break
+            _, symbol_id, length = _SYMBOL_HEAD.unpack_from(data, pos)
+            pos += _SYMBOL_HEAD.size
+            if pos + length > end:
+                break
+            symbols[symbol_id] = data[pos:pos + length].decode()
+            pos += length
+        elif kind == _TICK:
+            if pos + _TICK_HEAD.size > end:
+                break
+            _, recv_ts, symbol_id, price, extra_len = _TICK_HEAD.unpack_from(data, pos)
+            pos += _TICK_HEAD.size
+            if pos + extra_len > end:
+                break
+            extra = data[pos:pos + extra_len]
+            pos += extra_len
+            message = json.loads(extra) if extra else {}
+            message["id"] = symbols[symbol_id]
+            if not math.isnan(price):
+                message["price"] = price
+            yield recv_ts, message
+        else:
+            raise ValueError(f"Corrupt tick log {path} at byte {pos}")
+
+
+def write_ticks(path, ticks):
+    """Write an iterable of `(recv_ts, message)` - handy for synthetic logs"""
+    recorder = TickRecorder(path)
+    try:
+        for recv_ts, message in ticks:
+            recorder.record(message, recv_ts)
+    finally:
+        recorder.close()
+    return recorder.count
+
+
+if __name__ == "__main__":
+    import sys
+
+    ticks = list(read_ticks(sys.argv[1]))
+    if not ticks:
+        print("📭 Empty tick log")
+    else:
+        duration = ticks[-1][0] - ticks[0][0]
+        symbols = sorted({m["id"] for _, m in ticks})
+        print(f"📼 {len(ticks):,} ticks over {duration:.1f}s for {len(symbols)} symbols: {', '.join(symbols)}")
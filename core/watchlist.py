@@ -0,0 +1,89 @@
+# core/watchlist.py
+"""
+Persistent watchlist symbols and the per-row seed values for the live table.
+
+The list lives next to the parquet store as a small JSON file. Seeds come
+from the stored daily history: last close, previous close, volume, the Wilder
+RSI averages up to the previous session (so a live price updates RSI in
+O(1)) and the recent closes drawn as a sparkline.
+"""
+import json
+import os
+
+import numpy as np
+
+from core import parquet_store
+
+WATCHLIST_PATH = os.path.join(parquet_store.STORE_FOLDER, "watchlist.json")
+RSI_PERIOD = 14
+SPARK_POINTS = 30
+
+
+def default_symbols():
+    """Tickers already in the local store"""
+    return parquet_store.tickers()
+
+
+def load_symbols(path=WATCHLIST_PATH):
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            symbols = json.load(f)
+        return [str(s).upper().strip() for s in symbols if str(s).strip()]
+    except FileNotFoundError:
+        return default_symbols()
+    except (OSError, ValueError) as e:
+        print(f"⚠️ Could not read watchlist, using defaults: {e}")
+        return default_symbols()
+
+
+def save_symbols(symbols, path=WATCHLIST_PATH):
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp = f"{path}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(list(symbols), f)
+    os.replace(tmp, path)
+
+
+def wilder_averages(closes, period=RSI_PERIOD):
+    """(avg_gain, avg_loss) after the last close, Wilder-smoothed"""
+    deltas = np.diff(np.asarray(closes, dtype="float64"))
+    if len(deltas) < period:
+        return np.nan, np.nan
+    gains = np.clip(deltas, 0, None)
+    losses = np.clip(-deltas, 0, None)
+    avg_gain = gains[:period].mean()
+    avg_loss = losses[:period].mean()
+    for g, l in zip(gains[period:], losses[period:]):
+        avg_gain = (avg_gain * (period - 1) + g) / period
+        avg_loss = (avg_loss * (period - 1) + l) / period
+    return avg_gain, avg_loss
+
+
+def live_rsi(avg_gain, avg_loss, prev_close, price, period=RSI_PERIOD):
+    """RSI with `price` as the provisional close after `prev_close`; vectorized"""
+    delta = price - prev_close
+    gain = (avg_gain * (period - 1) + np.clip(delta, 0, None)) / period
+    loss = (avg_loss * (period - 1) + np.clip(-delta, 0, None)) / period
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rsi = 100 - 100 / (1 + gain / loss)
+    return np.where(loss == 0, np.where(gain > 0, 100.0, 50.0), rsi)
+
+
+def seed_row(df, spark_points=SPARK_POINTS):
+    """Seed values for one table row from a daily history frame"""
+    df = df.dropna(subset=["Close"])
+    closes = df["Close"].to_numpy(dtype="float64")
+    if len(closes) == 0:
+        return None
+    prev_close = closes[-2] if len(closes) > 1 else closes[-1]
+    # Averages stop at the previous session; the last close is re-applied
+    # live so RSI follows the price without recomputing the series
+    avg_gain, avg_loss = wilder_averages(closes[:-1])
+    return {
+        "last": closes[-1],
+        "prev_close": prev_close,
+        "volume": float(df["Volume"].iloc[-1]),
+        "avg_gain": avg_gain,
+        "avg_loss": avg_loss,
+        "spark": closes[-spark_points:],
+    }
@@ -0,0 +1,148 @@
+# core/write_behind.py
+"""
+Write-behind persistence for live updates.
+
+Producers (the live feed thread) `submit(key, job)` instead of writing to
+disk inline. Jobs are keyed - one per live worker - and a newer submission
+for a key replaces the pending one, so however many ticks arrive between
+flushes each key is written once. A single writer thread runs the pending jobs
+every `interval` seconds, on `flush()`, and one final time on `close()`.
+
+Jobs should read the latest state when they run (e.g. drain a BarBuilder)
+rather than capture a snapshot, which is what makes merging safe.
+"""
+import threading
+import time
+from collections import OrderedDict, deque
+
+
+def _percentile(values, q):
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * q))]
+
+
+class WriteBehindQueue:
+    def __init__(self, interval=5.0, name="write-behind"):
+        self.interval = interval
+        self.name = name
+        self._cond = threading.Condition()
+        self._pending = OrderedDict()  # key -> (job, first submitted at)
+        self._thread = None
+        self._closing = False
+        self._flush_now = False
+        self._busy = False
+
+        self.submitted = 0
+        self.merged = 0
+        self.written = 0
+        self.failed = 0
+        self.max_depth = 0
+        self._flush_ms = deque(maxlen=512)  # job run time
+        self._lag_ms = deque(maxlen=512)    # first submit -> written
+
+    # ---------------- Producers ---------------- #
+    def submit(self, key, job):
+        """Queue `job` for `key`, replacing any pending job for the same key"""
+        with self._cond:
+            if self._closing and not (self._thread and self._thread.is_alive()):
+                inline = True
+            else:
+                inline = False
+                entry = self._pending.get(key)
+                if entry is not None:
+                    self._pending[key] = (job, entry[1])
+                    self.merged += 1
+                else:
+                    self._pending[key] = (job, time.monotonic())
+                self.max_depth = max(self.max_depth, len(self._pending))
+                self._ensure_thread()
+            self.submitted += 1
+        if inline:
+            # Late submissions after close() still reach the disk
+            self._run_job(key, job, time.monotonic())
+
+    def depth(self):
+        with self._cond:
+            return len(self._pending)
+
+    def flush(self, timeout=None):
+        """Write everything pending now; True once the queue is idle"""
+        with self._cond:
+            if self._thread is None or not self._thread.is_alive():
+                return not self._pending
+            self._flush_now = True
+            self._cond.notify_all()
+            return self._cond.wait_for(
+                lambda: not self._pending and not self._busy and not self._flush_now, timeout
+            )
+
+    def close(self, timeout=10.0):
+        """Final flush, then stop the writer thread. True if nothing was left behind."""
+        with self._cond:
+            self._closing = True
+            self._cond.notify_all()
+            thread = self._thread
+        if thread is not None:
+            thread.join(timeout)
+        return self.depth() == 0
+
+    def stats(self):
+        with self._cond:
+            depth = len(self._pending)
+        flush_ms, lag_ms = list(self._flush_ms), list(self._lag_ms)
+        return {
+            "depth": depth,
+            "max_depth": self.max_depth,
+            "submitted": self.submitted,
+            "merged": self.merged,
+            "written": self.written,
+            "failed": self.failed,
+            "flush_p50_ms": _percentile(flush_ms, 0.50),
+            "flush_p95_ms": _percentile(flush_ms, 0.95),
+            "flush_max_ms": max(flush_ms) if flush_ms else 0.0,
+            "lag_p95_ms": _percentile(lag_ms, 0.95),
+        }
+
+    # ---------------- Writer thread ---------------- #
+    def _ensure_thread(self):
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+            self._thread.start()
+
+    def _run_job(self, key, job, since):
+        t0 = time.monotonic()
+        try:
+            job()
+        except Exception as e:
+            self.failed += 1
+            print(f"⚠️ Write-behind flush failed for {key}: {e}")
+        else:
+            self.written += 1
+        done = time.monotonic()
+        self._flush_ms.append((done - t0) * 1000)
+        self._lag_ms.append((done - since) * 1000)
+
+    def _run(self):
+        while True:
+            with self._cond:
+                if not self._closing and not self._flush_now:
+                    self._cond.wait(self.interval)
+                batch, self._pending = self._pending, OrderedDict()
+                self._flush_now = False
+                self._busy = bool(batch)
+                closing = self._closing
+
+            for key, (job, since) in batch.items():
+                self._run_job(key, job, since)
+
+            with self._cond:
+                self._busy = False
+                self._cond.notify_all()
+                if closing and not self._pending:
+                    return
+
+
+# Shared by every live worker so there is exactly one writer thread
+write_behind = WriteBehindQueue()
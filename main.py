@@ -10,18 +10,16 @@ from PyQt5.QtWidgets import (
     QFrame,
     QLabel,
     QHBoxLayout,
+    QShortcut,
 )
-from PyQt5.QtCore import Qt, QThread, pyqtSignal, QTimer
-from PyQt5.QtGui import QFont, QCursor
-from prophet import Prophet
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Image
-from reportlab.lib.styles import getSampleStyleSheet
+from PyQt5.QtCore import Qt, QObject, pyqtSignal, QTimer
+from PyQt5.QtGui import QFont, QCursor, QKeySequence
 from dotenv import load_dotenv
 
 # core python libraries
 import sys
-import pandas as pd
 import os
+import multiprocessing
 import matplotlib
 
 matplotlib.use("Agg")  # Use non-interactive backend
@@ -29,29 +27,40 @@ import matplotlib.pyplot as plt
 
 # workers
 from workers.ai_worker import AIChatWorker
+from workers.live_feed import LiveFeedService
 from workers.live_price_worker import LivePriceWorker
 from workers.news_worker import LiveNewsWorker
 from workers.sentiment_worker import SentimentWorker
-from workers.hybrid_forecast_worker import HybridForecastWorker
 from workers.ai_report_worker import AIReportWorker
+from workers.watchlist_worker import WatchlistFeed, WatchlistSeedWorker
+from workers.export_worker import ExportWorker
+from workers.prefetcher import Prefetcher
+from workers.scheduler import BACKGROUND, INTERACTIVE, TaskScheduler
 
 # ui
 from ui.ui_main import DashboardUI
-from ui.ui_reports import ReportsUI
 
 # widgets
-from widgets.chart_widget import ChartWidget
+# NOTE: ReportsUI, SentimentWidget and ChatWidget are imported inside their
+# page factories so pyqtgraph / the reports stylesheets load on first use.
+from widgets.chart_widget import ChartWidget, render_figure
+from widgets.ticker_completer import TickerCompleter
 from widgets.news_widget import NewsWidget
 from widgets.chatbot_button import ChatbotButton
-from widgets.chat_widget import ChatWidget
-from widgets.sentiment_widget import SentimentWidget
 
 # data handlers and indicators
-from core.data_handler import get_news, get_stock_data, get_fundamentals, get_details
-from core.indicators import calculate_sma, calculate_ema
+from core import parquet_store, perf
+from core.data_handler import load_market_data
+from core.forecast import hybrid_forecast
+from core.info_cache import info_cache
+from core.symbols import mark_cached, symbol_index
+from core.tick_channel import TickChannel
+from core.tick_log import TickRecorder
+from core.watchlist import load_symbols, save_symbols
+from core.write_behind import write_behind
 
 # styles
-from styles import get_theme
+from styles import apply_app_theme
 
 
 # -------- Forecast Worker (NEW) ----------#
@@ -94,111 +103,30 @@ from styles import get_theme
 #             self.error_occurred.emit(str(e))
 
 
-# -------- Export Worker (Background file I/O) ----------#
-class ExportWorker(QThread):
-    """Background worker for CSV/PDF exports to prevent UI blocking"""
-    finished = pyqtSignal(str, str)  # (path, export_type)
-    error = pyqtSignal(str)
-
-    def __init__(self, df, ticker, export_type, avg_price=0, min_price=0, max_price=0, total_volume=0):
-        super().__init__()
-        self.df = df.copy()
-        self.ticker = ticker
-        self.export_type = export_type
-        self.avg_price = avg_price
-        self.min_price = min_price
-        self.max_price = max_price
-        self.total_volume = total_volume
-
-    def run(self):
-        try:
-            os.makedirs("reports", exist_ok=True)
-            if self.export_type == "csv":
-                path = f"reports/{self.ticker}_reports.csv"
-                self.df.to_csv(path)
-            else:  # pdf
-                path = f"reports/{self.ticker}_report.pdf"
-                self._create_pdf(path)
-            self.finished.emit(path, self.export_type)
-        except Exception as e:
-            self.error.emit(str(e))
-
-    def _create_pdf(self, path):
-        from reportlab.lib.pagesizes import letter
-        from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle
-        from reportlab.lib.styles import getSampleStyleSheet
-        from reportlab.lib import colors
-        
-        doc = SimpleDocTemplate(path)
-        styles = getSampleStyleSheet()
-        story = [
-            Paragraph(f"📈 Stock Report for {self.ticker}", styles["Title"]),
-            Spacer(1, 12),
-            Paragraph(f"💰 Average Price: ${self.avg_price:.2f}", styles["Normal"]),
-            Paragraph(f"📉 Minimum Price: ${self.min_price:.2f}", styles["Normal"]),
-            Paragraph(f"📈 Maximum Price: ${self.max_price:.2f}", styles["Normal"]),
-            Paragraph(f"📊 Total Volume: {self.total_volume:,}", styles["Normal"]),
-            Spacer(1, 12),
-        ]
-        
-        # Add data table (limited rows for performance)
-        data = [["Date", "Open", "High", "Low", "Close", "Volume"]]
-        for _, row in self.df.tail(20).iterrows():
-            data.append([
-                str(row.get("Date", ""))[:10],
-                f"${row.get('Open', 0):.2f}",
-                f"${row.get('High', 0):.2f}",
-                f"${row.get('Low', 0):.2f}",
-                f"${row.get('Close', 0):.2f}",
-                f"{int(row.get('Volume', 0)):,}"
-            ])
-        
-        table = Table(data)
-        table.setStyle(TableStyle([
-            ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor("#3b82f6")),
-            ("TEXTCOLOR", (0, 0), (-1, 0), colors.whitesmoke),
-            ("ALIGN", (0, 0), (-1, -1), "CENTER"),
-            ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
-            ("FONTSIZE", (0, 0), (-1, 0), 10),
-            ("BOTTOMPADDING", (0, 0), (-1, 0), 12),
-            ("GRID", (0, 0), (-1, -1), 1, colors.black),
-        ]))
-        story.append(table)
-        doc.build(story)
-
-
 # -------- Data Worker ----------#
-class DataWorker(QThread):
+class DataWorker(QObject):
     finished = pyqtSignal(object, str, dict, str, list)
     error = pyqtSignal(str)
 
-    def __init__(self, ticker, indicators, parent=None):
+    def __init__(self, ticker, parent=None):
         super().__init__(parent)
         self.ticker = ticker
-        self.indicators = indicators
+        self._cancelled = False
+
+    def cancel(self):
+        # Superseded by a newer search; the network calls finish but are skipped after
+        self._cancelled = True
 
     def run(self):
         try:
-            df = get_stock_data(self.ticker)
-            if df is None or df.empty:
+            result = load_market_data(self.ticker, cancelled=lambda: self._cancelled)
+            if self._cancelled:
+                return
+            if result is None:
                 self.error.emit("No data found.")
                 return
-
-            numeric_cols = ["Open", "High", "Low", "Close", "Volume"]
-            for col in numeric_cols:
-                df[col] = pd.to_numeric(df[col], errors="coerce")
-            df.dropna(subset=numeric_cols, inplace=True)
-
-            # Indicators
-            if "MA" in self.indicators:
-                df = calculate_sma(df)
-                df = calculate_ema(df)
-
-            fundamentals = get_fundamentals(self.ticker)
-            details = get_details(self.ticker)
-            news_list = get_news(self.ticker)
-
-            self.finished.emit(df, self.ticker, fundamentals, details, news_list)
+            snapshot, fundamentals, details, news_list = result
+            self.finished.emit(snapshot, self.ticker, fundamentals, details, news_list)
 
         except Exception as e:
             self.error.emit(str(e))
@@ -206,7 +134,21 @@ class DataWorker(QThread):
 
 # ---------------- Main Window ---------------- #
 class StockDashboard(QMainWindow):
-    def __init__(self):
+    # Background refresh of a cached fundamentals/details/news value -> GUI thread
+    _info_refreshed = pyqtSignal(str, str, object)
+
+    # Delay before secondary pages are pre-built once the dashboard is idle
+    PREBUILD_DELAY_MS = 3000
+    PREBUILD_STEP_MS = 250
+    # Max rate the live price label is redrawn; ticks in between are coalesced
+    LIVE_UI_HZ = 2
+    # Parallel jobs for "Export All": threads for data, processes for PDFs
+    EXPORT_WORKERS = 4
+    # Scheduler pool threads (one is always kept free for interactive tasks)
+    SCHEDULER_THREADS = 4
+    NEWS_INTERVAL_MS = 60_000
+
+    def __init__(self, prebuild_pages=True, live_ui_hz=None):
         super().__init__()
         self.setWindowTitle("📈 StockDash - Professional Market Analysis")
         self.resize(1400, 800)
@@ -217,14 +159,21 @@ class StockDashboard(QMainWindow):
         self.setCentralWidget(self.stacked_widget)
 
         # --- Initialize pages ---
+        # Only the dashboard is built eagerly; the other pages are registered
+        # as factories and constructed on first navigation (or in idle time).
         self.dashboard_ui = DashboardUI()
-        self.reports_ui = ReportsUI()
-        self.sentiment_widget = SentimentWidget()
+        self.reports_ui = None
+        self.sentiment_widget = None
+        self.chat_widget = None
+        self.watchlist_widget = None
+        self._page_factories = {
+            "reports": self._create_reports_page,
+            "sentiment": self._create_sentiment_page,
+            "chat": self._create_chat_page,
+            "watchlist": self._create_watchlist_page,
+        }
 
-        # Add pages to stack
         self.stacked_widget.addWidget(self.dashboard_ui)  # index 0
-        self.stacked_widget.addWidget(self.reports_ui)  # index 1
-        self.stacked_widget.addWidget(self.sentiment_widget)  # index 2
 
         # Start with dashboard
         self.stacked_widget.setCurrentWidget(self.dashboard_ui)
@@ -235,10 +184,10 @@ class StockDashboard(QMainWindow):
 
         # Theme state
         self.is_dark_mode = True
-        self.apply_theme()
 
         self.chart_widget = ChartWidget(is_dark=self.is_dark_mode)
         self.dashboard_ui.chart_frame.layout().addWidget(self.chart_widget)
+        self.apply_theme()
 
         # Enhanced Theme toggle button setup
         self.setup_theme_button()
@@ -250,12 +199,17 @@ class StockDashboard(QMainWindow):
         # Dashboard signals with debouncing
         self.dashboard_ui.ticker_input.returnPressed.connect(self.load_data)
         self.dashboard_ui.search_btn.clicked.connect(self.load_data)
+        # Suggestions come from the bundled symbol index, no network involved
+        self.ticker_completer = TickerCompleter(self.dashboard_ui.ticker_input)
+        self.ticker_completer.symbol_chosen.connect(lambda _: self.load_data())
+        self._loading_ticker = None
 
         # OPTIMIZATION: Debounce checkbox changes
         self._checkbox_debounce_timer = QTimer()
         self._checkbox_debounce_timer.setSingleShot(True)
         self._checkbox_debounce_timer.setInterval(500)  # 500ms debounce (increased from 300ms)
         self._checkbox_debounce_timer.timeout.connect(self._reload_chart_only)
+        self.chart_widget.timeframe_changed.connect(lambda _: self._reload_chart_only())
 
         self.dashboard_ui.ma_checkbox.stateChanged.connect(
             self._debounced_indicator_change
@@ -274,63 +228,183 @@ class StockDashboard(QMainWindow):
         )
 
         # Reports UI part variables
-        self.last_df = None
+        self.snapshot = None
         self.last_ticker = None
 
         self.avg_price = 0.0
         self.total_records = 0
 
+        # Live ticks land in a latest-value-wins channel drained at LIVE_UI_HZ
+        self.tick_channel = TickChannel()
         self._latest_price = None
         self._price_update_timer = QTimer(self)
-        self._price_update_timer.setInterval(
-            2000
-        )  # OPTIMIZED: Changed from 500ms to 2000ms
+        self._price_update_timer.setInterval(int(1000 / (live_ui_hz or self.LIVE_UI_HZ)))
         self._price_update_timer.timeout.connect(self._flush_latest_price_to_ui)
 
-        # Reports button actions
-        if hasattr(self.reports_ui, "back_btn"):
-            self.reports_ui.back_btn.clicked.connect(self.show_dashboard)
-        if hasattr(self.reports_ui, "export_csv_btn"):
-            self.reports_ui.export_csv_btn.clicked.connect(self.export_csv)
-        if hasattr(self.reports_ui, "export_pdf_btn"):
-            self.reports_ui.export_pdf_btn.clicked.connect(self.export_pdf)
-        if hasattr(self.reports_ui, "generate_ai_report_btn"):
-            self.reports_ui.generate_ai_report_btn.clicked.connect(self.generate_ai_report)
-
-        # Sentiment widget button actions
-        if hasattr(self.sentiment_widget, "back_btn"):
-            self.sentiment_widget.back_btn.clicked.connect(self.show_dashboard)
-
-        # Worker references
-        self.worker = None
+        # One-shot jobs (data, news, sentiment, AI, forecast, exports) run on
+        # the scheduler; a newer job with the same key supersedes the older
+        self.scheduler = TaskScheduler(max_threads=self.SCHEDULER_THREADS, parent=self)
+        self.task_monitor = None
+        QShortcut(QKeySequence("Ctrl+Shift+T"), self, activated=self.show_task_monitor)
+
+        # Likely-next tickers are warmed (data, indicators, chart) while idle
+        self.prefetcher = Prefetcher(
+            self.scheduler, watchlist=self._watchlist_symbols,
+            chart_state=lambda: (dict(self._chart_options(), timeframe="1d"), self.is_dark_mode),
+            render=render_figure, parent=self,
+        )
+        self.prefetcher.figure_ready.connect(self.chart_widget.adopt_prerendered)
+
+        # Cached fundamentals/details/news render instantly; stale ones are
+        # refreshed in the background and swapped in when they land
+        self._info_refreshed.connect(self._on_info_refreshed)
+        info_cache.on_refresh(self._info_refreshed.emit)
+        self.prefetcher.schedule()
+
+        # Developer tools: span timings panel and a cProfile session toggle
+        self.perf_panel = None
+        QShortcut(QKeySequence("Ctrl+Shift+P"), self, activated=self.show_perf_panel)
+        QShortcut(QKeySequence("Ctrl+Shift+F"), self, activated=self.toggle_profile)
+        self._news_timer = QTimer(self)
+        self._news_timer.setInterval(self.NEWS_INTERVAL_MS)
+        self._news_timer.timeout.connect(self._submit_news_fetch)
+
+        # Long-lived feeds
+        self.live_feed = None  # one shared websocket, started on first use
         self.live_worker = None
-        self.news_worker = None
-        self.sentiment_worker = None
-        self.ai_worker = None
-        self.forecast_worker = None  # Hybrid Forecast Worker
-        self.ai_report_worker = None  # AI Report Worker
+        self.watchlist_feed = None  # subscribes on first visit to the watchlist
+        self.export_worker = None  # kept for its summary once finished
+        self._sentiment_by_ticker = {}  # latest Market Mood result per ticker
+
+        # Pre-build the lazy pages one at a time once the dashboard is up
+        self._prebuild_queue = []
+        if prebuild_pages:
+            self._prebuild_queue = list(self._page_factories)
+            QTimer.singleShot(self.PREBUILD_DELAY_MS, self._prebuild_next_page)
+
+    # ---------------- Lazy Pages ---------------- #
+    def _ensure_page(self, name):
+        """Return the page registered under `name`, building it on first use"""
+        attr = {
+            "reports": "reports_ui", "sentiment": "sentiment_widget",
+            "chat": "chat_widget", "watchlist": "watchlist_widget",
+        }[name]
+        page = getattr(self, attr)
+        if page is None:
+            page = self._page_factories[name]()
+            setattr(self, attr, page)
+            if name in self._prebuild_queue:
+                self._prebuild_queue.remove(name)
+        return page
+
+    def _prebuild_next_page(self):
+        """Build one pending page per idle tick so the UI never stalls"""
+        if not self._prebuild_queue:
+            return
+        if QApplication.activePopupWidget() or QApplication.mouseButtons() != Qt.NoButton:
+            # User is interacting - try again later
+            QTimer.singleShot(self.PREBUILD_DELAY_MS, self._prebuild_next_page)
+            return
+
+        self._ensure_page(self._prebuild_queue[0])
+        if self._prebuild_queue:
+            QTimer.singleShot(self.PREBUILD_STEP_MS, self._prebuild_next_page)
+
+    def _create_reports_page(self):
+        from ui.ui_reports import ReportsUI
+
+        reports_ui = ReportsUI()
+        if not self.is_dark_mode:
+            reports_ui.set_theme(self.is_dark_mode)
+        reports_ui.back_btn.clicked.connect(self.show_dashboard)
+        reports_ui.export_csv_btn.clicked.connect(self.export_csv)
+        reports_ui.export_pdf_btn.clicked.connect(self.export_pdf)
+        reports_ui.export_all_btn.clicked.connect(self.export_all)
+        reports_ui.generate_ai_report_btn.clicked.connect(self.generate_ai_report)
+        self.stacked_widget.addWidget(reports_ui)
+        return reports_ui
+
+    def _create_sentiment_page(self):
+        from widgets.sentiment_widget import SentimentWidget
+
+        sentiment_widget = SentimentWidget()
+        if not self.is_dark_mode:
+            sentiment_widget.set_theme(self.is_dark_mode)
+        sentiment_widget.back_btn.clicked.connect(self.show_dashboard)
+        self.stacked_widget.addWidget(sentiment_widget)
+        return sentiment_widget
+
+    def _create_chat_page(self):
+        from widgets.chat_widget import ChatWidget
+
+        chat_widget = ChatWidget(self.is_dark_mode)
+        chat_widget.setParent(self)
+        chat_widget.hide()
+        chat_widget.user_message_sent.connect(self.handle_user_message)
+        chat_widget.chat_closed.connect(self.on_chat_closed)
+        return chat_widget
+
+    def _create_watchlist_page(self):
+        from widgets.watchlist_widget import WatchlistWidget
+
+        watchlist_widget = WatchlistWidget()
+        watchlist_widget.set_theme(self.is_dark_mode)
+        for symbol in load_symbols():
+            watchlist_widget.add_symbol(symbol)
+        for ticker, sentiment in self._sentiment_by_ticker.items():
+            watchlist_widget.model.set_sentiment(ticker, sentiment["score"], sentiment["label"])
+        watchlist_widget.back_btn.clicked.connect(self.show_dashboard)
+        watchlist_widget.ticker_activated.connect(self._open_from_watchlist)
+        watchlist_widget.symbol_added.connect(self._on_watchlist_symbol_added)
+        watchlist_widget.symbol_removed.connect(self._on_watchlist_symbol_removed)
+        self.stacked_widget.addWidget(watchlist_widget)
+        return watchlist_widget
 
     def _debounced_indicator_change(self):
         """Debounce checkbox changes to avoid excessive reloads"""
         self._checkbox_debounce_timer.start()
 
+    def _chart_frame(self):
+        """Bars for the chart's selected timeframe: daily history or live intraday bars"""
+        timeframe = self.chart_widget.timeframe()
+        if timeframe == "1d" or not self.last_ticker:
+            return self.snapshot, "1d"
+        if self.live_worker and self.live_worker.ticker == self.last_ticker:
+            df = self.live_worker.intraday_frame(timeframe)
+        else:
+            df = parquet_store.load_bars(self.last_ticker, timeframe)
+        if len(df) < 2:
+            print(f"⏳ Not enough {timeframe} bars yet for {self.last_ticker}, showing daily")
+            return self.snapshot, "1d"
+        return df, timeframe
+
+    def _chart_options(self):
+        """Indicator toggles as `plot_chart` keyword arguments"""
+        return {
+            'show_sma': self.dashboard_ui.ma_checkbox.isChecked(),
+            'show_ema': self.dashboard_ui.ma_checkbox.isChecked(),
+            'show_rsi': self.dashboard_ui.rsi_checkbox.isChecked(),
+            'show_macd': self.dashboard_ui.macd_checkbox.isChecked(),
+            'show_bb': self.dashboard_ui.bb_checkbox.isChecked(),
+            'show_sr': self.dashboard_ui.sr_checkbox.isChecked(),
+        }
+
     def _reload_chart_only(self):
         """Reload only the chart without fetching new data"""
-        if self.last_df is not None:
+        if self.snapshot is not None:
+            df, timeframe = self._chart_frame()
             self.chart_widget.plot_chart(
-                self.last_df,
-                self.last_ticker,
-                show_sma=self.dashboard_ui.ma_checkbox.isChecked(),
-                show_ema=self.dashboard_ui.ma_checkbox.isChecked(),
-                show_rsi=self.dashboard_ui.rsi_checkbox.isChecked(),
-                show_macd=self.dashboard_ui.macd_checkbox.isChecked(),
-                show_bb=self.dashboard_ui.bb_checkbox.isChecked(),
-                show_sr=self.dashboard_ui.sr_checkbox.isChecked(),
+                df, self.last_ticker, timeframe=timeframe, **self._chart_options()
             )
 
+    def _on_bars_closed(self, ticker, timeframes):
+        """Redraw an intraday chart when its timeframe gets a new bar"""
+        if ticker == self.last_ticker and self.chart_widget.timeframe() in timeframes:
+            self._reload_chart_only()
+
     def generate_ai_report(self):
         """Generate AI-powered stock report using Groq API"""
-        if self.last_df is None or self.last_ticker is None:
+        if self.snapshot is None or self.last_ticker is None:
             QMessageBox.warning(
                 self,
                 "No Data",
@@ -358,7 +432,7 @@ class StockDashboard(QMainWindow):
 
             # prepare stock data package
             stock_data_package = {
-                'dataframe': self.last_df,
+                'snapshot': self.snapshot,
                 'ticker': self.last_ticker,
                 'forecast': None
             }
@@ -377,26 +451,20 @@ class StockDashboard(QMainWindow):
                 except Exception as e:
                     print(f"Could not add forecast data: {e}")
 
-            # Clean up previous ai report worker
-            if self.ai_report_worker and self.ai_report_worker.isRunning():
-                self.ai_report_worker.cancel()
-                self.ai_report_worker.quit()
-                self.ai_report_worker.wait(1000)
-
-            # Create and start ai report worker
-            self.ai_report_worker = AIReportWorker(
+            # Supersedes (cancels) a report still being generated
+            worker = AIReportWorker(
                 api_key=api_key,
                 ticker=self.last_ticker,
                 stock_data=stock_data_package
             )
 
             # Connect signals
-            self.ai_report_worker.report_ready.connect(self._display_ai_report)
-            self.ai_report_worker.progress_update.connect(self._update_ai_report_progress)
-            self.ai_report_worker.error_occurred.connect(self._handle_ai_report_error)
+            worker.report_ready.connect(self._display_ai_report)
+            worker.progress_update.connect(self._update_ai_report_progress)
+            worker.error_occurred.connect(self._handle_ai_report_error)
 
             # Start generation
-            self.ai_report_worker.start()
+            self.scheduler.submit_worker(worker, key="ai_report", priority=INTERACTIVE)
             print(f"🤖 Started AI report generation for {self.last_ticker}")
 
         except Exception as e:
@@ -408,28 +476,15 @@ class StockDashboard(QMainWindow):
         load_dotenv()
         api_key = os.getenv("GROQ_API_KEY")
 
-        # Clean up previous AI worker
-        if self.ai_worker:
-            if self.ai_worker.isRunning():
-                self.ai_worker.quit()
-                try:
-                    self.ai_worker.response_ready.disconnect()
-                    self.ai_worker.error_occurred.disconnect()
-                except: pass
-                self.ai_worker.finished.connect(self.ai_worker.deleteLater)
-            else:
-                self.ai_worker.deleteLater()
-            self.ai_worker = None
-
-        # TODO: Modify AIChatWorker to accept parent if possible, for now just cleaning up
-        self.ai_worker = AIChatWorker(api_key, message)
-        self.ai_worker.response_ready.connect(
+        # No supersession key: every chat message gets its own answer
+        worker = AIChatWorker(api_key, message)
+        worker.response_ready.connect(
             lambda resp: self.chat_widget.add_ai_response(resp, request_id)
         )
-        self.ai_worker.error_occurred.connect(
+        worker.error_occurred.connect(
             lambda err: self.chat_widget.add_error_message(err, request_id)
         )
-        self.ai_worker.start()
+        self.scheduler.submit_worker(worker, name="chat", priority=INTERACTIVE)
 
     def setup_chat_system(self):
         """Setup the AI chat system components"""
@@ -438,13 +493,7 @@ class StockDashboard(QMainWindow):
         self.chatbot_button.clicked_with_animation.connect(self.toggle_chat)
         self.position_chatbot_button()
 
-        self.chat_widget = ChatWidget(self.is_dark_mode)
-        self.chat_widget.setParent(self)
-        self.chat_widget.hide()
-
-        self.chat_widget.user_message_sent.connect(self.handle_user_message)
-        self.chat_widget.chat_closed.connect(self.on_chat_closed)
-
+        # ChatWidget itself is built on first toggle (see _create_chat_page)
         self.chat_visible = False
 
     def position_chatbot_button(self):
@@ -471,7 +520,7 @@ class StockDashboard(QMainWindow):
     def show_chat(self):
         """Show the chat widget with animation"""
         if not self.chat_visible:
-            self.chat_widget.show_animated(self.geometry())
+            self._ensure_page("chat").show_animated(self.geometry())
             self.chat_visible = True
 
     def hide_chat(self):
@@ -511,63 +560,62 @@ class StockDashboard(QMainWindow):
                     btn.clicked.connect(self.show_history_placeholder)
                 elif "market mood" in btn_text:
                     btn.clicked.connect(self.show_market_mood)
+                elif "watchlist" in btn_text:
+                    btn.clicked.connect(self.show_watchlist)
 
     def show_dashboard(self):
         """Switch to dashboard and stop Market Mood workers"""
-        if self.news_worker and self.news_worker.isRunning():
-            self.news_worker.stop()
-            self.news_worker.quit()
-            self.news_worker.wait(2000)
-            print("🛑 News worker stopped (switching to dashboard)")
+        self.stop_live_news()
 
         self.stacked_widget.setCurrentWidget(self.dashboard_ui)
 
         # Restart price updates if ticker loaded
-        if self._latest_price and not self._price_update_timer.isActive():
+        if self.live_worker and not self._price_update_timer.isActive():
             self._price_update_timer.start()
 
     def show_reports(self):
         """Switch to reports page and generate report if ticker loaded (OPTIMIZED)"""
-        if self.news_worker and self.news_worker.isRunning():
-            self.news_worker.stop()
-            self.news_worker.quit()
-            self.news_worker.wait(2000)
-            print("🛑 News worker stopped (switching to reports)")
+        self.stop_live_news()
 
-        if self.last_df is not None:
+        reports_ui = self._ensure_page("reports")
+        if self.snapshot is not None:
             # Show loading message
-            self.reports_ui.show_loading("⏳ Initializing forecast models...")
+            reports_ui.show_loading("⏳ Initializing forecast models...")
 
             # Switch to reports immediately (don't block)
-            self.stacked_widget.setCurrentWidget(self.reports_ui)
+            self.stacked_widget.setCurrentWidget(reports_ui)
 
             # Start forecast in background
             self._start_hybrid_forecast_async()
         else:
-            self.stacked_widget.setCurrentWidget(self.reports_ui)
+            self.stacked_widget.setCurrentWidget(reports_ui)
 
     def _start_hybrid_forecast_async(self):
-        """Start forecast generation in background thread"""
-        # Clean up previous forecast worker
-        if self.forecast_worker and self.forecast_worker.isRunning():
-            self.forecast_worker.cancel()
-            self.forecast_worker.quit()
-            self.forecast_worker.wait(1000)
-
-        self.forecast_worker = HybridForecastWorker(self.last_df, periods=30)
-        # Connect signals
-        self.forecast_worker.forecast_ready.connect(
-            self._display_report_with_hybrid_forecast
-        )
-        self.forecast_worker.progress_update.connect(self._update_forecast_progress)
-        self.forecast_worker.error_occurred.connect(
-            self._display_report_without_forecast
-        )
-
-        # Start forecast
-        self.forecast_worker.start()
+        """Start forecast generation in a worker process"""
+        # Prophet/XGBoost are CPU-bound: a process keeps the GUI's GIL free.
+        # A newer forecast supersedes this one and its result is dropped
+        self._update_forecast_progress("🔮 Running Prophet + XGBoost models...", 15)
+        on_error = lambda err: self._display_report_without_forecast(f"Forecast error: {err}")
+        options = dict(key="forecast", name=f"forecast {self.last_ticker}",
+                       priority=BACKGROUND, process=True, on_error=on_error)
+        if perf.enabled():
+            # Stage spans are recorded in the worker process and merged here
+            self.scheduler.submit(
+                perf.run_traced, hybrid_forecast, self.snapshot, 30,
+                on_done=lambda traced: self._on_hybrid_forecast_done(perf.merge(traced)),
+                **options,
+            )
+        else:
+            self.scheduler.submit(
+                hybrid_forecast, self.snapshot, 30,
+                on_done=self._on_hybrid_forecast_done, **options,
+            )
         print(f"🚀 Started hybrid forecast for {self.last_ticker}")
 
+    def _on_hybrid_forecast_done(self, result):
+        if result is not None:
+            self._display_report_with_hybrid_forecast(*result)
+
     def _update_forecast_progress(self, message, percentage):
         """Update progress indicator during forecast generation"""
         if self.stacked_widget.currentWidget() == self.reports_ui:
@@ -607,14 +655,14 @@ class StockDashboard(QMainWindow):
             # Store forecast_df for ai report generation
             self.last_forecast_df = forecast_df
             self.reports_ui.set_report(
-                self.last_df, self.last_ticker, forecast_df, metrics
+                self.snapshot, self.last_ticker, forecast_df, metrics
             )
 
     def _display_report_without_forecast(self, error_msg):
         """Display report without forecast if forecast fails"""
         print(f"Forecast error: {error_msg}")
         if self.stacked_widget.currentWidget() == self.reports_ui:
-            self.reports_ui.set_report(self.last_df, self.last_ticker, None, None)
+            self.reports_ui.set_report(self.snapshot, self.last_ticker, None, None)
             self.reports_ui.show_error(f"Forecast failed: {error_msg}")
 
     def show_history_placeholder(self):
@@ -633,28 +681,80 @@ class StockDashboard(QMainWindow):
             )
             return
 
-        self.stacked_widget.setCurrentWidget(self.sentiment_widget)
+        self.stacked_widget.setCurrentWidget(self._ensure_page("sentiment"))
         self.start_live_news()
         print(f"✅ Market Mood view opened for {self.last_ticker}")
 
+    # ---------------- Watchlist ---------------- #
+    def _watchlist_symbols(self):
+        if self.watchlist_widget is not None:
+            return self.watchlist_widget.model.symbols()
+        return load_symbols()
+
+    def show_watchlist(self):
+        """Switch to the watchlist; live subscriptions start on the first visit"""
+        watchlist_widget = self._ensure_page("watchlist")
+        if self.watchlist_feed is None:
+            self.watchlist_feed = WatchlistFeed(
+                self._ensure_live_feed(), watchlist_widget.channel, parent=self
+            )
+            symbols = watchlist_widget.model.symbols()
+            for symbol in symbols:
+                self.watchlist_feed.subscribe(symbol)
+            self._seed_watchlist(symbols)
+            print(f"👀 Watchlist streaming {len(symbols)} symbols")
+        self.stacked_widget.setCurrentWidget(watchlist_widget)
+
+    def _seed_watchlist(self, symbols):
+        """Fill rows from stored history in the background"""
+        if not symbols:
+            return
+        worker = WatchlistSeedWorker(symbols)
+        worker.row_ready.connect(self.watchlist_widget.model.seed)
+        worker.error.connect(lambda ticker, err: print(f"⚠️ Watchlist {ticker}: {err}"))
+        self.scheduler.submit_worker(worker, name="watchlist seed", priority=BACKGROUND)
+
+    def _on_watchlist_symbol_added(self, symbol):
+        save_symbols(self.watchlist_widget.model.symbols())
+        if self.watchlist_feed is not None:
+            self.watchlist_feed.subscribe(symbol)
+            self._seed_watchlist([symbol])
+
+    def _on_watchlist_symbol_removed(self, symbol):
+        save_symbols(self.watchlist_widget.model.symbols())
+        if self.watchlist_feed is not None:
+            self.watchlist_feed.unsubscribe(symbol)
+
+    def _open_from_watchlist(self, ticker):
+        self.show_dashboard()
+        self.dashboard_ui.ticker_input.setText(ticker)
+        self.load_data()
+
     def apply_theme(self):
-        self.setStyleSheet(get_theme(self.is_dark_mode))
+        # Both themes live in one precompiled app stylesheet; this flips the
+        # `theme` property and re-polishes once
+        apply_app_theme(self, self.is_dark_mode)
 
     def toggle_theme(self):
         self.is_dark_mode = not self.is_dark_mode
-        # Apply stylesheet first - this is fast
         self.apply_theme()
 
         # Update button immediately
         if hasattr(self, "theme_btn"):
             self.theme_btn.setText("☀️" if self.is_dark_mode else "🌙")
 
-        # Defer heavy theme operations to prevent UI blocking
-        QTimer.singleShot(10, lambda: self.chart_widget.set_theme(self.is_dark_mode))
-        QTimer.singleShot(30, lambda: self.reports_ui.set_theme(self.is_dark_mode))
-
-        if hasattr(self, "sentiment_widget"):
-            QTimer.singleShot(50, lambda: self.sentiment_widget.setStyleSheet(get_theme(self.is_dark_mode)))
+        # Custom-painted widgets only recolor; the chart re-embeds or re-plots
+        # its figure for the new theme. Pages that were never opened pick up
+        # the theme when they are built
+        self.chart_widget.set_theme(self.is_dark_mode)
+        if self.reports_ui is not None:
+            self.reports_ui.set_theme(self.is_dark_mode)
+        if self.sentiment_widget is not None:
+            self.sentiment_widget.set_theme(self.is_dark_mode)
+        if self.chat_widget is not None:
+            self.chat_widget.set_theme(self.is_dark_mode)
+        if self.watchlist_widget is not None:
+            self.watchlist_widget.set_theme(self.is_dark_mode)
 
     def start_live_news(self):
         """Start fetching live news and analyzing sentiment"""
@@ -663,15 +763,9 @@ class StockDashboard(QMainWindow):
             return
 
         try:
-            if self.news_worker and self.news_worker.isRunning():
-                self.news_worker.stop()
-                self.news_worker.quit()
-                self.news_worker.wait(2000)
-                print("🛑 Stopped previous news worker")
-
-            self.news_worker = LiveNewsWorker(self.last_ticker, interval=60)
-            self.news_worker.news_ready.connect(self.handle_live_news)
-            self.news_worker.start()
+            # Fetch now, then every NEWS_INTERVAL_MS while on Market Mood
+            self._submit_news_fetch()
+            self._news_timer.start()
 
             print(f"📰 Started live news feed for {self.last_ticker}")
 
@@ -681,6 +775,21 @@ class StockDashboard(QMainWindow):
                 self, "News Feed Error", f"❌ Failed to start news feed: {str(e)}"
             )
 
+    def _submit_news_fetch(self):
+        worker = LiveNewsWorker(self.last_ticker, interval=self.NEWS_INTERVAL_MS // 1000)
+        worker.news_ready.connect(self.handle_live_news)
+        self.scheduler.submit_worker(
+            worker, key="news", name=f"news {self.last_ticker}", priority=BACKGROUND
+        )
+
+    def stop_live_news(self):
+        """Stop polling news and drop any fetch or analysis still in flight"""
+        if self._news_timer.isActive():
+            self._news_timer.stop()
+            self.scheduler.cancel("news")
+            self.scheduler.cancel("sentiment")
+            print("🛑 News feed stopped")
+
     def handle_live_news(self, news):
         """Process live news and run sentiment analysis"""
         if self.stacked_widget.currentWidget() != self.sentiment_widget:
@@ -700,20 +809,22 @@ class StockDashboard(QMainWindow):
             print("⚠️ GROQ_API_KEY not found in environment")
             return
 
-        if self.sentiment_worker and self.sentiment_worker.isRunning():
-            self.sentiment_worker.stop()
-            self.sentiment_worker.quit()
-            self.sentiment_worker.wait(1500)
-
-        self.sentiment_worker = SentimentWorker(api_key, headlines)
-        self.sentiment_worker.sentiment_ready.connect(self.update_sentiment_ui)
-        self.sentiment_worker.error_occurred.connect(
+        worker = SentimentWorker(api_key, headlines)
+        worker.sentiment_ready.connect(self.update_sentiment_ui)
+        worker.error_occurred.connect(
             lambda err: print(f"Sentiment error: {err}")
         )
-        self.sentiment_worker.start()
+        self.scheduler.submit_worker(worker, key="sentiment", priority=BACKGROUND)
 
     def update_sentiment_ui(self, sentiment):
         """Update sentiment display only if on Market Mood page"""
+        if self.last_ticker:
+            # Remembered for the watchlist's sentiment column
+            self._sentiment_by_ticker[self.last_ticker] = sentiment
+            if self.watchlist_widget is not None:
+                self.watchlist_widget.model.set_sentiment(
+                    self.last_ticker, sentiment["score"], sentiment["label"]
+                )
         if self.stacked_widget.currentWidget() == self.sentiment_widget:
             self.sentiment_widget.update_sentiment(sentiment)
 
@@ -728,88 +839,72 @@ class StockDashboard(QMainWindow):
                 self, "Input Required", "Please enter a stock symbol (e.g., AAPL)"
             )
             return
+        if ticker == self._loading_ticker and self.scheduler.running("data"):
+            # Already on its way (picked from the completer, then Enter). Only
+            # while its task is alive: a cancelled one never reports back
+            return
+
+        # Screen the symbol locally before any network work
+        ok, suggestion = symbol_index().check(ticker)
+        if not ok:
+            QMessageBox.warning(
+                self, "Invalid Symbol", f"❌ '{ticker}' is not a valid stock symbol."
+            )
+            return
+        if suggestion:
+            reply = QMessageBox.question(
+                self, "Unknown Symbol",
+                f"🔎 {ticker} is not in the symbol index.\n\nDid you mean {suggestion}?\n"
+                f"(Choose No to load {ticker} anyway.)",
+                QMessageBox.Yes | QMessageBox.No | QMessageBox.Cancel, QMessageBox.Yes,
+            )
+            if reply == QMessageBox.Cancel:
+                return
+            if reply == QMessageBox.Yes:
+                ticker = suggestion
+                self.dashboard_ui.ticker_input.setText(ticker)
 
         self.dashboard_ui.search_btn.setEnabled(False)
         self.dashboard_ui.search_btn.setText("⏳ Loading...")
         self.dashboard_ui.avg_label.setText("⏳ Loading market data...")
 
-        indicators = []
-        if self.dashboard_ui.ma_checkbox.isChecked():
-            indicators.append("MA")
-
-        if self.worker:
-            if self.worker.isRunning():
-                self.worker.quit()
-                try:
-                    self.worker.finished.disconnect()
-                    self.worker.error.disconnect()
-                except: pass
-                # Clean up when finished (non-blocking)
-                self.worker.finished.connect(self.worker.deleteLater)
-            else:
-                self.worker.deleteLater()
-            self.worker = None
+        # The user's request always beats warm-up work
+        self.prefetcher.cancel()
+        warm = self.prefetcher.take(ticker)
+        if warm is not None:
+            print(f"⚡ {ticker} served from prefetch")
+            self.scheduler.cancel("data")
+            snapshot, fundamentals, details, news_list = warm
+            self.on_data_loaded(snapshot, ticker, fundamentals, details, news_list)
+            return
 
-        self.worker = DataWorker(ticker, indicators, parent=self)
-        self.worker.finished.connect(self.on_data_loaded)
-        self.worker.error.connect(self.on_data_error)
-        self.worker.start()
+        # Latest search wins: a load still in flight is cancelled and dropped
+        self._loading_ticker = ticker
+        worker = DataWorker(ticker)
+        worker.finished.connect(self.on_data_loaded)
+        worker.error.connect(self.on_data_error)
+        self.scheduler.submit_worker(worker, key="data", name=f"data {ticker}", priority=INTERACTIVE)
 
-    def on_data_loaded(self, df, ticker, fundamentals, details, news_list):
-        self.last_df = df
+    def on_data_loaded(self, snapshot, ticker, fundamentals, details, news_list):
+        self.snapshot = snapshot
         self.last_ticker = ticker
+        self._loading_ticker = None
+        self.prefetcher.viewed(ticker)
+        mark_cached(ticker)
 
         try:
-            self.avg_price = df["Close"].mean()
-            self.total_records = len(df)
+            self.avg_price = float(snapshot["Close"].mean())
+            self.total_records = len(snapshot)
 
             self.dashboard_ui.avg_label.setText(
                 f"💰 Avg: ${self.avg_price:.2f} | 📊 Records: {self.total_records} | 📡 Connecting..."
             )
 
             # Chart update - already uses background worker
-            self.chart_widget.plot_chart(
-                df,
-                ticker,
-                show_sma=self.dashboard_ui.ma_checkbox.isChecked(),
-                show_ema=self.dashboard_ui.ma_checkbox.isChecked(),
-                show_rsi=self.dashboard_ui.rsi_checkbox.isChecked(),
-                show_macd=self.dashboard_ui.macd_checkbox.isChecked(),
-                show_bb=self.dashboard_ui.bb_checkbox.isChecked(),
-                show_sr=self.dashboard_ui.sr_checkbox.isChecked(),
-            )
+            self._reload_chart_only()
 
-            # Fundamentals display - quick string operation
-            if fundamentals:
-                fund_items = []
-                for k, v in fundamentals.items():
-                    icon = (
-                        "📈"
-                        if any(word in k.lower() for word in ["price", "value"])
-                        else (
-                            "💹"
-                            if any(word in k.lower() for word in ["ratio", "pe"])
-                            else (
-                                "💰"
-                                if any(word in k.lower() for word in ["cap", "revenue"])
-                                else "📊"
-                            )
-                        )
-                    )
-                    fund_items.append(f"{icon} {k}: {v}")
-                fund_text = "\n".join(fund_items)
-            else:
-                fund_text = "📊 Fundamental data not available for this symbol"
-
-            self.dashboard_ui.fundamentals_text.setText(fund_text)
-
-            # Details display
-            if details:
-                self.dashboard_ui.set_company_details(f"🏢 {details}")
-            else:
-                self.dashboard_ui.set_company_details(
-                    "🏢 Company details not available"
-                )
+            self._show_fundamentals(fundamentals)
+            self._show_details(details)
 
             # Re-enable search button immediately
             self.dashboard_ui.search_btn.setEnabled(True)
@@ -823,29 +918,92 @@ class StockDashboard(QMainWindow):
         except Exception as e:
             self.on_data_error(f"Error processing data: {str(e)}")
 
+    def _show_fundamentals(self, fundamentals):
+        """Fundamentals display - quick string operation"""
+        if fundamentals:
+            fund_items = []
+            for k, v in fundamentals.items():
+                icon = (
+                    "📈"
+                    if any(word in k.lower() for word in ["price", "value"])
+                    else (
+                        "💹"
+                        if any(word in k.lower() for word in ["ratio", "pe"])
+                        else (
+                            "💰"
+                            if any(word in k.lower() for word in ["cap", "revenue"])
+                            else "📊"
+                        )
+                    )
+                )
+                fund_items.append(f"{icon} {k}: {v}")
+            fund_text = "\n".join(fund_items)
+        else:
+            fund_text = "📊 Fundamental data not available for this symbol"
+
+        self.dashboard_ui.fundamentals_text.setText(fund_text)
+
+    def _show_details(self, details):
+        """Company details panel"""
+        if details:
+            self.dashboard_ui.set_company_details(f"🏢 {details}")
+        else:
+            self.dashboard_ui.set_company_details(
+                "🏢 Company details not available"
+            )
+
+    def _on_info_refreshed(self, kind, key, value):
+        """A stale cached value shown earlier was refreshed in the background"""
+        ticker = key.split(":", 1)[0]
+        if ticker != self.last_ticker:
+            return
+        print(f"🔄 Refreshed {kind} for {ticker}")
+        if kind == "fundamentals":
+            self._show_fundamentals(value)
+        elif kind == "details":
+            self._show_details(value)
+        elif kind == "news":
+            self._update_news_widgets(value)
+
+    def _ensure_live_feed(self):
+        if self.live_feed is None:
+            # STOCKDASH_RECORD_TICKS=path/to/file.ticks records the session
+            # for offline replay (see core/tick_log.py)
+            record_path = os.getenv("STOCKDASH_RECORD_TICKS")
+            recorder = TickRecorder(record_path) if record_path else None
+            if recorder:
+                print(f"📼 Recording live ticks to {record_path}")
+            self.live_feed = LiveFeedService(recorder=recorder, parent=self)
+            self.live_feed.error.connect(lambda err: print("Live WS Error:", err))
+            self.live_feed.start()
+        return self.live_feed
+
     def _start_live_price_worker(self, ticker):
         """Start live price updates in background - called deferred"""
         try:
             if self.live_worker:
-                if self.live_worker.isRunning():
-                    self.live_worker.stop()
-                    # Disconnect signals
+                if self.live_worker.ticker == ticker.upper().strip() and self.live_worker.isRunning():
+                    return
+                # Only unsubscribes - the shared connection stays open
+                self.live_worker.stop()
+                for signal in (self.live_worker.bars_closed, self.live_worker.error):
                     try:
-                        self.live_worker.price_update.disconnect()
-                        self.live_worker.error.disconnect()
-                    except: pass
-                    # Safe cleanup
-                    self.live_worker.finished.connect(self.live_worker.deleteLater)
-                else:
-                    self.live_worker.deleteLater()
+                        signal.disconnect()
+                    except (TypeError, RuntimeError):
+                        pass  # nothing connected, or the C++ object is already gone
+                self.live_worker.deleteLater()
                 print("🛑 Stopping previous live worker")
                 self.live_worker = None
 
             # Pass parent=self for safety
-            self.live_worker = LivePriceWorker(ticker, parent=self)
-            self.live_worker.price_update.connect(self.on_live_price)
+            self.live_worker = LivePriceWorker(
+                ticker, self._ensure_live_feed(), self.tick_channel, parent=self
+            )
+            self.live_worker.bars_closed.connect(self._on_bars_closed)
             self.live_worker.error.connect(lambda err: print("Live WS Error:", err))
             self.live_worker.start()
+            if self.stacked_widget.currentWidget() == self.dashboard_ui:
+                self._price_update_timer.start()
             print(f"📡 Live price updates started for {ticker}")
         except Exception as e:
             print(f"⚠️ Could not start live feed: {e}")
@@ -884,28 +1042,22 @@ class StockDashboard(QMainWindow):
             )
             self.dashboard_ui.news_layout.addWidget(no_news)
 
-    def on_live_price(self, ticker, price):
-        """Store latest price — UI updated from timer (non-blocking)."""
-        try:
-            self._latest_price = (ticker, float(price))
-            if not self._price_update_timer.isActive():
-                self._price_update_timer.start()
-        except Exception as e:
-            print(f"Live price buffer error: {e}")
-
     def _flush_latest_price_to_ui(self):
-        """Called on QTimer to update UI with the latest buffered price."""
-        if not self._latest_price:
-            return
-
+        """Drain the tick channel on the UI timer; one redraw per frame however many ticks arrived"""
         if self.stacked_widget.currentWidget() != self.dashboard_ui:
+            # Stop draining; the channel keeps only the latest value meanwhile
             self._price_update_timer.stop()
             return
 
+        summary = self.tick_channel.drain().get(self.last_ticker)
+        if summary is None:
+            return
+
         try:
-            ticker, price = self._latest_price
+            self._latest_price = (summary.ticker, summary.price)
+            ticks = f" ({summary.count} ticks, VWAP ${summary.vwap:.2f})" if summary.count > 1 else ""
             self.dashboard_ui.avg_label.setText(
-                f"💰 Avg: ${self.avg_price:.2f} | 📡 Live: ${price:.2f} | 📊 Records: {self.total_records}"
+                f"💰 Avg: ${self.avg_price:.2f} | 📡 Live: ${summary.price:.2f}{ticks} | 📊 Records: {self.total_records}"
             )
         except Exception as e:
             print(f"Error flushing live price to UI: {e}")
@@ -1044,15 +1196,25 @@ class StockDashboard(QMainWindow):
         return news_frame
 
     def on_data_error(self, msg):
+        self._loading_ticker = None
         QMessageBox.critical(self, "Data Loading Error", f"❌ {msg}")
         self.dashboard_ui.avg_label.setText("❌ Error loading data")
         self.dashboard_ui.search_btn.setEnabled(True)
         self.dashboard_ui.search_btn.setText("🔍 SEARCH")
 
     # ---------------- Exporting (Background Workers) ---------------- #
+    def _start_export(self, worker, button):
+        self.reports_ui.set_export_busy(True, button)
+        self._export_button = button
+        self.export_worker = worker
+        worker.finished.connect(self._on_export_finished)
+        worker.progress.connect(self._on_export_progress)
+        worker.error.connect(self._on_export_error)
+        self.scheduler.submit_worker(worker, key="export", priority=BACKGROUND)
+
     def export_csv(self):
-        """Export CSV report in background thread"""
-        if self.last_df is None:
+        """Stream the loaded history in the selected format in a background thread"""
+        if self.snapshot is None:
             QMessageBox.warning(
                 self,
                 "No Data",
@@ -1060,19 +1222,25 @@ class StockDashboard(QMainWindow):
             )
             return
 
-        # Disable buttons and show progress
-        self.reports_ui.export_csv_btn.setEnabled(False)
-        self.reports_ui.export_csv_btn.setText("⏳ Exporting...")
+        fmt = self.reports_ui.export_format()
+        if fmt == "pdf":
+            self.export_pdf()
+            return
+        self._start_export(
+            ExportWorker(self.snapshot, self.last_ticker, fmt), self.reports_ui.export_csv_btn
+        )
 
-        # Start background export
-        self.export_worker = ExportWorker(self.last_df, self.last_ticker, "csv")
-        self.export_worker.finished.connect(self._on_export_finished)
-        self.export_worker.error.connect(self._on_export_error)
-        self.export_worker.start()
+    def export_all(self):
+        """Export every ticker in the local store (PDFs in worker processes)"""
+        fmt = self.reports_ui.export_format()
+        self._start_export(
+            ExportWorker(None, None, fmt, tickers=[], max_workers=self.EXPORT_WORKERS),
+            self.reports_ui.export_all_btn,
+        )
 
     def export_pdf(self):
         """Export PDF report in background thread"""
-        if self.last_df is None:
+        if self.snapshot is None:
             QMessageBox.warning(
                 self,
                 "No Data",
@@ -1080,49 +1248,68 @@ class StockDashboard(QMainWindow):
             )
             return
 
-        # Disable buttons and show progress
-        self.reports_ui.export_pdf_btn.setEnabled(False)
-        self.reports_ui.export_pdf_btn.setText("⏳ Exporting...")
-
-        # Calculate stats for PDF
-        avg_price = self.last_df["Close"].mean()
-        min_price = self.last_df["Close"].min()
-        max_price = self.last_df["Close"].max()
-        total_volume = self.last_df["Volume"].sum()
-
-        # Start background export
-        self.export_worker = ExportWorker(
-            self.last_df, self.last_ticker, "pdf",
-            avg_price, min_price, max_price, total_volume
+        # Stats, chart and table are computed by core.pdf_report in the worker
+        self._start_export(
+            ExportWorker(self.snapshot, self.last_ticker, "pdf"), self.reports_ui.export_pdf_btn
         )
-        self.export_worker.finished.connect(self._on_export_finished)
-        self.export_worker.error.connect(self._on_export_error)
-        self.export_worker.start()
+
+    def _on_export_progress(self, done, total, message):
+        if total:
+            self._export_button.setText(f"⏳ {done * 100 // total}%")
 
     def _on_export_finished(self, path, export_type):
         """Handle successful export"""
-        # Re-enable buttons
-        self.reports_ui.export_csv_btn.setEnabled(True)
-        self.reports_ui.export_csv_btn.setText("📊 Export CSV")
-        self.reports_ui.export_pdf_btn.setEnabled(True)
-        self.reports_ui.export_pdf_btn.setText("📄 Export PDF")
-
+        self.reports_ui.set_export_busy(False)
+
+        summary = self.export_worker.summary if self.export_worker else {}
+        details = f"\nPath: {path}"
+        if summary.get("tickers") is not None:
+            throughput = (f"{summary['rows']:,} rows in {summary['seconds']:.2f}s "
+                          f"({summary['mb_per_s']:.1f} MB/s)" if "rows" in summary
+                          else f"in {summary['seconds']:.2f}s")
+            details = f"\n{summary['exported']}/{summary['tickers']} tickers, {throughput}{details}"
+            if summary["failed"]:
+                details += f"\n⚠️ {summary['failed']} ticker(s) failed"
+        elif summary.get("total_ms"):
+            details = f"\nBuilt in {summary['total_ms']:.0f} ms{details}"
+        elif summary.get("rows"):
+            details = f"\n{summary['rows']:,} rows in {summary['seconds'] * 1000:.0f} ms{details}"
+
+        label = "📄 PDF" if export_type == "pdf" else f"📊 {export_type.upper()}"
         QMessageBox.information(
             self,
             "Export Successful",
-            f"{'📊 CSV' if export_type == 'csv' else '📄 PDF'} exported successfully!\nPath: {path}",
+            f"{label} exported successfully!{details}",
         )
 
     def _on_export_error(self, error_msg):
         """Handle export error"""
-        # Re-enable buttons
-        self.reports_ui.export_csv_btn.setEnabled(True)
-        self.reports_ui.export_csv_btn.setText("📊 Export CSV")
-        self.reports_ui.export_pdf_btn.setEnabled(True)
-        self.reports_ui.export_pdf_btn.setText("📄 Export PDF")
+        self.reports_ui.set_export_busy(False)
 
         QMessageBox.critical(self, "Export Error", f"❌ Failed to export: {error_msg}")
 
+    def show_task_monitor(self):
+        """Toggle the live view of queued and running tasks"""
+        if self.task_monitor is None:
+            from widgets.task_monitor import TaskMonitor
+            self.task_monitor = TaskMonitor(self.scheduler, parent=self)
+        self.task_monitor.setVisible(not self.task_monitor.isVisible())
+
+    def _ensure_perf_panel(self):
+        if self.perf_panel is None:
+            from widgets.perf_panel import PerfPanel
+            self.perf_panel = PerfPanel(parent=self)
+        return self.perf_panel
+
+    def show_perf_panel(self):
+        """Toggle the hidden developer panel with live span timings"""
+        panel = self._ensure_perf_panel()
+        panel.setVisible(not panel.isVisible())
+
+    def toggle_profile(self):
+        """Start/stop a cProfile session of the GUI thread"""
+        self._ensure_perf_panel().toggle_profile()
+
     # ---------------- Cleanup ---------------- #
     def closeEvent(self, event):
         """Properly cleanup all workers before closing (OPTIMIZED)"""
@@ -1133,43 +1320,63 @@ class StockDashboard(QMainWindow):
             self._price_update_timer.stop()
         if self._checkbox_debounce_timer.isActive():
             self._checkbox_debounce_timer.stop()
+        self.prefetcher.cancel()
+        if self.prefetcher.cache.hits:
+            print(f"  ⚡ Prefetch served {self.prefetcher.cache.hits} of "
+                  f"{self.prefetcher.cache.hits + self.prefetcher.cache.misses} searches")
+        charts = self.chart_widget.chart_cache.summary()
+        if charts["figure_hits"] or charts["raster_hits"]:
+            print(f"  🖼️ Chart cache: {charts['figure_hits']} instant, {charts['raster_hits']} "
+                  f"from raster, {charts['misses']} rebuilt ({charts['entries']} kept, {charts['mb']} MB)")
+
+        if self.live_worker:
+            self.live_worker.stop()
+        if self.watchlist_feed:
+            self.watchlist_feed.stop()
+        stats = self.tick_channel.stats()
+        if stats["delivered"]:
+            print(f"  📉 Live ticks coalesced {stats['coalescing_ratio']:.1f}:1 "
+                  f"({stats['published']} ticks → {stats['delivered']} UI updates)")
+
+        if self._news_timer.isActive():
+            self._news_timer.stop()
+
+        # Live feed thread (the websocket)
+        if self.live_feed and self.live_feed.isRunning():
+            print("  Stopping live feed...")
+            try:
+                self.live_feed.stop()
+                self.live_feed.quit()
+                if not self.live_feed.wait(2000):
+                    print("  ⚠️ live feed didn't stop gracefully, terminating...")
+                    self.live_feed.terminate()
+                    self.live_feed.wait(1000)
+                print("  ✓ live feed stopped")
+            except Exception as e:
+                print(f"  ⚠️ Error stopping live feed: {e}")
 
-        # List of all workers to clean up
-        workers_to_cleanup = [
-            (self.live_worker, "live price"),
-            (self.news_worker, "news"),
-            (self.sentiment_worker, "sentiment"),
-            (self.ai_worker, "AI"),
-            (self.worker, "data"),
-            (self.forecast_worker, "hybrid forecast"),
-            (self.ai_report_worker, "AI report"),
-        ]
-
-        for worker, name in workers_to_cleanup:
-            if worker and worker.isRunning():
-                print(f"  Stopping {name} worker...")
-                try:
-                    # Cancel if hybrid forecast worker
-                    if hasattr(worker, 'cancel'):
-                        worker.cancel()
-                    
-                    # Stop if has stop method
-                    if hasattr(worker, 'stop'):
-                        worker.stop()
-
-                    worker.quit()
-
-                    # Wait for thread to finish
-                    if not worker.wait(2000):  # Wait max 2 seconds
-                        print(
-                            f"  ⚠️ {name} worker didn't stop gracefully, terminating..."
-                        )
-                        worker.terminate()
-                        worker.wait(1000)
+        # Every scheduled task is cancelled; pool threads are daemons, so a
+        # blocking network call can't hold up exit
+        if self.scheduler.shutdown(timeout=2.0):
+            print("  ✓ Scheduler stopped")
+        else:
+            print("  ⚠️ Scheduler tasks still finishing, leaving them behind")
 
-                    print(f"  ✓ {name} worker stopped")
-                except Exception as e:
-                    print(f"  ⚠️ Error stopping {name} worker: {e}")
+        stats = info_cache.stats
+        print(f"  ✓ Info cache: {stats['fresh']} fresh, {stats['stale']} stale, "
+              f"{stats['miss']} misses, {stats['refreshed']} refreshed")
+        info_cache.close()
+
+        # Guaranteed final flush of queued live writes (bars, today's close)
+        try:
+            if write_behind.close(timeout=10.0):
+                stats = write_behind.stats()
+                print(f"  ✓ Live writes flushed ({stats['written']} writes, "
+                      f"{stats['merged']} merged, p95 {stats['flush_p95_ms']:.0f} ms)")
+            else:
+                print(f"  ⚠️ {write_behind.depth()} live write(s) still pending")
+        except Exception as e:
+            print(f"  ⚠️ Error flushing live writes: {e}")
 
         # Clean up matplotlib
         try:
@@ -1186,12 +1393,19 @@ class StockDashboard(QMainWindow):
             except Exception as e:
                 print(f"  ⚠️ Error cleaning reports UI: {e}")
 
+        if perf.profiling():
+            print(f"  🔬 cProfile session saved to {perf.stop_profile()}")
+        if perf.enabled():
+            print(f"  💾 Chrome trace written to {perf.dump_trace()}")
+
         print("✅ All workers cleaned up successfully")
         event.accept()
 
 
 # ---------------- Run App ---------------- #
 if __name__ == "__main__":
+    # PDF batch exports spawn worker processes; needed for frozen builds
+    multiprocessing.freeze_support()
     app = QApplication(sys.argv)
 
     # Set application properties
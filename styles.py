@@ -802,3 +802,139 @@ QPushButton, QCheckBox, QLineEdit, QFrame {
 
 def get_theme(is_dark):
     return DARK_STYLE if is_dark else LIGHT_STYLE
+
+
+# ======== APPLICATION-LEVEL THEMING ======== #
+# Both themes are compiled once into a single application stylesheet whose
+# rules are scoped by a `theme` dynamic property on the top-level window.
+# Switching theme then only flips the property and re-polishes - Qt never has
+# to re-parse hundreds of lines of CSS per widget.
+
+import re
+
+_COMMENT_RE = re.compile(r"/\*.*?\*/", re.S)
+_RULE_RE = re.compile(r"([^{}]+)\{([^{}]*)\}")
+_TYPE_RE = re.compile(r"^(\*|[A-Za-z_]\w*)(.*)$")
+
+# scope (widget class name) -> (light css, dark css)
+_SCOPED_STYLES = {}
+_compiled_stylesheet = None
+
+# Colors used by custom-painted widgets (QPainter / pyqtgraph / matplotlib)
+PALETTE_COLORS = {
+    True: {
+        "window": "#0f172a", "base": "#1e293b", "alt_base": "#334155",
+        "text": "#e2e8f0", "muted": "#94a3b8", "grid": "#334155",
+        "accent": "#3b82f6", "up": "#10b981", "down": "#ef4444",
+    },
+    False: {
+        "window": "#fafbfc", "base": "#ffffff", "alt_base": "#f3f4f6",
+        "text": "#1a202c", "muted": "#6b7280", "grid": "#e5e7eb",
+        "accent": "#3b82f6", "up": "#059669", "down": "#dc2626",
+    },
+}
+
+
+def theme_name(is_dark):
+    return "dark" if is_dark else "light"
+
+
+def compile_stylesheet(css, is_dark, scope=None):
+    """Prefix every selector in `css` with the theme property selector.
+
+    Unscoped rules match the themed top-level widget and its descendants.
+    Scoped rules only match inside widgets of class `scope`, mirroring what
+    the same CSS did when it was set with `scope.setStyleSheet(...)`.
+    """
+    prop = f'[theme="{theme_name(is_dark)}"]'
+    out = []
+    for selectors, body in _RULE_RE.findall(_COMMENT_RE.sub("", css)):
+        compiled = []
+        for sel in (s.strip() for s in selectors.split(",")):
+            if not sel:
+                continue
+            match = _TYPE_RE.match(sel)
+            if scope is None:
+                if match:
+                    compiled.append(f"{match.group(1)}{prop}{match.group(2)}")
+                compiled.append(f"*{prop} {sel}")
+            else:
+                # Rules that used to style the scoped widget itself
+                if match and match.group(1) in ("QWidget", scope) and " " not in match.group(2):
+                    compiled.append(f"*{prop} {scope}{match.group(2)}")
+                compiled.append(f"*{prop} {scope} {sel}")
+        if compiled:
+            out.append(f"{', '.join(compiled)} {{{body}}}")
+    return "\n".join(out)
+
+
+def register_scoped_style(scope, light_css, dark_css):
+    """Register per-widget CSS (formerly set via setStyleSheet) with the app sheet.
+
+    Called from a widget's constructor; only the first registration per scope
+    recompiles, so lazily built pages pay the cost once per session.
+    """
+    global _compiled_stylesheet
+    if scope in _SCOPED_STYLES:
+        return False
+    _SCOPED_STYLES[scope] = (light_css, dark_css)
+    _compiled_stylesheet = None
+
+    from PyQt5.QtWidgets import QApplication
+    app = QApplication.instance()
+    if app is not None and app.property("stockdash_styled"):
+        app.setStyleSheet(app_stylesheet())
+    return True
+
+
+def app_stylesheet():
+    """Return the compiled stylesheet containing both themes (cached)"""
+    global _compiled_stylesheet
+    if _compiled_stylesheet is None:
+        parts = [compile_stylesheet(LIGHT_STYLE, False), compile_stylesheet(DARK_STYLE, True)]
+        for scope, (light_css, dark_css) in _SCOPED_STYLES.items():
+            parts.append(compile_stylesheet(light_css, False, scope))
+            parts.append(compile_stylesheet(dark_css, True, scope))
+        _compiled_stylesheet = "\n".join(parts)
+    return _compiled_stylesheet
+
+
+def get_palette(is_dark):
+    """QPalette matching the theme, for widgets that paint themselves"""
+    from PyQt5.QtGui import QPalette, QColor
+
+    c = PALETTE_COLORS[is_dark]
+    palette = QPalette()
+    palette.setColor(QPalette.Window, QColor(c["window"]))
+    palette.setColor(QPalette.Base, QColor(c["base"]))
+    palette.setColor(QPalette.AlternateBase, QColor(c["alt_base"]))
+    palette.setColor(QPalette.WindowText, QColor(c["text"]))
+    palette.setColor(QPalette.Text, QColor(c["text"]))
+    palette.setColor(QPalette.ButtonText, QColor(c["text"]))
+    palette.setColor(QPalette.PlaceholderText, QColor(c["muted"]))
+    palette.setColor(QPalette.Mid, QColor(c["grid"]))
+    palette.setColor(QPalette.Highlight, QColor(c["accent"]))
+    return palette
+
+
+def apply_app_theme(root, is_dark):
+    """Switch `root` (and everything under it) to the given theme.
+
+    Installs the compiled application stylesheet on first use, then flips the
+    `theme` property and re-polishes each widget exactly once.
+    """
+    from PyQt5.QtWidgets import QApplication, QWidget
+
+    app = QApplication.instance()
+    if not app.property("stockdash_styled"):
+        app.setProperty("stockdash_styled", True)
+        app.setStyleSheet(app_stylesheet())
+
+    app.setPalette(get_palette(is_dark))
+    root.setProperty("theme", theme_name(is_dark))
+
+    style = root.style()
+    for widget in [root] + root.findChildren(QWidget):
+        style.unpolish(widget)
+        style.polish(widget)
+    root.update()
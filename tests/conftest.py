@@ -0,0 +1,23 @@
+# tests/conftest.py
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+os.environ.setdefault("MPLBACKEND", "Agg")
+sys.path.insert(0, ROOT)
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    """An empty parquet store; its folders are relative, so run from tmp_path"""
+    from core.history_cache import history_cache
+
+    monkeypatch.chdir(tmp_path)
+    os.makedirs("csv_data_files")
+    # Versions restart at 1 in every store: mapped views must not leak across
+    history_cache.invalidate()
+    yield tmp_path
+    history_cache.invalidate()
@@ -0,0 +1,71 @@
+# tests/test_bar_builder.py
+import pandas as pd
+
+from core.bar_builder import BarBuilder
+
+
+def utc(stamp):
+    return pd.Timestamp(stamp, tz="UTC").timestamp()
+
+
+def test_ticks_in_one_minute_fold_into_one_bar():
+    bars = BarBuilder("aapl", timeframes=("1m",))
+    assert bars.on_tick(utc("2024-03-05 14:30:05"), 100.0, day_volume=1_000) == []
+    assert bars.on_tick(utc("2024-03-05 14:30:20"), 102.0, day_volume=1_500) == []
+    assert bars.on_tick(utc("2024-03-05 14:30:40"), 99.0, day_volume=1_600) == []
+
+    # Exchange time: 14:30 UTC is 09:30 in New York
+    start, open_, high, low, close, volume = bars.current("1m")
+    assert pd.Timestamp(start, unit="s") == pd.Timestamp("2024-03-05 09:30")
+    assert (open_, high, low, close) == (100.0, 102.0, 99.0, 99.0)
+    assert volume == 600  # deltas of day_volume after the first tick
+
+
+def test_new_bucket_closes_the_bar_and_drain_takes_it_once():
+    bars = BarBuilder("AAPL", timeframes=("1m", "5m"))
+    bars.on_tick(utc("2024-03-05 14:30:05"), 100.0)
+    assert bars.on_tick(utc("2024-03-05 14:31:00"), 101.0) == ["1m"]
+    assert bars.has_pending()
+
+    drained = bars.drain()
+    assert list(drained) == ["1m"]
+    assert drained["1m"]["Close"].tolist() == [100.0]
+    assert bars.drain() == {}
+
+
+def test_drain_can_leave_timeframes_pending():
+    bars = BarBuilder("AAPL", timeframes=("1m", "1d"))
+    bars.on_tick(utc("2024-03-04 15:00"), 100.0)
+    bars.on_tick(utc("2024-03-05 15:00"), 101.0)
+
+    assert list(bars.drain(("1m",))) == ["1m"]
+    assert bars.has_pending()
+    assert list(bars.drain(("1d",))) == ["1d"]
+    assert not bars.has_pending()
+
+
+def test_daily_bar_is_one_exchange_session():
+    # 09:30-16:00 New York is 14:30-21:00 UTC, across midnight in Tokyo
+    session = pd.date_range("2024-03-05 14:30", "2024-03-05 21:00", freq="30min", tz="UTC")
+
+    new_york = BarBuilder("AAPL", timeframes=("1d",))
+    tokyo = BarBuilder("7203.T", timeframes=("1d",), tz="Asia/Tokyo")
+    for i, ts in enumerate(session):
+        new_york.on_tick(ts.timestamp(), 100.0 + i)
+        tokyo.on_tick(ts.timestamp(), 100.0 + i)
+
+    daily = new_york.frame("1d")
+    assert daily["Date"].tolist() == [pd.Timestamp("2024-03-05")]
+    assert daily["Open"].iloc[0] == 100.0
+    assert daily["Close"].iloc[0] == 100.0 + len(session) - 1
+    assert len(tokyo.frame("1d")) == 2
+
+
+def test_day_volume_restarts_on_a_new_day():
+    bars = BarBuilder("AAPL", timeframes=("1d",))
+    bars.on_tick(utc("2024-03-04 15:00"), 100.0, day_volume=50_000)
+    bars.on_tick(utc("2024-03-04 20:00"), 100.0, day_volume=80_000)
+    bars.on_tick(utc("2024-03-05 15:00"), 100.0, day_volume=1_000)
+
+    assert bars.last_volume == 0.0  # no delta against yesterday's total
+    assert bars.frame("1d")["Volume"].tolist() == [30_000, 0]
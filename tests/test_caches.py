@@ -0,0 +1,97 @@
+# tests/test_caches.py
+from core import parquet_store
+from core.chart_cache import ChartStateCache, data_fingerprint
+from core.history_cache import get_history
+from core.levels import LevelTracker
+from core.prefetch import Budget, PrefetchCache
+from core.providers import synthetic_ohlcv
+from core.snapshot import MarketSnapshot
+
+
+def revised(df, row=10, factor=1.1):
+    """`df` with one older bar adjusted, same length and dates"""
+    df = df.copy()
+    for col in ("Open", "High", "Low", "Close"):
+        df.loc[row, col] *= factor
+    return df
+
+
+# ---------------- History cache ---------------- #
+def test_history_cache_follows_the_store_version(store):
+    df = synthetic_ohlcv(60)
+    parquet_store.save("AAPL", df)
+    first = get_history("AAPL")
+    assert len(first) == 60
+
+    parquet_store.save("AAPL", revised(df, factor=2.0))
+    second = get_history("AAPL")
+    assert second["Close"].iloc[10] == first["Close"].iloc[10] * 2
+
+
+# ---------------- Prefetch ---------------- #
+def test_prefetch_entry_is_dropped_once_the_store_is_written(store):
+    df = synthetic_ohlcv(30)
+    _, version = parquet_store.save("AAPL", df)
+    cache = PrefetchCache()
+
+    cache.put("AAPL", (MarketSnapshot.from_frame("AAPL", df, store_version=version), {}, "", []))
+    assert cache.warm("AAPL")
+    assert cache.take("AAPL")[0].store_version == version
+
+    cache.put("AAPL", (MarketSnapshot.from_frame("AAPL", df, store_version=version), {}, "", []))
+    parquet_store.save("AAPL", df)
+    assert not cache.warm("AAPL")
+    assert cache.take("AAPL") is None
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_prefetch_entry_expires(store):
+    cache = PrefetchCache(ttl_s=0)
+    cache.put("AAPL", (MarketSnapshot.from_frame("AAPL", synthetic_ohlcv(5)), {}, "", []))
+    assert cache.take("AAPL") is None
+
+
+def test_budget_caps_calls_per_window():
+    budget = Budget(max_calls=8, window_s=60)
+    assert budget.take_calls(4) and budget.take_calls(4)
+    assert not budget.take_calls(1)
+    assert budget.calls_left() == 0
+
+
+# ---------------- Chart cache ---------------- #
+def test_fingerprint_is_content_based():
+    df = synthetic_ohlcv(200)
+    same = data_fingerprint(MarketSnapshot.from_frame("AAPL", df))
+    assert data_fingerprint(MarketSnapshot.from_frame("AAPL", df.copy())) == same
+    # A split/dividend adjustment of an old bar keeps length and last close
+    assert data_fingerprint(MarketSnapshot.from_frame("AAPL", revised(df))) != same
+
+
+def test_chart_cache_demotes_then_evicts():
+    released = []
+    cache = ChartStateCache(max_bytes=220, max_figures=1, release=released.append)
+    cache.put("a", figure="fig-a", raster="png-a", size=(1, 1), figure_bytes=100, raster_bytes=10)
+    cache.put("b", figure="fig-b", raster="png-b", size=(1, 1), figure_bytes=100, raster_bytes=10)
+    assert released == ["fig-a"]  # past max_figures: the oldest keeps only its raster
+    assert cache.take("a", size=(1, 1)) == (None, "png-a")
+
+    cache.put("c", figure="fig-c", raster="png-c", size=(1, 1), figure_bytes=200, raster_bytes=10)
+    assert "fig-b" in released
+    assert cache.take("b", size=(1, 1)) == (None, None)  # least recently used goes first
+    assert cache.take("a", size=(1, 1)) == (None, "png-a")
+    assert cache.take("c", size=(1, 1)) == ("fig-c", "png-c")
+    assert cache.take("c", size=(2, 2)) == (None, None)  # figure handed out, raster size differs
+
+
+# ---------------- Levels ---------------- #
+def test_level_tracker_rescans_revised_history():
+    df = synthetic_ohlcv(400, seed=11)
+    tracker = LevelTracker()
+    tracker.update(df.iloc[:-1])
+    tracker.update(df)
+    assert (tracker.full_scans, tracker.incremental_scans) == (1, 1)
+
+    changed = revised(df, row=50, factor=1.5)
+    assert tracker.update(changed) == LevelTracker().update(changed)
+    assert tracker.full_scans == 2
+
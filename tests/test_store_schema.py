@@ -0,0 +1,79 @@
+# tests/test_store_schema.py
+import numpy as np
+import pandas as pd
+import pyarrow.parquet as pq
+
+from core import parquet_store
+from core.providers import synthetic_ohlcv
+from core.store_schema import (
+    STORE_SCHEMA, conform_table, has_store_schema, migrate_file, normalize_frame, to_frame,
+    write_store,
+)
+
+
+def legacy_frame(bars=50):
+    """What older versions saved: float64 everything, string dates"""
+    df = synthetic_ohlcv(bars, seed=3)
+    df["Date"] = df["Date"].dt.strftime("%Y-%m-%d")
+    return df
+
+
+def test_normalize_frame_dtypes_and_order():
+    df = synthetic_ohlcv(20).iloc[::-1]
+    out = normalize_frame(df, " aapl ")
+    assert out["Date"].is_monotonic_increasing
+    assert str(out["Date"].dtype) == "datetime64[s]"
+    assert all(out[col].dtype == np.float32 for col in ("Open", "High", "Low", "Close"))
+    assert out["Volume"].dtype == np.uint64
+    assert out["Ticker"].unique().tolist() == ["AAPL"]
+
+
+def test_write_and_read_back(tmp_path):
+    df = synthetic_ohlcv(100)
+    path = tmp_path / "AAPL.parquet"
+    write_store(df, "AAPL", path)
+
+    assert pq.read_schema(path).names == STORE_SCHEMA.names
+    frame = to_frame(pq.read_table(path))
+    assert list(frame.columns) == ["Date", "Open", "High", "Low", "Close", "Volume"]
+    assert str(frame["Date"].dtype) == "datetime64[ns]"
+    assert (frame["Date"].to_numpy() == df["Date"].to_numpy()).all()
+    np.testing.assert_allclose(frame["Close"], df["Close"], rtol=1e-6)
+    assert (frame["Volume"].to_numpy() == df["Volume"].to_numpy()).all()
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+def test_migrate_file_round_trip(tmp_path):
+    df = legacy_frame()
+    path = tmp_path / "MSFT.parquet"
+    df.to_parquet(path, index=False)
+    assert not has_store_schema(path)
+
+    assert migrate_file(str(path))
+    assert has_store_schema(path)
+    assert not migrate_file(str(path))  # already compact
+
+    table = pq.read_table(path)
+    assert table.column("Ticker").to_pylist() == ["MSFT"] * len(df)
+    frame = to_frame(table)
+    assert (frame["Date"] == pd.to_datetime(df["Date"])).all()
+    np.testing.assert_allclose(frame["Open"], df["Open"], rtol=1e-6)
+
+
+def test_conform_table_casts_a_parquet_read(tmp_path):
+    path = tmp_path / "AAPL.parquet"
+    write_store(synthetic_ohlcv(10), "AAPL", path)
+    table = pq.read_table(path)  # parquet has no seconds unit
+
+    conformed = conform_table(table, "AAPL")
+    assert conformed.schema.remove_metadata().equals(STORE_SCHEMA)
+
+
+def test_migrate_store_bumps_versions_once(store):
+    legacy_frame().to_parquet(parquet_store.parquet_path("AAPL"), index=False)
+    write_store(synthetic_ohlcv(10), "MSFT", parquet_store.parquet_path("MSFT"))
+
+    assert parquet_store.migrate_store() == 1
+    assert parquet_store.store_version("AAPL") == 1
+    assert parquet_store.store_version("MSFT") == 0
+    assert parquet_store.migrate_store() == 0  # marker written
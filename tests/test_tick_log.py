@@ -0,0 +1,46 @@
+# tests/test_tick_log.py
+import pytest
+
+from core.tick_log import MAGIC, read_ticks, write_ticks
+
+TICKS = [
+    (1_700_000_000.0, {"id": "AAPL", "price": 190.5, "time": 1_700_000_000_000, "day_volume": 10}),
+    (1_700_000_000.5, {"id": "MSFT", "price": 370.25}),
+    (1_700_000_001.0, {"id": "AAPL", "price": 190.75, "day_volume": 25}),
+    (1_700_000_001.5, {"id": "AAPL", "marketHours": 1}),
+]
+
+
+@pytest.fixture
+def log(tmp_path):
+    path = tmp_path / "ticks.bin"
+    assert write_ticks(path, TICKS) == len(TICKS)
+    return path
+
+
+def test_round_trip(log):
+    assert list(read_ticks(log)) == TICKS
+
+
+def test_truncated_tail_stops_at_last_complete_record(log, tmp_path):
+    data = log.read_bytes()
+    cut = tmp_path / "cut.bin"
+    for size in range(len(MAGIC), len(data)):
+        cut.write_bytes(data[:size])
+        ticks = list(read_ticks(cut))
+        # Always a prefix of what was recorded, never an exception
+        assert ticks == TICKS[:len(ticks)]
+        assert len(ticks) < len(TICKS)
+
+
+def test_not_a_tick_log(tmp_path):
+    path = tmp_path / "other.bin"
+    path.write_bytes(b"PAR1" + bytes(16))
+    with pytest.raises(ValueError):
+        list(read_ticks(path))
+
+
+def test_unknown_record_kind_is_corrupt(log):
+    log.write_bytes(log.read_bytes() + b"\x07")
+    with pytest.raises(ValueError):
+        list(read_ticks(log))
@@ -139,6 +139,7 @@ class DashboardUI(QWidget):
             ("📊 History", "history"),
             ("📋 Reports", "reports"),
             ("💹  Market Mood", "market mood"),
+            ("👀 Watchlist", "watchlist"),
         ]
         
         for item_text, item_id in menu_items:
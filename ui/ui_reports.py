@@ -3,7 +3,7 @@
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QLabel, QPushButton, QTextEdit, QFrame,
     QSizePolicy, QHBoxLayout, QScrollArea, QGridLayout, QToolTip,
-    QApplication, QProgressBar, QTabWidget,
+    QApplication, QProgressBar, QTabWidget, QComboBox,
 )
 from PyQt5.QtCore import Qt, QTimer, pyqtSignal, QThread
 from PyQt5.QtGui import QFont, QPalette, QColor
@@ -14,6 +14,10 @@ from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 import pandas as pd
 import numpy as np
 
+from core.snapshot import MarketSnapshot
+
+from styles import register_scoped_style
+
 
 class ChartWorker(QThread):
     """Worker thread for chart generation to prevent UI blocking"""
@@ -22,9 +26,10 @@ class ChartWorker(QThread):
     
     def __init__(self, df, ticker, forecast_df, is_dark_mode):
         super().__init__()
-        self.df = df.copy()
+        # Read-only use of a snapshot frame - no copy needed
+        self.df = df
         self.ticker = ticker
-        self.forecast_df = forecast_df.copy() if forecast_df is not None else None
+        self.forecast_df = forecast_df.copy(deep=False) if forecast_df is not None else None
         self.is_dark_mode = is_dark_mode
         
     def run(self):
@@ -104,6 +109,303 @@ class ChartWorker(QThread):
         return fig
 
 
+# Page stylesheets - compiled into the application stylesheet (see styles.py)
+REPORTS_LIGHT_STYLE = """
+QWidget {
+    background-color: #f8f9fa;
+    color: #2c3e50;
+}
+QFrame {
+    background-color: #ffffff;
+    border: 1px solid #e9ecef;
+    border-radius: 12px;
+    padding: 10px;
+}
+
+/* Tab Widget Styling */
+QTabWidget#reports_tabs::pane {
+    border: 1px solid #e2e8f0;
+    border-radius: 12px;
+    background: white;
+    padding: 10px;
+}
+QTabWidget#reports_tabs QTabBar::tab {
+    background: #f8fafc;
+    color: #64748b;
+    border: 1px solid #e2e8f0;
+    border-bottom: none;
+    border-top-left-radius: 8px;
+    border-top-right-radius: 8px;
+    padding: 12px 24px;
+    margin-right: 4px;
+    font-weight: 600;
+    font-size: 11px;
+}
+QTabWidget#reports_tabs QTabBar::tab:selected {
+    background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+                stop:0 #3b82f6, stop:1 #8b5cf6);
+    color: white;
+    border: 1px solid #3b82f6;
+}
+QTabWidget#reports_tabs QTabBar::tab:hover {
+    background: #f1f5f9;
+    color: #334155;
+}
+
+/* AI Report Button */
+QPushButton#generate_ai_btn {
+    background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+                stop:0 #8b5cf6, stop:1 #a855f7);
+    color: white;
+    border: none;
+    border-radius: 8px;
+    font-weight: 600;
+    font-size: 12px;
+    padding: 10px 20px;
+}
+QPushButton#generate_ai_btn:hover {
+    background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+                stop:0 #7c3aed, stop:1 #9333ea);
+}
+QPushButton#generate_ai_btn:pressed {
+    background: #6d28d9;
+}
+QPushButton#generate_ai_btn:disabled {
+    background: #d1d5db;
+    color: #9ca3af;
+}
+
+/* AI Status Label */
+QLabel#ai_status_label {
+    color: #64748b;
+    font-size: 11px;
+    font-style: italic;
+    padding: 8px;
+    background: rgba(59, 130, 246, 0.1);
+    border-radius: 6px;
+    border-left: 3px solid #3b82f6;
+}
+
+/* AI Report Text */
+QTextEdit#ai_report_text {
+    background: white;
+    color: #1f2937;
+    border: 1px solid #e2e8f0;
+    border-radius: 12px;
+    padding: 20px;
+    font-family: 'Segoe UI', 'Inter', system-ui, sans-serif;
+    font-size: 11px;
+    line-height: 1.6;
+}
+
+QFrame#stat_card, QFrame#metric_card {
+    background: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1,
+                                stop: 0 #ffffff, stop: 1 #f8f9fa);
+    border: 2px solid #e9ecef;
+    border-radius: 12px;
+}
+QFrame#stat_card:hover, QFrame#metric_card:hover {
+    border: 2px solid #007bff;
+    background: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1,
+                                stop: 0 rgba(0, 123, 255, 0.05), 
+                                stop: 1 rgba(0, 123, 255, 0.02));
+}
+QLabel#stat_value, QLabel#metric_value {
+    color: #007bff;
+}
+QProgressBar {
+    border: 2px solid #007bff;
+    border-radius: 8px;
+    text-align: center;
+    background-color: #e9ecef;
+}
+QProgressBar::chunk {
+    background-color: #007bff;
+    border-radius: 6px;
+}
+QPushButton {
+    background-color: #007bff;
+    color: white;
+    border: none;
+    border-radius: 8px;
+    padding: 10px 20px;
+    font-weight: bold;
+    font-size: 12px;
+}
+QPushButton:hover {
+    background-color: #0056b3;
+}
+QComboBox#export_format_combo {
+    background-color: #ffffff;
+    border: 2px solid #e9ecef;
+    border-radius: 8px;
+    padding: 6px 12px;
+    color: #212529;
+    font-weight: bold;
+}
+QTextEdit {
+    background-color: #ffffff;
+    border: 2px solid #e9ecef;
+    border-radius: 8px;
+    padding: 15px;
+    font-family: 'Consolas', monospace;
+}
+QScrollArea#ai_scroll_area {
+    border: none;
+    background-color: transparent;
+}
+
+"""
+
+REPORTS_DARK_STYLE = """
+QWidget {
+    background-color: #1a1a1a;
+    color: #e9ecef;
+}
+QFrame {
+    background-color: #2d3748;
+    border: 1px solid #4a5568;
+    border-radius: 12px;
+    padding: 10px;
+}
+
+/* Tab Widget Styling */
+QTabWidget#reports_tabs::pane {
+    border: 1px solid #334155;
+    border-radius: 12px;
+    background: #1e293b;
+    padding: 10px;
+}
+QTabWidget#reports_tabs QTabBar::tab {
+    background: #334155;
+    color: #94a3b8;
+    border: 1px solid #475569;
+    border-bottom: none;
+    border-top-left-radius: 8px;
+    border-top-right-radius: 8px;
+    padding: 12px 24px;
+    margin-right: 4px;
+    font-weight: 600;
+    font-size: 11px;
+}
+QTabWidget#reports_tabs QTabBar::tab:selected {
+    background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+                stop:0 #3b82f6, stop:1 #8b5cf6);
+    color: white;
+    border: 1px solid #3b82f6;
+}
+QTabWidget#reports_tabs QTabBar::tab:hover {
+    background: #475569;
+    color: #e2e8f0;
+}
+
+/* AI Report Button */
+QPushButton#generate_ai_btn {
+    background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+                stop:0 #8b5cf6, stop:1 #a855f7);
+    color: white;
+    border: none;
+    border-radius: 8px;
+    font-weight: 600;
+    font-size: 12px;
+    padding: 10px 20px;
+}
+QPushButton#generate_ai_btn:hover {
+    background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+                stop:0 #7c3aed, stop:1 #9333ea);
+}
+QPushButton#generate_ai_btn:pressed {
+    background: #6d28d9;
+}
+QPushButton#generate_ai_btn:disabled {
+    background: #4b5563;
+    color: #9ca3af;
+}
+
+/* AI Status Label */
+QLabel#ai_status_label {
+    color: #94a3b8;
+    font-size: 11px;
+    font-style: italic;
+    padding: 8px;
+    background: rgba(59, 130, 246, 0.1);
+    border-radius: 6px;
+    border-left: 3px solid #3b82f6;
+}
+
+/* AI Report Text */
+QTextEdit#ai_report_text {
+    background: #1e293b;
+    color: #e2e8f0;
+    border: 1px solid #334155;
+    border-radius: 12px;
+    padding: 20px;
+    font-family: 'Segoe UI', 'Inter', system-ui, sans-serif;
+    font-size: 11px;
+    line-height: 1.6;
+}
+
+QFrame#stat_card, QFrame#metric_card {
+    background: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1,
+                                stop: 0 #2d3748, stop: 1 #1a202c);
+    border: 2px solid #4a5568;
+    border-radius: 12px;
+}
+QFrame#stat_card:hover, QFrame#metric_card:hover {
+    border: 2px solid #4299e1;
+    background: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1,
+                                stop: 0 rgba(66, 153, 225, 0.1), 
+                                stop: 1 rgba(66, 153, 225, 0.05));
+}
+QLabel#stat_value, QLabel#metric_value {
+    color: #4299e1;
+}
+QProgressBar {
+    border: 2px solid #4299e1;
+    border-radius: 8px;
+    text-align: center;
+    background-color: #1a202c;
+}
+QProgressBar::chunk {
+    background-color: #4299e1;
+    border-radius: 6px;
+}
+QPushButton {
+    background-color: #4299e1;
+    color: white;
+    border: none;
+    border-radius: 8px;
+    padding: 10px 20px;
+    font-weight: bold;
+    font-size: 12px;
+}
+QPushButton:hover {
+    background-color: #3182ce;
+}
+QComboBox#export_format_combo {
+    background-color: #2d3748;
+    border: 2px solid #4a5568;
+    border-radius: 8px;
+    padding: 6px 12px;
+    color: #e9ecef;
+    font-weight: bold;
+}
+QTextEdit {
+    background-color: #2d3748;
+    border: 2px solid #4a5568;
+    border-radius: 8px;
+    padding: 15px;
+    color: #e9ecef;
+    font-family: 'Consolas', monospace;
+}
+QScrollArea#ai_scroll_area {
+    border: none;
+    background-color: transparent;
+}
+
+"""
+
+
 class ReportsUI(QWidget):
     def __init__(self):
         super().__init__()
@@ -111,6 +413,8 @@ class ReportsUI(QWidget):
         self.current_canvas = None
         self.chart_worker = None
         self._cached_stats = None
+        # Styling comes from the app stylesheet, keyed on the window's theme
+        register_scoped_style("ReportsUI", REPORTS_LIGHT_STYLE, REPORTS_DARK_STYLE)
         self.setup_ui()
 
     def setup_ui(self):
@@ -164,16 +468,30 @@ class ReportsUI(QWidget):
         export_layout = QHBoxLayout(export_frame)
         export_layout.setSpacing(15)
 
-        self.export_csv_btn = QPushButton("📄 Export to CSV")
+        # Data exports stream in the chosen format; PDF is always the report
+        self.export_format_combo = QComboBox()
+        self.export_format_combo.setObjectName("export_format_combo")
+        self.export_format_combo.setFixedSize(120, 45)
+        for label, fmt in (("CSV", "csv"), ("Parquet", "parquet"), ("Arrow", "arrow"), ("PDF", "pdf")):
+            self.export_format_combo.addItem(label, fmt)
+
+        self.export_csv_btn = QPushButton("📄 Export Data")
         self.export_csv_btn.setFixedSize(160, 45)
         self.export_csv_btn.setCursor(Qt.PointingHandCursor)
 
+        self.export_all_btn = QPushButton("📦 Export All")
+        self.export_all_btn.setFixedSize(160, 45)
+        self.export_all_btn.setCursor(Qt.PointingHandCursor)
+        self.export_all_btn.setToolTip("Export every ticker in the local store")
+
         self.export_pdf_btn = QPushButton("📋 Export to PDF")
         self.export_pdf_btn.setFixedSize(160, 45)
         self.export_pdf_btn.setCursor(Qt.PointingHandCursor)
 
         export_layout.addStretch()
+        export_layout.addWidget(self.export_format_combo)
         export_layout.addWidget(self.export_csv_btn)
+        export_layout.addWidget(self.export_all_btn)
         export_layout.addWidget(self.export_pdf_btn)
         export_layout.addStretch()
 
@@ -183,6 +501,18 @@ class ReportsUI(QWidget):
         main_layout.addWidget(export_frame)
         self.setLayout(main_layout)
 
+    def export_format(self):
+        return self.export_format_combo.currentData()
+
+    def set_export_busy(self, busy, button=None, text="⏳ Exporting..."):
+        """Disable the export buttons while a job runs, labelling the one that started it"""
+        for btn, idle_text in ((self.export_csv_btn, "📄 Export Data"),
+                               (self.export_all_btn, "📦 Export All"),
+                               (self.export_pdf_btn, "📋 Export to PDF")):
+            btn.setEnabled(not busy)
+            btn.setText(text if busy and btn is button else idle_text)
+        self.export_format_combo.setEnabled(not busy)
+
     def setup_stats_tab(self):
         """Setup the statistical report tab (existing functionality)"""
         # Content area with scroll
@@ -567,25 +897,28 @@ class ReportsUI(QWidget):
         card.setToolTip(f"{icon} {title}\nValue: {value}")
         return card, value_label
 
-    def set_report(self, df: pd.DataFrame, ticker: str, forecast_df: pd.DataFrame = None, metrics: dict = None):
+    def set_report(self, snapshot: MarketSnapshot, ticker: str, forecast_df: pd.DataFrame = None, metrics: dict = None):
         """Populate summary + chart + metrics in reports UI"""
-        if df is None or df.empty:
+        if snapshot is None or snapshot.empty:
             self.summary_text.setText("❌ No data available for analysis.")
             self.hide_loading()
             return
 
+        # Date-indexed view over the shared snapshot; only Close is charted
+        df = snapshot.frame(["Close"])
+
         # Hide loading indicators
         self.hide_loading()
 
         # Calculate and display stats
-        if self._cached_stats is None or len(df) != self._cached_stats.get('data_length'):
+        if self._cached_stats is None or snapshot.version != self._cached_stats.get('version'):
             stats = {
                 "Min Price": float(df["Close"].min()),
                 "Max Price": float(df["Close"].max()),
                 "Average Price": float(df["Close"].mean()),
                 "Volatility": float(df["Close"].std()),
             }
-            self._cached_stats = {'stats': stats, 'data_length': len(df)}
+            self._cached_stats = {'stats': stats, 'version': snapshot.version}
         else:
             stats = self._cached_stats['stats']
 
@@ -616,14 +949,6 @@ class ReportsUI(QWidget):
             summary_str += f"   • {stat_name}: ${value:.2f}\n"
         summary_str += f"\n📈 Data Points: {len(df)} records"
 
-        # Ensure datetime index
-        if not pd.api.types.is_datetime64_any_dtype(df.index):
-            if "Date" in df.columns:
-                df["Date"] = pd.to_datetime(df["Date"])
-                df.set_index("Date", inplace=True)
-            else:
-                df.index = pd.to_datetime(df.index)
-
         try:
             summary_str += f"\n📅 Date Range: {df.index[0].strftime('%Y-%m-%d')} to {df.index[-1].strftime('%Y-%m-%d')}"
         except:
@@ -703,7 +1028,11 @@ class ReportsUI(QWidget):
     # ===== Theme Methods =====
 
     def set_theme(self, is_dark_mode):
-        """Set theme - called from main window"""
+        """Set theme - called from main window.
+
+        Widget colors follow the application stylesheet; this only records the
+        mode for the next chart render and updates tooltip colors.
+        """
         self.is_dark_mode = is_dark_mode
         self.apply_theme()
 
@@ -719,288 +1048,11 @@ class ReportsUI(QWidget):
         QToolTip.setFont(QFont("Segoe UI", 10))
         QToolTip.setPalette(QPalette(QColor("#2c3e50"), QColor("#ffffff")))
 
-        self.setStyleSheet("""
-            QWidget {
-                background-color: #f8f9fa;
-                color: #2c3e50;
-            }
-            QFrame {
-                background-color: #ffffff;
-                border: 1px solid #e9ecef;
-                border-radius: 12px;
-                padding: 10px;
-            }
-            
-            /* Tab Widget Styling */
-            QTabWidget#reports_tabs::pane {
-                border: 1px solid #e2e8f0;
-                border-radius: 12px;
-                background: white;
-                padding: 10px;
-            }
-            QTabWidget#reports_tabs QTabBar::tab {
-                background: #f8fafc;
-                color: #64748b;
-                border: 1px solid #e2e8f0;
-                border-bottom: none;
-                border-top-left-radius: 8px;
-                border-top-right-radius: 8px;
-                padding: 12px 24px;
-                margin-right: 4px;
-                font-weight: 600;
-                font-size: 11px;
-            }
-            QTabWidget#reports_tabs QTabBar::tab:selected {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                            stop:0 #3b82f6, stop:1 #8b5cf6);
-                color: white;
-                border: 1px solid #3b82f6;
-            }
-            QTabWidget#reports_tabs QTabBar::tab:hover {
-                background: #f1f5f9;
-                color: #334155;
-            }
-            
-            /* AI Report Button */
-            QPushButton#generate_ai_btn {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                            stop:0 #8b5cf6, stop:1 #a855f7);
-                color: white;
-                border: none;
-                border-radius: 8px;
-                font-weight: 600;
-                font-size: 12px;
-                padding: 10px 20px;
-            }
-            QPushButton#generate_ai_btn:hover {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                            stop:0 #7c3aed, stop:1 #9333ea);
-            }
-            QPushButton#generate_ai_btn:pressed {
-                background: #6d28d9;
-            }
-            QPushButton#generate_ai_btn:disabled {
-                background: #d1d5db;
-                color: #9ca3af;
-            }
-            
-            /* AI Status Label */
-            QLabel#ai_status_label {
-                color: #64748b;
-                font-size: 11px;
-                font-style: italic;
-                padding: 8px;
-                background: rgba(59, 130, 246, 0.1);
-                border-radius: 6px;
-                border-left: 3px solid #3b82f6;
-            }
-            
-            /* AI Report Text */
-            QTextEdit#ai_report_text {
-                background: white;
-                color: #1f2937;
-                border: 1px solid #e2e8f0;
-                border-radius: 12px;
-                padding: 20px;
-                font-family: 'Segoe UI', 'Inter', system-ui, sans-serif;
-                font-size: 11px;
-                line-height: 1.6;
-            }
-            
-            QFrame#stat_card, QFrame#metric_card {
-                background: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1,
-                                            stop: 0 #ffffff, stop: 1 #f8f9fa);
-                border: 2px solid #e9ecef;
-                border-radius: 12px;
-            }
-            QFrame#stat_card:hover, QFrame#metric_card:hover {
-                border: 2px solid #007bff;
-                background: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1,
-                                            stop: 0 rgba(0, 123, 255, 0.05), 
-                                            stop: 1 rgba(0, 123, 255, 0.02));
-            }
-            QLabel#stat_value, QLabel#metric_value {
-                color: #007bff;
-            }
-            QProgressBar {
-                border: 2px solid #007bff;
-                border-radius: 8px;
-                text-align: center;
-                background-color: #e9ecef;
-            }
-            QProgressBar::chunk {
-                background-color: #007bff;
-                border-radius: 6px;
-            }
-            QPushButton {
-                background-color: #007bff;
-                color: white;
-                border: none;
-                border-radius: 8px;
-                padding: 10px 20px;
-                font-weight: bold;
-                font-size: 12px;
-            }
-            QPushButton:hover {
-                background-color: #0056b3;
-            }
-            QTextEdit {
-                background-color: #ffffff;
-                border: 2px solid #e9ecef;
-                border-radius: 8px;
-                padding: 15px;
-                font-family: 'Consolas', monospace;
-            }
-            QScrollArea#ai_scroll_area {
-                border: none;
-                background-color: transparent;
-            }
-        """)
-
     def apply_dark_theme(self):
         """Apply dark theme styling"""
         QToolTip.setFont(QFont("Segoe UI", 10))
         QToolTip.setPalette(QPalette(QColor("#e9ecef"), QColor("#2d3748")))
-        
-        self.setStyleSheet("""
-            QWidget {
-                background-color: #1a1a1a;
-                color: #e9ecef;
-            }
-            QFrame {
-                background-color: #2d3748;
-                border: 1px solid #4a5568;
-                border-radius: 12px;
-                padding: 10px;
-            }
-            
-            /* Tab Widget Styling */
-            QTabWidget#reports_tabs::pane {
-                border: 1px solid #334155;
-                border-radius: 12px;
-                background: #1e293b;
-                padding: 10px;
-            }
-            QTabWidget#reports_tabs QTabBar::tab {
-                background: #334155;
-                color: #94a3b8;
-                border: 1px solid #475569;
-                border-bottom: none;
-                border-top-left-radius: 8px;
-                border-top-right-radius: 8px;
-                padding: 12px 24px;
-                margin-right: 4px;
-                font-weight: 600;
-                font-size: 11px;
-            }
-            QTabWidget#reports_tabs QTabBar::tab:selected {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                            stop:0 #3b82f6, stop:1 #8b5cf6);
-                color: white;
-                border: 1px solid #3b82f6;
-            }
-            QTabWidget#reports_tabs QTabBar::tab:hover {
-                background: #475569;
-                color: #e2e8f0;
-            }
-            
-            /* AI Report Button */
-            QPushButton#generate_ai_btn {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                            stop:0 #8b5cf6, stop:1 #a855f7);
-                color: white;
-                border: none;
-                border-radius: 8px;
-                font-weight: 600;
-                font-size: 12px;
-                padding: 10px 20px;
-            }
-            QPushButton#generate_ai_btn:hover {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                            stop:0 #7c3aed, stop:1 #9333ea);
-            }
-            QPushButton#generate_ai_btn:pressed {
-                background: #6d28d9;
-            }
-            QPushButton#generate_ai_btn:disabled {
-                background: #4b5563;
-                color: #9ca3af;
-            }
-            
-            /* AI Status Label */
-            QLabel#ai_status_label {
-                color: #94a3b8;
-                font-size: 11px;
-                font-style: italic;
-                padding: 8px;
-                background: rgba(59, 130, 246, 0.1);
-                border-radius: 6px;
-                border-left: 3px solid #3b82f6;
-            }
-            
-            /* AI Report Text */
-            QTextEdit#ai_report_text {
-                background: #1e293b;
-                color: #e2e8f0;
-                border: 1px solid #334155;
-                border-radius: 12px;
-                padding: 20px;
-                font-family: 'Segoe UI', 'Inter', system-ui, sans-serif;
-                font-size: 11px;
-                line-height: 1.6;
-            }
-            
-            QFrame#stat_card, QFrame#metric_card {
-                background: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1,
-                                            stop: 0 #2d3748, stop: 1 #1a202c);
-                border: 2px solid #4a5568;
-                border-radius: 12px;
-            }
-            QFrame#stat_card:hover, QFrame#metric_card:hover {
-                border: 2px solid #4299e1;
-                background: qlineargradient(x1: 0, y1: 0, x2: 0, y2: 1,
-                                            stop: 0 rgba(66, 153, 225, 0.1), 
-                                            stop: 1 rgba(66, 153, 225, 0.05));
-            }
-            QLabel#stat_value, QLabel#metric_value {
-                color: #4299e1;
-            }
-            QProgressBar {
-                border: 2px solid #4299e1;
-                border-radius: 8px;
-                text-align: center;
-                background-color: #1a202c;
-            }
-            QProgressBar::chunk {
-                background-color: #4299e1;
-                border-radius: 6px;
-            }
-            QPushButton {
-                background-color: #4299e1;
-                color: white;
-                border: none;
-                border-radius: 8px;
-                padding: 10px 20px;
-                font-weight: bold;
-                font-size: 12px;
-            }
-            QPushButton:hover {
-                background-color: #3182ce;
-            }
-            QTextEdit {
-                background-color: #2d3748;
-                border: 2px solid #4a5568;
-                border-radius: 8px;
-                padding: 15px;
-                color: #e9ecef;
-                font-family: 'Consolas', monospace;
-            }
-            QScrollArea#ai_scroll_area {
-                border: none;
-                background-color: transparent;
-            }
-        """)
-    
+
     def cleanup(self):
         """Clean up resources"""
         if self.chart_worker and self.chart_worker.isRunning():
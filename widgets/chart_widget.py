@@ -3,7 +3,7 @@ import numpy as np
 import matplotlib.pyplot as plt
 from PyQt5.QtWidgets import (
     QVBoxLayout, QWidget, QLabel,
-    QPushButton, QFrame, QGridLayout, QSizePolicy
+    QPushButton, QFrame, QGridLayout, QSizePolicy, QComboBox
 )
 from PyQt5.QtCore import Qt, QTimer, pyqtSignal, QThread, pyqtSlot
 from PyQt5.QtGui import QFont
@@ -11,35 +11,18 @@ from matplotlib.backends.backend_qt5agg import (
     FigureCanvasQTAgg as FigureCanvas,
     NavigationToolbar2QT as NavigationToolbar,
 )
+from matplotlib.collections import LineCollection
 from matplotlib.figure import Figure
 import pandas as pd
-from scipy.signal import argrelextrema
 from matplotlib import rcParams
 import gc
+from collections import OrderedDict
 
-
-# ============================================================================
-# INDICATOR CALCULATIONS
-# ============================================================================
-
-def calculate_rsi(series, period=14):
-    delta = series.diff().values
-    gain = np.where(delta > 0, delta, 0)
-    loss = np.where(delta < 0, -delta, 0)
-    alpha = 1 / period
-    avg_gain = pd.Series(gain).ewm(alpha=alpha, min_periods=period).mean()
-    avg_loss = pd.Series(loss).ewm(alpha=alpha, min_periods=period).mean()
-    rs = avg_gain / avg_loss
-    return 100 - (100 / (1 + rs))
-
-
-def calculate_macd(series, short=12, long=26, signal=9):
-    short_ema = series.ewm(span=short, adjust=False).mean()
-    long_ema = series.ewm(span=long, adjust=False).mean()
-    macd = short_ema - long_ema
-    signal_line = macd.ewm(span=signal, adjust=False).mean()
-    hist = macd - signal_line
-    return macd, signal_line, hist
+from core import perf
+from core.chart_cache import ChartStateCache, data_fingerprint, figure_bytes
+from core.levels import level_cache
+from core.snapshot import MarketSnapshot
+from styles import register_scoped_style
 
 
 # ============================================================================
@@ -58,6 +41,7 @@ class ChartWorker(QThread):
         self.options = options.copy()
         self.is_dark = is_dark
         self._is_cancelled = False
+        self._source = None  # snapshot whose derived columns match the prepared frame
 
     def cancel(self):
         self._is_cancelled = True
@@ -77,7 +61,17 @@ class ChartWorker(QThread):
 
     def _prepare_dataframe(self):
         """Prepare DataFrame for charting"""
-        df = self.raw_df.copy()
+        if isinstance(self.raw_df, MarketSnapshot):
+            # Already clean, typed and Date-indexed; the frame is ours to extend
+            df = self.raw_df.frame()
+            if np.isnan(self.raw_df["Close"]).any():
+                return df.dropna(subset=['Close'])
+            self._source = self.raw_df  # rows line up, so its derived columns do too
+            return df
+
+        # Shallow copy: the columns below are replaced, never written in place,
+        # so the shared history buffers can be reused as-is
+        df = self.raw_df.copy(deep=False)
         
         # Handle Date - reset if it's index
         if df.index.name == "Date" or isinstance(df.index, pd.DatetimeIndex):
@@ -110,43 +104,48 @@ class ChartWorker(QThread):
         """Calculate technical indicators"""
         opts = self.options
         indicators = {}
+        # Derived columns are memoized on the loaded snapshot, so toggling an
+        # indicator or redrawing reuses them; intraday frames get a throwaway one
+        source = self._source or MarketSnapshot(
+            self.ticker, df.index, {'Close': df['Close'].to_numpy()}
+        )
+
+        def column(name):
+            return pd.Series(source[name], index=df.index, copy=False)
 
         if opts.get('show_sma'):
-            indicators['SMA_20'] = df['Close'].rolling(window=20, min_periods=1).mean()
+            indicators['SMA_20'] = column('SMA_20')
 
         if opts.get('show_ema'):
-            indicators['EMA_20'] = df['Close'].ewm(span=20, adjust=False).mean()
+            indicators['EMA_20'] = column('EMA_20')
 
         if opts.get('show_bb'):
-            bb_mid = df['Close'].rolling(window=20, min_periods=1).mean()
-            bb_std = df['Close'].rolling(window=20, min_periods=1).std()
-            indicators['BB_UPPER'] = bb_mid + (2 * bb_std)
-            indicators['BB_LOWER'] = bb_mid - (2 * bb_std)
+            indicators['BB_UPPER'], indicators['BB_LOWER'] = column('BB_UPPER'), column('BB_LOWER')
 
         if opts.get('show_sr'):
-            close_vals = df['Close'].values
-            order = min(10, len(close_vals) // 4) if len(close_vals) > 20 else 5
-            indicators['local_max'] = argrelextrema(close_vals, np.greater, order=order)[0]
-            indicators['local_min'] = argrelextrema(close_vals, np.less, order=order)[0]
+            # Clustered, ranked levels; redraws of the same series only rescan new bars
+            key = (self.ticker, opts.get('timeframe', '1d'))
+            indicators['levels'] = level_cache.levels(key, df, top_n=opts.get('sr_levels', 6))
 
         if opts.get('show_rsi'):
-            indicators['RSI'] = calculate_rsi(df['Close'])
+            indicators['RSI'] = column('RSI_14')
 
         if opts.get('show_macd'):
-            macd, signal, hist = calculate_macd(df['Close'])
-            indicators['MACD'] = macd
-            indicators['Signal'] = signal
-            indicators['Hist'] = hist
+            indicators['MACD'] = column('MACD')
+            indicators['Signal'] = column('MACD_SIGNAL')
+            indicators['Hist'] = column('MACD_HIST')
 
         return indicators
 
+    @perf.timed("chart.create_figure")
     def _create_figure(self):
         """Create complete matplotlib Figure in worker thread - KEY OPTIMIZATION"""
         df = self._prepare_dataframe()
         if df.empty or self._is_cancelled:
             return None
 
-        indicators = self._calculate_indicators(df)
+        with perf.span("chart.indicators", bars=len(df)):
+            indicators = self._calculate_indicators(df)
         if self._is_cancelled:
             return None
 
@@ -220,7 +219,7 @@ class ChartWorker(QThread):
             'volume': ax_vol,
             'style': style,
             'warn_too_much_data': 10000,
-            'datetime_format': '%Y-%m-%d',
+            'datetime_format': '%Y-%m-%d' if options.get('timeframe', '1d') == '1d' else '%m-%d %H:%M',
             'xrotation': 0
         }
         if add_plots:
@@ -231,7 +230,8 @@ class ChartWorker(QThread):
             return None
 
         # HEAVY CALL - now runs in worker thread instead of main thread
-        mpf.plot(df, **plot_kwargs)
+        with perf.span("chart.mpf_plot", ticker=self.ticker, bars=len(df)):
+            mpf.plot(df, **plot_kwargs)
 
         ax_main.set_ylabel("Price ($)", fontweight="bold")
         ax_main.grid(True, alpha=0.4, linestyle="--", linewidth=0.8)
@@ -261,18 +261,97 @@ class ChartWorker(QThread):
             ax_macd.grid(True, alpha=0.4, linestyle="--")
             ax_macd.legend(loc="upper left", frameon=False)
 
-        if options.get('show_sr') and 'local_max' in indicators:
-            close_vals = df['Close'].values
-            for i in indicators['local_max']:
-                if i < len(close_vals):
-                    ax_main.axhline(y=close_vals[i], color="#a855f7", linestyle="--", alpha=0.7, linewidth=1.5)
-            for i in indicators['local_min']:
-                if i < len(close_vals):
-                    ax_main.axhline(y=close_vals[i], color="#0d9488", linestyle="--", alpha=0.7, linewidth=1.5)
+        if options.get('show_sr') and indicators.get('levels'):
+            # One artist for all levels; each starts at its first touch
+            levels = indicators['levels']
+            x_end = ax_main.get_xlim()[1]
+            max_touches = max(level.touches for level in levels)
+            lines = LineCollection(
+                [[(level.first, level.price), (x_end, level.price)] for level in levels],
+                colors=["#0d9488" if level.kind == "support" else "#a855f7" for level in levels],
+                linewidths=[1.0 + 1.5 * level.touches / max_touches for level in levels],
+                linestyles="--", alpha=0.75, zorder=1,
+            )
+            ax_main.add_collection(lines, autolim=False)
 
         return fig
 
 
+def render_figure(df, ticker, options, is_dark):
+    """The chart Figure for `df`, built on the calling (non-GUI) thread"""
+    return ChartWorker(df, ticker, options, is_dark)._create_figure()
+
+
+def _plot_key(ticker, version, options, is_dark):
+    return ticker, version, tuple(sorted(options.items())), is_dark
+
+
+# ============================================================================
+# STYLESHEETS (compiled into the application stylesheet, see styles.py)
+# ============================================================================
+
+CHART_LIGHT_STYLE = """
+QFrame#chart_header {
+    background: qlineargradient(x1:0,y1:0,x2:0,y2:1,stop:0 #ffffff,stop:1 #f8fafc);
+    border: 1px solid #e5e7eb; border-radius: 12px;
+}
+QLabel#chart_title { color: #111827; background: transparent; }
+QLabel#chart_subtitle { color: #6b7280; background: transparent; }
+QPushButton#tools_button {
+    background: qlineargradient(x1:0,y1:0,x2:0,y2:1,stop:0 #f3f4f6,stop:1 #e5e7eb);
+    border: 1px solid #d1d5db; border-radius: 8px; color: #374151; font-weight: 600;
+}
+QPushButton#tools_button:hover { background: #3b82f6; color: #ffffff; }
+QComboBox#timeframe_combo {
+    background: #f3f4f6; border: 1px solid #d1d5db; border-radius: 8px;
+    color: #374151; font-weight: 600; padding: 4px 10px;
+}
+"""
+
+CHART_DARK_STYLE = """
+QFrame#chart_header {
+    background: qlineargradient(x1:0,y1:0,x2:0,y2:1,stop:0 #1e293b,stop:1 #0f172a);
+    border: 1px solid #334155; border-radius: 12px;
+}
+QLabel#chart_title { color: #f1f5f9; background: transparent; }
+QLabel#chart_subtitle { color: #94a3b8; background: transparent; }
+QPushButton#tools_button {
+    background: qlineargradient(x1:0,y1:0,x2:0,y2:1,stop:0 #334155,stop:1 #1e293b);
+    border: 1px solid #475569; border-radius: 8px; color: #ffffff; font-weight: 600;
+}
+QPushButton#tools_button:hover { background: #3b82f6; color: #ffffff; }
+QComboBox#timeframe_combo {
+    background: #334155; border: 1px solid #475569; border-radius: 8px;
+    color: #ffffff; font-weight: 600; padding: 4px 10px;
+}
+"""
+
+POPOVER_LIGHT_STYLE = """
+ToolbarPopover {
+    background: qlineargradient(x1:0,y1:0,x2:0,y2:1,stop:0 #ffffff,stop:1 #f8fafc);
+    border: 2px solid #e2e8f0; border-radius: 16px;
+}
+QLabel#popover_title { color: #111827; background: transparent; }
+QPushButton#tool_button {
+    background: #ffffff; border: 1px solid #d1d5db;
+    border-radius: 8px; color: #374151; font-size: 16px;
+}
+QPushButton#tool_button:hover { background: #3b82f6; color: #ffffff; }
+"""
+
+POPOVER_DARK_STYLE = """
+ToolbarPopover {
+    background: qlineargradient(x1:0,y1:0,x2:0,y2:1,stop:0 #1e293b,stop:1 #0f172a);
+    border: 2px solid #334155; border-radius: 16px;
+}
+QLabel#popover_title { color: #f1f5f9; background: transparent; }
+QPushButton#tool_button {
+    background: #334155; border: 1px solid #475569;
+    border-radius: 8px; color: #e2e8f0; font-size: 16px;
+}
+QPushButton#tool_button:hover { background: #3b82f6; border: 1px solid #2563eb; }
+"""
+
 # ============================================================================
 # TOOLBAR POPOVER
 # ============================================================================
@@ -348,32 +427,8 @@ class ToolbarPopover(QFrame):
         self.hide()
 
     def _apply_styling(self):
-        if self.is_dark:
-            self.setStyleSheet("""
-                ToolbarPopover {
-                    background: qlineargradient(x1:0,y1:0,x2:0,y2:1,stop:0 #1e293b,stop:1 #0f172a);
-                    border: 2px solid #334155; border-radius: 16px;
-                }
-                QLabel#popover_title { color: #f1f5f9; background: transparent; }
-                QPushButton#tool_button {
-                    background: #334155; border: 1px solid #475569;
-                    border-radius: 8px; color: #e2e8f0; font-size: 16px;
-                }
-                QPushButton#tool_button:hover { background: #3b82f6; border: 1px solid #2563eb; }
-            """)
-        else:
-            self.setStyleSheet("""
-                ToolbarPopover {
-                    background: qlineargradient(x1:0,y1:0,x2:0,y2:1,stop:0 #ffffff,stop:1 #f8fafc);
-                    border: 2px solid #e2e8f0; border-radius: 16px;
-                }
-                QLabel#popover_title { color: #111827; background: transparent; }
-                QPushButton#tool_button {
-                    background: #ffffff; border: 1px solid #d1d5db;
-                    border-radius: 8px; color: #374151; font-size: 16px;
-                }
-                QPushButton#tool_button:hover { background: #3b82f6; color: #ffffff; }
-            """)
+        # Theme colors live in the application stylesheet (see styles.py)
+        register_scoped_style("ToolbarPopover", POPOVER_LIGHT_STYLE, POPOVER_DARK_STYLE)
 
     def show_at_position(self, parent_widget, button_rect):
         pos = parent_widget.mapToGlobal(button_rect.bottomLeft())
@@ -390,6 +445,13 @@ class ToolbarPopover(QFrame):
 
 class ChartWidget(QWidget):
     theme_changed = pyqtSignal(bool)
+    timeframe_changed = pyqtSignal(str)
+
+    # Figures rendered ahead of time by the prefetcher, kept until used
+    PRERENDERED_SLOTS = 3
+
+    # Label -> timeframe key understood by core.bar_builder
+    TIMEFRAMES = [("1D", "1d"), ("1H", "1h"), ("15m", "15m"), ("5m", "5m"), ("1m", "1m")]
 
     def __init__(self, parent=None, is_dark=False):
         super().__init__(parent)
@@ -402,6 +464,12 @@ class ChartWidget(QWidget):
         self.worker = None
         self.last_df = None
         self._last_options = {}
+        self._prerendered = OrderedDict()  # _plot_key -> Figure
+        # Charts switched away from, kept for switching back (core/chart_cache.py)
+        self.chart_cache = ChartStateCache(release=plt.close)
+        self._live_key = None  # cache key of the embedded figure
+        self._worker_key = None  # cache key of the figure the worker is building
+        self._raster_label = None  # cached raster shown while the worker runs
 
         self._plot_timer = QTimer()
         self._plot_timer.setSingleShot(True)
@@ -412,6 +480,7 @@ class ChartWidget(QWidget):
         self.layout.setSpacing(8)
         self.layout.setContentsMargins(0, 0, 0, 0)
 
+        register_scoped_style("ChartWidget", CHART_LIGHT_STYLE, CHART_DARK_STYLE)
         self._create_header()
         self._apply_theme()
 
@@ -436,6 +505,16 @@ class ChartWidget(QWidget):
         self.tools_button.setFixedSize(120, 45)
         self.tools_button.clicked.connect(self._toggle_popover)
 
+        # Intraday views come from live bars; "1D" is the stored daily history
+        self.timeframe_combo = QComboBox(self.header_frame)
+        self.timeframe_combo.setObjectName("timeframe_combo")
+        self.timeframe_combo.setFixedSize(90, 45)
+        for label, key in self.TIMEFRAMES:
+            self.timeframe_combo.addItem(label, key)
+        self.timeframe_combo.currentIndexChanged.connect(
+            lambda _: self.timeframe_changed.emit(self.timeframe())
+        )
+
         self.layout.addWidget(self.header_frame)
         self._position_header()
 
@@ -453,6 +532,8 @@ class ChartWidget(QWidget):
         self.subtitle_label.move(16, y + title_h)
         btn_w, btn_h = self.tools_button.width(), self.tools_button.height()
         self.tools_button.move(self.header_frame.width() - btn_w - 16, (h - btn_h) // 2)
+        combo_w = self.timeframe_combo.width()
+        self.timeframe_combo.move(self.header_frame.width() - btn_w - combo_w - 28, (h - btn_h) // 2)
 
     def _toggle_popover(self):
         if self.popover and self.popover.isVisible():
@@ -477,19 +558,6 @@ class ChartWidget(QWidget):
             "grid.color": "#f3f4f6", "text.color": "#1f2937",
             "font.family": "Inter", "font.size": 10,
         })
-        self.setStyleSheet("""
-            QFrame#chart_header {
-                background: qlineargradient(x1:0,y1:0,x2:0,y2:1,stop:0 #ffffff,stop:1 #f8fafc);
-                border: 1px solid #e5e7eb; border-radius: 12px;
-            }
-            QLabel#chart_title { color: #111827; background: transparent; }
-            QLabel#chart_subtitle { color: #6b7280; background: transparent; }
-            QPushButton#tools_button {
-                background: qlineargradient(x1:0,y1:0,x2:0,y2:1,stop:0 #f3f4f6,stop:1 #e5e7eb);
-                border: 1px solid #d1d5db; border-radius: 8px; color: #374151; font-weight: 600;
-            }
-            QPushButton#tools_button:hover { background: #3b82f6; color: #ffffff; }
-        """)
 
     def _apply_dark_theme(self):
         plt.style.use("dark_background")
@@ -499,25 +567,17 @@ class ChartWidget(QWidget):
             "grid.color": "#334155", "text.color": "#e2e8f0",
             "font.family": "Inter", "font.size": 10,
         })
-        self.setStyleSheet("""
-            QFrame#chart_header {
-                background: qlineargradient(x1:0,y1:0,x2:0,y2:1,stop:0 #1e293b,stop:1 #0f172a);
-                border: 1px solid #334155; border-radius: 12px;
-            }
-            QLabel#chart_title { color: #f1f5f9; background: transparent; }
-            QLabel#chart_subtitle { color: #94a3b8; background: transparent; }
-            QPushButton#tools_button {
-                background: qlineargradient(x1:0,y1:0,x2:0,y2:1,stop:0 #334155,stop:1 #1e293b);
-                border: 1px solid #475569; border-radius: 8px; color: #ffffff; font-weight: 600;
-            }
-            QPushButton#tools_button:hover { background: #3b82f6; color: #ffffff; }
-        """)
+
+    def timeframe(self):
+        return self.timeframe_combo.currentData() or "1d"
 
     def plot_chart(self, df, ticker, show_sma=False, show_ema=False,
-                   show_rsi=False, show_macd=False, show_bb=False, show_sr=False):
+                   show_rsi=False, show_macd=False, show_bb=False, show_sr=False,
+                   timeframe="1d"):
         self._pending_plot_args = (df, ticker, {
             'show_sma': show_sma, 'show_ema': show_ema, 'show_rsi': show_rsi,
             'show_macd': show_macd, 'show_bb': show_bb, 'show_sr': show_sr,
+            'timeframe': timeframe,
         })
         self._plot_timer.stop()
         self._plot_timer.start(100)
@@ -555,26 +615,63 @@ class ChartWidget(QWidget):
         # Quick header update
         self._update_header(df, ticker)
 
+        key = self._cache_key(df, ticker, options)
+        if key is not None and key == self._live_key and self.fig is not None:
+            return  # exactly this chart is already on screen
+
+        # Prefetched: the exact figure is already rendered
+        if isinstance(df, MarketSnapshot):
+            fig = self._prerendered.pop(_plot_key(ticker, df.version, options, self.is_dark), None)
+            if fig is not None:
+                self._embed_figure(fig, key)
+                return
+
+        # Seen before: re-embed the kept figure, or show its raster while rebuilding
+        if key is not None:
+            fig, raster = self.chart_cache.take(key, self._chart_area_size())
+            if fig is not None:
+                self._embed_figure(fig, key)
+                return
+            if raster is not None:
+                self._show_raster(raster)
+
         # Start worker immediately - all heavy work happens in thread
         # Pass PARENT=self to prevent Python GC from killing it
+        self._worker_key = key
         self.worker = ChartWorker(df, ticker, options, self.is_dark, parent=self)
         self.worker.finished.connect(self._on_data_ready)
         self.worker.error.connect(self._on_error)
         self.worker.start()
 
+    def _cache_key(self, df, ticker, options):
+        # Intraday frames change with every bar; only stored history is kept
+        if not isinstance(df, MarketSnapshot):
+            return None
+        return ticker, data_fingerprint(df), tuple(sorted(options.items())), self.is_dark
+
+    def _chart_area_size(self):
+        widget = self.canvas or self._raster_label
+        return (widget.width(), widget.height()) if widget is not None else None
+
     def _update_header(self, df, ticker):
-        self.title_label.setText(f"{ticker.upper()} Candlestick Chart")
+        timeframe = self._last_options.get('timeframe', '1d')
+        suffix = "" if timeframe == "1d" else f" ({timeframe})"
+        self.title_label.setText(f"{ticker.upper()} Candlestick Chart{suffix}")
         try:
-            close_col = None
-            for col in df.columns:
-                if str(col).lower() == 'close':
-                    close_col = col
-                    break
-            if close_col is None:
-                raise ValueError("No Close column")
-            
-            latest = float(df[close_col].iloc[-1])
-            prev = float(df[close_col].iloc[-2]) if len(df) > 1 else latest
+            if isinstance(df, MarketSnapshot):
+                close = df["Close"]
+            else:
+                close_col = None
+                for col in df.columns:
+                    if str(col).lower() == 'close':
+                        close_col = col
+                        break
+                if close_col is None:
+                    raise ValueError("No Close column")
+                close = df[close_col].to_numpy()
+
+            latest = float(close[-1])
+            prev = float(close[-2]) if len(close) > 1 else latest
             change = latest - prev
             pct = (change / prev * 100) if prev != 0 else 0
 
@@ -594,7 +691,7 @@ class ChartWidget(QWidget):
         """Embed pre-rendered Figure from worker - LIGHTWEIGHT main thread work"""
         try:
             if fig is not None:
-                self._embed_figure(fig)
+                self._embed_figure(fig, self._worker_key)
         except Exception as e:
             print(f"Embed error: {e}")
         finally:
@@ -609,7 +706,47 @@ class ChartWidget(QWidget):
             self.worker.deleteLater()
             self.worker = None
 
-    def _cleanup_canvas(self):
+    def adopt_prerendered(self, ticker, version, options, is_dark, fig):
+        """Keep a figure rendered off-thread for a later `plot_chart()`"""
+        self._prerendered[_plot_key(ticker, version, options, is_dark)] = fig
+        while len(self._prerendered) > self.PRERENDERED_SLOTS:
+            _, old = self._prerendered.popitem(last=False)
+            plt.close(old)
+
+    def _stash_live(self):
+        """Park the outgoing figure and a raster of it in the chart cache"""
+        if self._live_key is None or self.fig is None or self.canvas is None:
+            return
+        size = self._chart_area_size()
+        raster, raster_bytes = None, 0
+        if size[0] > 0 and size[1] > 0:
+            raster = self.canvas.grab()
+            raster_bytes = raster.width() * raster.height() * raster.depth() // 8
+        self.chart_cache.put(
+            self._live_key, figure=self.fig, raster=raster, size=size,
+            figure_bytes=figure_bytes(self.fig), raster_bytes=raster_bytes,
+        )
+        self.fig = None  # the cache owns it now
+
+    def _show_raster(self, raster):
+        """Instant stand-in for a chart that is being rebuilt"""
+        self._cleanup_canvas()
+        self._raster_label = QLabel(self)
+        self._raster_label.setAlignment(Qt.AlignCenter)
+        self._raster_label.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+        self._raster_label.setMinimumSize(1, 1)
+        self._raster_label.setPixmap(raster)
+        self.layout.addWidget(self._raster_label)
+
+    def _cleanup_canvas(self, stash=True):
+        if stash:
+            self._stash_live()
+        self._live_key = None
+        if self._raster_label:
+            self.layout.removeWidget(self._raster_label)
+            self._raster_label.setParent(None)
+            self._raster_label.deleteLater()
+            self._raster_label = None
         if self.canvas:
             self.layout.removeWidget(self.canvas)
             self.canvas.setParent(None)
@@ -624,13 +761,15 @@ class ChartWidget(QWidget):
         self.canvas = None
         self.toolbar = None
 
-    def _embed_figure(self, fig):
+    @perf.timed("chart.embed_figure")
+    def _embed_figure(self, fig, key=None):
         """Embed pre-rendered Figure into canvas - LIGHTWEIGHT, no heavy work"""
-        # Cleanup old canvas first
+        # Cleanup old canvas first (kept in the chart cache for switching back)
         self._cleanup_canvas()
         
         # Store and embed the figure created by worker
         self.fig = fig
+        self._live_key = key
         self.canvas = FigureCanvas(self.fig)
         self.canvas.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
         self.toolbar = NavigationToolbar(self.canvas, self)
@@ -640,14 +779,22 @@ class ChartWidget(QWidget):
         self.canvas.draw_idle()
 
     def set_theme(self, is_dark: bool):
+        changed = is_dark != self.is_dark
         self.is_dark = is_dark
         self._apply_theme()
         if self.popover:
             self.popover.is_dark = is_dark
-            self.popover._apply_styling()
-        # Defer chart replot to prevent UI blocking during theme switch
-        if self.last_df is not None and self.current_ticker:
-            QTimer.singleShot(50, lambda: self.plot_chart(self.last_df, self.current_ticker, **self._last_options))
+        if not changed or self.last_df is None:
+            return
+        # Candle, volume and text colors are baked in at render time, so the
+        # chart is plotted again for the new theme: a figure kept from an
+        # earlier switch is re-embedded at once, otherwise ChartWorker renders
+        # one (superseding any in-flight old-theme render) while the outgoing
+        # figure stays on screen, then is parked in the chart cache under its
+        # own theme for switching back
+        self._plot_timer.stop()
+        self._pending_plot_args = (self.last_df, self.current_ticker, self._last_options)
+        self._execute_plot()
 
     def resizeEvent(self, event):
         super().resizeEvent(event)
@@ -661,5 +808,9 @@ class ChartWidget(QWidget):
             if self.worker.isRunning():
                 self.worker.quit()
                 self.worker.wait(1000)
-        self._cleanup_canvas()
+        self._cleanup_canvas(stash=False)
+        for fig in self._prerendered.values():
+            plt.close(fig)
+        self._prerendered.clear()
+        self.chart_cache.clear()
         super().closeEvent(event)
\ No newline at end of file
@@ -12,6 +12,8 @@ import time
 import speech_recognition as sr
 import pyttsx3
 
+from styles import register_scoped_style
+
 # class TTSThread(QThread):
 #     finished = pyqtSignal()
 
@@ -674,15 +676,12 @@ class ChatWidget(QWidget):
     
     def set_theme(self, is_dark: bool):
         """Update theme"""
+        # Colors switch with the parent window's theme property
         self.is_dark_mode = is_dark
-        self.apply_styles()
         
     def apply_styles(self):
-        """Apply theme-based styles"""
-        if self.is_dark_mode:
-            self.setStyleSheet(self.get_dark_styles())
-        else:
-            self.setStyleSheet(self.get_light_styles())
+        """Register theme-based styles with the application stylesheet"""
+        register_scoped_style("ChatWidget", self.get_light_styles(), self.get_dark_styles())
     
     def get_dark_styles(self) -> str:
         """Dark mode styles matching the reference image"""
@@ -0,0 +1,114 @@
+# widgets/perf_panel.py
+from PyQt5.QtCore import Qt, QTimer
+from PyQt5.QtWidgets import (
+    QCheckBox,
+    QHBoxLayout,
+    QHeaderView,
+    QLabel,
+    QPushButton,
+    QTableWidget,
+    QTableWidgetItem,
+    QVBoxLayout,
+    QWidget,
+)
+
+from core import perf
+
+COLUMNS = ["Span", "Count", "p50 (ms)", "p95 (ms)", "Max (ms)", "Total (ms)"]
+
+
+class PerfPanel(QWidget):
+    """Hidden developer panel (Ctrl+Shift+P): live span timings and counters.
+
+    Turns instrumentation on/off, dumps a Chrome trace and toggles a
+    cProfile session (also bound to Ctrl+Shift+F on the dashboard).
+    """
+    REFRESH_MS = 1000
+
+    def __init__(self, parent=None):
+        super().__init__(parent, Qt.Tool)
+        self.setWindowTitle("⏱️ Performance")
+        self.resize(760, 420)
+
+        self.enabled_box = QCheckBox("Instrumentation on")
+        self.enabled_box.setChecked(perf.enabled())
+        self.enabled_box.toggled.connect(perf.enable)
+        self.profile_btn = QPushButton()
+        self.profile_btn.clicked.connect(self.toggle_profile)
+        trace_btn = QPushButton("💾 Dump trace")
+        trace_btn.clicked.connect(self.dump_trace)
+        reset_btn = QPushButton("Reset")
+        reset_btn.clicked.connect(lambda: (perf.reset(), self.refresh()))
+
+        controls = QHBoxLayout()
+        controls.addWidget(self.enabled_box)
+        controls.addStretch()
+        controls.addWidget(self.profile_btn)
+        controls.addWidget(trace_btn)
+        controls.addWidget(reset_btn)
+
+        self.table = QTableWidget(0, len(COLUMNS))
+        self.table.setHorizontalHeaderLabels(COLUMNS)
+        self.table.verticalHeader().setVisible(False)
+        self.table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
+        self.counters = QLabel()
+        self.counters.setWordWrap(True)
+        self.status = QLabel()
+
+        layout = QVBoxLayout(self)
+        layout.addLayout(controls)
+        layout.addWidget(self.table)
+        layout.addWidget(self.counters)
+        layout.addWidget(self.status)
+
+        self._timer = QTimer(self)
+        self._timer.setInterval(self.REFRESH_MS)
+        self._timer.timeout.connect(self.refresh)
+
+    def refresh(self):
+        data = perf.summary()
+        spans = data["spans"]
+        self.table.setRowCount(len(spans))
+        for row, (name, s) in enumerate(spans.items()):
+            values = [
+                name, str(s["count"]), f"{s['p50_ms']:.1f}", f"{s['p95_ms']:.1f}",
+                f"{s['max_ms']:.1f}", f"{s['total_ms']:.0f}",
+            ]
+            for col, value in enumerate(values):
+                item = self.table.item(row, col)
+                if item is None:
+                    item = QTableWidgetItem()
+                    self.table.setItem(row, col, item)
+                item.setText(value)
+        self.counters.setText(
+            " · ".join(f"{name}: {value:,}" for name, value in sorted(data["counters"].items()))
+            or "No counters yet"
+        )
+        self.enabled_box.setChecked(perf.enabled())
+        self.profile_btn.setText("⏹ Stop profile" if perf.profiling() else "🔬 Start profile")
+
+    def toggle_profile(self):
+        if perf.profiling():
+            path = perf.stop_profile()
+            self.status.setText(f"Profile saved to {path}")
+            print(f"🔬 cProfile session saved to {path}")
+        else:
+            perf.start_profile()
+            self.status.setText("Profiling the GUI thread…")
+            print("🔬 cProfile session started")
+        self.refresh()
+
+    def dump_trace(self):
+        path = perf.dump_trace()
+        self.status.setText(f"Trace written to {path}")
+        print(f"💾 Chrome trace written to {path}")
+
+    def showEvent(self, event):
+        self.refresh()
+        self._timer.start()
+        super().showEvent(event)
+
+    def hideEvent(self, event):
+        self._timer.stop()
+        super().hideEvent(event)
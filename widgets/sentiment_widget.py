@@ -4,10 +4,12 @@ from PyQt5.QtWidgets import (
     QPushButton, QFrame, QScrollArea
 )
 from PyQt5.QtCore import Qt, QPropertyAnimation, QEasingCurve
-from PyQt5.QtGui import QFont, QPainter, QColor, QLinearGradient
+from PyQt5.QtGui import QFont, QPainter, QColor, QLinearGradient, QPalette
 from datetime import datetime
 import pyqtgraph as pg
 
+from styles import PALETTE_COLORS
+
 
 class SentimentWidget(QWidget):
     def __init__(self, parent=None):
@@ -145,7 +147,7 @@ class SentimentWidget(QWidget):
         return card
     
     def setup_chart(self):
-        self.sentiment_chart.setBackground('#1e293b')
+        self.sentiment_chart.setBackground(self.palette().color(QPalette.Base))
         self.sentiment_chart.setTitle("", color='w', size='14pt')
         self.sentiment_chart.setLabel('left', 'Sentiment Score', color='w')
         self.sentiment_chart.setLabel('bottom', 'Time', color='w')
@@ -156,6 +158,11 @@ class SentimentWidget(QWidget):
         self.sentiment_chart.addLine(y=70, pen=pg.mkPen('green', width=1, style=Qt.DotLine))
         self.sentiment_chart.addLine(y=30, pen=pg.mkPen('red', width=1, style=Qt.DotLine))
     
+    def set_theme(self, is_dark):
+        """Recolor the custom-painted parts from the application palette"""
+        self.sentiment_chart.setBackground(PALETTE_COLORS[is_dark]["base"])
+        self.sentiment_bar.update()
+
     def update_sentiment(self, sentiment_data):
         """Update UI with new sentiment data"""
         score = sentiment_data.get("score", 50)
@@ -315,7 +322,7 @@ class SentimentBar(QWidget):
         height = self.height()
         
         # Draw background
-        painter.setBrush(QColor("#1e293b"))
+        painter.setBrush(self.palette().color(QPalette.Base))
         painter.setPen(Qt.NoPen)
         painter.drawRoundedRect(0, 0, width, height, 10, 10)
         
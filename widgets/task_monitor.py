@@ -0,0 +1,76 @@
+# widgets/task_monitor.py
+from PyQt5.QtCore import Qt, QTimer
+from PyQt5.QtWidgets import (
+    QHeaderView,
+    QLabel,
+    QTableWidget,
+    QTableWidgetItem,
+    QVBoxLayout,
+    QWidget,
+)
+
+COLUMNS = ["Task", "Key", "Priority", "Pool", "State", "Queued (ms)", "Running (ms)"]
+STATE_ORDER = {"running": 0, "queued": 1}
+
+
+class TaskMonitor(QWidget):
+    """Live view of the scheduler: queued, running and recent tasks.
+
+    A tool window (Ctrl+Shift+T on the dashboard). It polls
+    `scheduler.snapshot()` while visible so durations keep ticking.
+    """
+    REFRESH_MS = 500
+
+    def __init__(self, scheduler, parent=None):
+        super().__init__(parent, Qt.Tool)
+        self.scheduler = scheduler
+        self.setWindowTitle("🧵 Tasks")
+        self.resize(720, 360)
+
+        self.summary = QLabel()
+        self.table = QTableWidget(0, len(COLUMNS))
+        self.table.setHorizontalHeaderLabels(COLUMNS)
+        self.table.verticalHeader().setVisible(False)
+        self.table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
+
+        layout = QVBoxLayout(self)
+        layout.addWidget(self.summary)
+        layout.addWidget(self.table)
+
+        self._timer = QTimer(self)
+        self._timer.setInterval(self.REFRESH_MS)
+        self._timer.timeout.connect(self.refresh)
+
+    def refresh(self):
+        tasks = sorted(
+            self.scheduler.snapshot(),
+            key=lambda t: (STATE_ORDER.get(t["state"], 2), -t["id"]),
+        )
+        self.table.setRowCount(len(tasks))
+        for row, task in enumerate(tasks):
+            values = [
+                task["name"], task["key"] or "", task["priority"], task["pool"], task["state"],
+                f"{task['queued_ms']:.0f}", f"{task['run_ms']:.0f}",
+            ]
+            for col, value in enumerate(values):
+                item = self.table.item(row, col)
+                if item is None:
+                    item = QTableWidgetItem()
+                    self.table.setItem(row, col, item)
+                item.setText(value)
+        stats = self.scheduler.stats
+        self.summary.setText(
+            f"{stats['submitted']} submitted · {stats['completed']} done · "
+            f"{stats['failed']} failed · {stats['cancelled']} cancelled "
+            f"({stats['superseded']} superseded)"
+        )
+
+    def showEvent(self, event):
+        self.refresh()
+        self._timer.start()
+        super().showEvent(event)
+
+    def hideEvent(self, event):
+        self._timer.stop()
+        super().hideEvent(event)
@@ -0,0 +1,51 @@
+# widgets/ticker_completer.py
+from PyQt5.QtCore import Qt, pyqtSignal
+from PyQt5.QtGui import QStandardItem, QStandardItemModel
+from PyQt5.QtWidgets import QCompleter
+
+from core.symbols import symbol_index
+
+SYMBOL_ROLE = Qt.UserRole + 1
+
+
+class TickerCompleter(QCompleter):
+    """Suggestions for the ticker box from the local symbol index.
+
+    The index does the matching and ranking (locally cached tickers first),
+    so the completer shows its results unfiltered and inserts the bare
+    symbol. `symbol_chosen` fires when a suggestion is picked.
+    """
+    MAX_ITEMS = 10
+    symbol_chosen = pyqtSignal(str)
+
+    def __init__(self, line_edit):
+        super().__init__(line_edit)
+        self._model = QStandardItemModel(self)
+        self.setModel(self._model)
+        self.setCompletionMode(QCompleter.UnfilteredPopupCompletion)
+        self.setCompletionRole(SYMBOL_ROLE)
+        self.setMaxVisibleItems(self.MAX_ITEMS)
+        self.setWidget(line_edit)
+        line_edit.textEdited.connect(self._update)
+        self.activated[str].connect(self._on_activated)
+
+    def _update(self, text):
+        self._model.clear()
+        for match in symbol_index().search(text, limit=self.MAX_ITEMS):
+            label = f"{match.symbol}  ·  {match.name}" if match.name else match.symbol
+            if match.exchange:
+                label += f"  ({match.exchange})"
+            if match.cached:
+                label = f"💾 {label}"
+            item = QStandardItem(label)
+            item.setData(match.symbol, SYMBOL_ROLE)
+            item.setEditable(False)
+            self._model.appendRow(item)
+        if self._model.rowCount():
+            self.complete()
+        else:
+            self.popup().hide()
+
+    def _on_activated(self, symbol):
+        self.widget().setText(symbol)
+        self.symbol_chosen.emit(symbol)
@@ -0,0 +1,393 @@
+# widgets/watchlist_widget.py
+"""
+Live multi-ticker watchlist.
+
+`WatchlistModel` keeps each column as a numpy array indexed by row, so a
+frame of ticks is applied with a handful of vectorized writes and announced
+with a single `dataChanged` over the touched row range. Views only ask for
+the cells that are visible, which keeps hundreds of rows updating several
+times a second cheap. The trend column is painted by `SparklineDelegate`
+straight from the row's slice of the sparkline matrix.
+"""
+import numpy as np
+from PyQt5.QtCore import Qt, QAbstractTableModel, QModelIndex, QPointF, QTimer, pyqtSignal
+from PyQt5.QtGui import QColor, QFont, QPainter, QPen, QPolygonF
+from PyQt5.QtWidgets import (
+    QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QLineEdit,
+    QTableView, QHeaderView, QAbstractItemView, QStyledItemDelegate, QStyle
+)
+
+from core.tick_channel import TickChannel
+from core.watchlist import SPARK_POINTS, live_rsi
+from styles import register_scoped_style
+
+SPARK_ROLE = Qt.UserRole + 1
+
+WATCHLIST_LIGHT_STYLE = """
+QLabel#section_header { color: #111827; }
+QTableView#watchlist_table {
+    background: #ffffff; alternate-background-color: #f8fafc; color: #111827;
+    border: 1px solid #e5e7eb; border-radius: 12px; gridline-color: #f3f4f6;
+    selection-background-color: #dbeafe; selection-color: #111827;
+}
+QHeaderView::section {
+    background: #f3f4f6; color: #374151; border: none; padding: 6px; font-weight: 600;
+}
+QLineEdit#watchlist_input {
+    background: #ffffff; border: 1px solid #d1d5db; border-radius: 8px; padding: 6px 10px; color: #111827;
+}
+QLabel#watchlist_status { color: #6b7280; }
+"""
+
+WATCHLIST_DARK_STYLE = """
+QLabel#section_header { color: #f1f5f9; }
+QTableView#watchlist_table {
+    background: #0f172a; alternate-background-color: #131c31; color: #e2e8f0;
+    border: 1px solid #334155; border-radius: 12px; gridline-color: #1e293b;
+    selection-background-color: #1e3a8a; selection-color: #ffffff;
+}
+QHeaderView::section {
+    background: #1e293b; color: #cbd5e1; border: none; padding: 6px; font-weight: 600;
+}
+QLineEdit#watchlist_input {
+    background: #1e293b; border: 1px solid #475569; border-radius: 8px; padding: 6px 10px; color: #f1f5f9;
+}
+QLabel#watchlist_status { color: #94a3b8; }
+"""
+
+UP_COLOR = QColor("#10b981")
+DOWN_COLOR = QColor("#ef4444")
+
+
+def _format_volume(v):
+    for unit, div in (("B", 1e9), ("M", 1e6), ("K", 1e3)):
+        if v >= div:
+            return f"{v / div:.2f}{unit}"
+    return f"{v:.0f}"
+
+
+class WatchlistModel(QAbstractTableModel):
+    COLUMNS = ("Symbol", "Last", "Chg %", "Volume", "RSI", "Sentiment", "Trend")
+    SYMBOL, LAST, CHANGE, VOLUME, RSI, SENTIMENT, TREND = range(7)
+
+    _FLOAT_COLUMNS = ("last", "prev_close", "volume", "avg_gain", "avg_loss", "sentiment")
+
+    def __init__(self, parent=None, spark_points=SPARK_POINTS):
+        super().__init__(parent)
+        self.spark_points = spark_points
+        self._symbols = []
+        self._rows = {}
+        self._labels = []
+        for name in self._FLOAT_COLUMNS:
+            setattr(self, name, np.full(0, np.nan))
+        self.spark = np.full((0, spark_points), np.nan)
+        self.updates = 0
+
+    # ---------------- Structure ---------------- #
+    def symbols(self):
+        return list(self._symbols)
+
+    def row_of(self, symbol):
+        return self._rows.get(symbol)
+
+    def add_symbol(self, symbol):
+        if symbol in self._rows:
+            return False
+        row = len(self._symbols)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._symbols.append(symbol)
+        self._labels.append("")
+        self._rows[symbol] = row
+        for name in self._FLOAT_COLUMNS:
+            setattr(self, name, np.append(getattr(self, name), np.nan))
+        self.spark = np.vstack([self.spark, np.full((1, self.spark_points), np.nan)])
+        self.endInsertRows()
+        return True
+
+    def remove_symbol(self, symbol):
+        row = self._rows.get(symbol)
+        if row is None:
+            return False
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._symbols[row]
+        del self._labels[row]
+        for name in self._FLOAT_COLUMNS:
+            setattr(self, name, np.delete(getattr(self, name), row))
+        self.spark = np.delete(self.spark, row, axis=0)
+        self._rows = {s: i for i, s in enumerate(self._symbols)}
+        self.endRemoveRows()
+        return True
+
+    # ---------------- Updates ---------------- #
+    def _rows_changed(self, first, last, first_col=1):
+        self.dataChanged.emit(self.index(first, first_col), self.index(last, self.TREND))
+
+    def seed(self, symbol, values):
+        """Stored-history values for one row (see core.watchlist.seed_row)"""
+        row = self._rows.get(symbol)
+        if row is None:
+            return
+        for name in ("last", "prev_close", "volume", "avg_gain", "avg_loss"):
+            getattr(self, name)[row] = values[name]
+        spark = np.asarray(values["spark"], dtype="float64")[-self.spark_points:]
+        self.spark[row] = np.nan
+        if len(spark):
+            self.spark[row, -len(spark):] = spark
+        self._rows_changed(row, row)
+
+    def apply_ticks(self, summaries):
+        """Fold one frame of {symbol: TickSummary} in; one dataChanged per call"""
+        rows, prices, volumes = [], [], []
+        for symbol, summary in summaries.items():
+            row = self._rows.get(symbol)
+            if row is None:
+                continue
+            rows.append(row)
+            prices.append(summary.price)
+            volumes.append(np.nan if summary.day_volume is None else summary.day_volume)
+        if not rows:
+            return 0
+
+        rows = np.asarray(rows)
+        prices = np.asarray(prices, dtype="float64")
+        volumes = np.asarray(volumes, dtype="float64")
+        self.last[rows] = prices
+        has_volume = ~np.isnan(volumes)
+        self.volume[rows[has_volume]] = volumes[has_volume]
+        # The newest sparkline point follows the live price
+        self.spark[rows, -1] = prices
+
+        self.updates += len(rows)
+        self._rows_changed(int(rows.min()), int(rows.max()))
+        return len(rows)
+
+    def set_sentiment(self, symbol, score, label=""):
+        row = self._rows.get(symbol)
+        if row is None:
+            return
+        self.sentiment[row] = score
+        self._labels[row] = label
+        self._rows_changed(row, row, self.SENTIMENT)
+
+    # ---------------- Qt model API ---------------- #
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._symbols)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.COLUMNS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.COLUMNS[section]
+        return None
+
+    def _change(self, row):
+        prev = self.prev_close[row]
+        if np.isnan(prev) or prev == 0:
+            return np.nan
+        return (self.last[row] - prev) / prev * 100
+
+    def _rsi(self, row):
+        return float(live_rsi(self.avg_gain[row], self.avg_loss[row],
+                              self.prev_close[row], self.last[row]))
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row, col = index.row(), index.column()
+
+        if role == Qt.DisplayRole:
+            if col == self.SYMBOL:
+                return self._symbols[row]
+            if col == self.LAST:
+                v = self.last[row]
+                return "—" if np.isnan(v) else f"${v:,.2f}"
+            if col == self.CHANGE:
+                v = self._change(row)
+                return "—" if np.isnan(v) else f"{v:+.2f}%"
+            if col == self.VOLUME:
+                v = self.volume[row]
+                return "—" if np.isnan(v) else _format_volume(v)
+            if col == self.RSI:
+                v = self._rsi(row)
+                return "—" if np.isnan(v) else f"{v:.1f}"
+            if col == self.SENTIMENT:
+                v = self.sentiment[row]
+                return "—" if np.isnan(v) else f"{v:.0f} {self._labels[row]}".strip()
+            return None
+
+        if role == SPARK_ROLE and col == self.TREND:
+            return self.spark[row]
+
+        if role == Qt.ForegroundRole and col == self.CHANGE:
+            v = self._change(row)
+            if not np.isnan(v):
+                return UP_COLOR if v >= 0 else DOWN_COLOR
+
+        if role == Qt.TextAlignmentRole and col != self.SYMBOL:
+            return int(Qt.AlignRight | Qt.AlignVCenter)
+        return None
+
+
+class SparklineDelegate(QStyledItemDelegate):
+    """Paints a row's recent closes as a polyline"""
+
+    def paint(self, painter, option, index):
+        if option.state & QStyle.State_Selected:
+            painter.fillRect(option.rect, option.palette.highlight())
+        values = index.data(SPARK_ROLE)
+        if values is None:
+            return
+        values = values[~np.isnan(values)]
+        if len(values) < 2:
+            return
+
+        rect = option.rect.adjusted(6, 5, -6, -5)
+        lo, hi = values.min(), values.max()
+        span = hi - lo or 1.0
+        xs = rect.left() + np.arange(len(values)) * (rect.width() / (len(values) - 1))
+        ys = rect.bottom() - (values - lo) / span * rect.height()
+
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(QPen(UP_COLOR if values[-1] >= values[0] else DOWN_COLOR, 1.5))
+        painter.drawPolyline(QPolygonF([QPointF(x, y) for x, y in zip(xs, ys)]))
+        painter.restore()
+
+
+class WatchlistWidget(QWidget):
+    """Watchlist page: add/remove symbols, double-click opens on the dashboard"""
+    ticker_activated = pyqtSignal(str)
+    symbol_added = pyqtSignal(str)
+    symbol_removed = pyqtSignal(str)
+
+    FRAME_MS = 100  # ticks are applied to the table at most this often
+
+    def __init__(self, channel=None, parent=None):
+        super().__init__(parent)
+        self.is_dark = True
+        self.channel = channel if channel is not None else TickChannel()
+        self.model = WatchlistModel(self)
+
+        self._frame_timer = QTimer(self)
+        self._frame_timer.setInterval(self.FRAME_MS)
+        self._frame_timer.timeout.connect(self._apply_frame)
+
+        register_scoped_style("WatchlistWidget", WATCHLIST_LIGHT_STYLE, WATCHLIST_DARK_STYLE)
+        self.setup_ui()
+
+    def setup_ui(self):
+        main_layout = QVBoxLayout(self)
+        main_layout.setSpacing(16)
+        main_layout.setContentsMargins(20, 20, 20, 20)
+
+        top_bar = QHBoxLayout()
+        self.back_btn = QPushButton("← Back to Dashboard")
+        self.back_btn.setFixedSize(180, 40)
+        self.back_btn.setCursor(Qt.PointingHandCursor)
+        top_bar.addWidget(self.back_btn, alignment=Qt.AlignLeft)
+        top_bar.addStretch()
+        main_layout.addLayout(top_bar)
+
+        header = QLabel("👀 Watchlist")
+        header.setObjectName("section_header")
+        header.setFont(QFont("Inter", 20, QFont.Bold))
+        main_layout.addWidget(header)
+
+        controls = QHBoxLayout()
+        self.symbol_input = QLineEdit()
+        self.symbol_input.setObjectName("watchlist_input")
+        self.symbol_input.setPlaceholderText("Add symbol (e.g., MSFT)")
+        self.symbol_input.setFixedHeight(40)
+        self.symbol_input.returnPressed.connect(self._on_add)
+        self.add_btn = QPushButton("➕ Add")
+        self.add_btn.setFixedSize(100, 40)
+        self.add_btn.setCursor(Qt.PointingHandCursor)
+        self.add_btn.clicked.connect(self._on_add)
+        self.remove_btn = QPushButton("🗑️ Remove")
+        self.remove_btn.setFixedSize(120, 40)
+        self.remove_btn.setCursor(Qt.PointingHandCursor)
+        self.remove_btn.clicked.connect(self._on_remove)
+        self.status_label = QLabel("")
+        self.status_label.setObjectName("watchlist_status")
+        controls.addWidget(self.symbol_input, 1)
+        controls.addWidget(self.add_btn)
+        controls.addWidget(self.remove_btn)
+        controls.addWidget(self.status_label)
+        main_layout.addLayout(controls)
+
+        self.table = QTableView()
+        self.table.setObjectName("watchlist_table")
+        self.table.setModel(self.model)
+        self.table.setItemDelegateForColumn(WatchlistModel.TREND, SparklineDelegate(self.table))
+        self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.table.setSelectionMode(QAbstractItemView.SingleSelection)
+        self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.table.setAlternatingRowColors(True)
+        self.table.setShowGrid(False)
+        self.table.setWordWrap(False)
+        # Fixed section sizes: no per-update size hints over 500 rows
+        vheader = self.table.verticalHeader()
+        vheader.setVisible(False)
+        vheader.setSectionResizeMode(QHeaderView.Fixed)
+        vheader.setDefaultSectionSize(30)
+        hheader = self.table.horizontalHeader()
+        hheader.setSectionResizeMode(QHeaderView.Stretch)
+        hheader.setSectionResizeMode(WatchlistModel.TREND, QHeaderView.Fixed)
+        hheader.resizeSection(WatchlistModel.TREND, 160)
+        self.table.doubleClicked.connect(self._on_double_click)
+        main_layout.addWidget(self.table, 1)
+
+    # ---------------- Symbols ---------------- #
+    def add_symbol(self, symbol):
+        symbol = symbol.upper().strip()
+        if symbol and self.model.add_symbol(symbol):
+            self.symbol_added.emit(symbol)
+            self._update_status()
+            return True
+        return False
+
+    def remove_symbol(self, symbol):
+        if self.model.remove_symbol(symbol):
+            self.channel.discard(symbol)
+            self.symbol_removed.emit(symbol)
+            self._update_status()
+            return True
+        return False
+
+    def _on_add(self):
+        text = self.symbol_input.text()
+        self.symbol_input.clear()
+        for symbol in text.replace(",", " ").split():
+            self.add_symbol(symbol)
+
+    def _on_remove(self):
+        rows = sorted({i.row() for i in self.table.selectionModel().selectedRows()}, reverse=True)
+        symbols = self.model.symbols()
+        for row in rows:
+            self.remove_symbol(symbols[row])
+
+    def _on_double_click(self, index):
+        self.ticker_activated.emit(self.model.symbols()[index.row()])
+
+    def _update_status(self, text=None):
+        self.status_label.setText(text or f"{self.model.rowCount()} symbols")
+
+    # ---------------- Frames ---------------- #
+    def _apply_frame(self):
+        summaries = self.channel.drain()
+        if summaries:
+            self.model.apply_ticks(summaries)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self._frame_timer.start()
+
+    def hideEvent(self, event):
+        # The channel keeps the latest tick per symbol while hidden
+        self._frame_timer.stop()
+        super().hideEvent(event)
+
+    def set_theme(self, is_dark):
+        self.is_dark = is_dark
+        self.table.viewport().update()
@@ -1,11 +1,15 @@
 # workers/ai_report_worker.py - FIXED VERSION
 import asyncio
 import json
-from PyQt5.QtCore import QThread, pyqtSignal
+
+import numpy as np
+from PyQt5.QtCore import QObject, pyqtSignal
 from groq import AsyncGroq
 
-class AIReportWorker(QThread):
-    """Worker thread for generating AI-powered stock reports using Groq API"""
+from core import perf
+
+class AIReportWorker(QObject):
+    """Worker for generating AI-powered stock reports using Groq API"""
     
     report_ready = pyqtSignal(str)  # Emits the generated report
     progress_update = pyqtSignal(str, int)  # Emits (message, percentage)
@@ -26,40 +30,37 @@ class AIReportWorker(QThread):
     def prepare_data_summary(self):
         """Prepare a structured summary of stock data for the AI"""
         try:
-            df = self.stock_data.get('dataframe')
-            if df is None or df.empty:
+            snapshot = self.stock_data.get('snapshot')
+            if snapshot is None or snapshot.empty:
                 return None
-                
-            # Calculate key metrics
-            latest_price = float(df['Close'].iloc[-1])
-            avg_price = float(df['Close'].mean())
-            min_price = float(df['Close'].min())
-            max_price = float(df['Close'].max())
-            price_change = float(df['Close'].iloc[-1] - df['Close'].iloc[0])
-            price_change_pct = (price_change / df['Close'].iloc[0]) * 100
+
+            # Calculate key metrics straight off the read-only columns
+            close = snapshot['Close']
+            volume = snapshot['Volume']
+            latest_price = float(close[-1])
+            avg_price = float(np.nanmean(close))
+            min_price = float(np.nanmin(close))
+            max_price = float(np.nanmax(close))
+            price_change = float(close[-1] - close[0])
+            price_change_pct = (price_change / close[0]) * 100
             
             # Volume analysis
-            avg_volume = float(df['Volume'].mean())
-            latest_volume = float(df['Volume'].iloc[-1])
+            avg_volume = float(np.nanmean(volume))
+            latest_volume = float(volume[-1])
             
-            # Technical indicators (if available)
-            indicators = {}
-            if 'SMA_20' in df.columns:
-                indicators['SMA_20'] = float(df['SMA_20'].iloc[-1])
-            if 'EMA_20' in df.columns:
-                indicators['EMA_20'] = float(df['EMA_20'].iloc[-1])
-            if 'RSI' in df.columns:
-                indicators['RSI'] = float(df['RSI'].iloc[-1])
-            if 'MACD' in df.columns:
-                indicators['MACD'] = float(df['MACD'].iloc[-1])
+            # Technical indicators - derived on the snapshot, shared with the chart
+            indicators = {
+                name: round(snapshot.last(name), 2)
+                for name in ('SMA_20', 'EMA_20', 'RSI_14', 'MACD', 'MACD_SIGNAL')
+            }
                 
             # Trend analysis
             recent_trend = "upward" if price_change > 0 else "downward"
-            volatility = float(df['Close'].std())
+            volatility = float(np.nanstd(close, ddof=1))
             
             summary = {
                 "ticker": self.ticker,
-                "period": f"{len(df)} days",
+                "period": f"{len(snapshot)} days",
                 "latest_price": round(latest_price, 2),
                 "average_price": round(avg_price, 2),
                 "min_price": round(min_price, 2),
@@ -119,19 +120,21 @@ class AIReportWorker(QThread):
                 self.client = AsyncGroq(api_key=self.api_key)
             
             # Call Groq API
-            response = await self.client.chat.completions.create(
-                model="llama-3.3-70b-versatile",
-                messages=[
-                    {
-                        "role": "system", 
-                        "content": """You are a professional financial analyst with expertise in technical analysis, 
+            perf.count("groq.calls")
+            with perf.span("groq.report", ticker=self.ticker):
+                response = await self.client.chat.completions.create(
+                    model="llama-3.3-70b-versatile",
+                    messages=[
+                        {
+                            "role": "system", 
+                            "content": """You are a professional financial analyst with expertise in technical analysis, 
                         market trends, and risk assessment. Generate detailed, actionable stock reports in markdown format."""
-                    },
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.5,
-                max_tokens=2048,
-            )
+                        },
+                        {"role": "user", "content": prompt}
+                    ],
+                    temperature=0.5,
+                    max_tokens=2048,
+                )
             
             if self._cancelled:
                 return None
@@ -243,7 +246,7 @@ Make the report professional, data-driven, and actionable for investors.
         return prompt
     
     def run(self):
-        """Run the worker thread"""
+        """Run the report generation (on a scheduler thread)"""
         print(f"🚀 AIReportWorker started for {self.ticker}")
         
         # Create new event loop for this thread
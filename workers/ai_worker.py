@@ -1,10 +1,12 @@
 # core/ai_worker.py
 import asyncio
-from PyQt5.QtCore import QThread, pyqtSignal
+from PyQt5.QtCore import QObject, pyqtSignal
 from groq import AsyncGroq
 
+from core import perf
 
-class AIChatWorker(QThread):
+
+class AIChatWorker(QObject):
     response_ready = pyqtSignal(str)
     error_occurred = pyqtSignal(str)
 
@@ -16,23 +18,29 @@ class AIChatWorker(QThread):
 
     async def fetch_response(self):
         try:
-            response = await self.client.chat.completions.create(
-                model="llama-3.3-70b-versatile",   #model="llama-3.3-70b-versatile",a3-70b-8192"
-                messages=[
-                    {"role": "system", "content": "You are a helpful stock advisor."},
-                    {"role": "user", "content": self.prompt},
-                ],
-                temperature=0.3,
-                max_tokens=512,
-            )
+            perf.count("groq.calls")
+            with perf.span("groq.chat"):
+                response = await self.client.chat.completions.create(
+                    model="llama-3.3-70b-versatile",   #model="llama-3.3-70b-versatile",a3-70b-8192"
+                    messages=[
+                        {"role": "system", "content": "You are a helpful stock advisor."},
+                        {"role": "user", "content": self.prompt},
+                    ],
+                    temperature=0.3,
+                    max_tokens=512,
+                )
             return response.choices[0].message.content
         except Exception as e:
             self.error_occurred.emit(str(e))
             return None
 
     def run(self):
+        # Runs on a scheduler thread; each request gets its own loop
         loop = asyncio.new_event_loop()
         asyncio.set_event_loop(loop)
-        response = loop.run_until_complete(self.fetch_response())
+        try:
+            response = loop.run_until_complete(self.fetch_response())
+        finally:
+            loop.close()
         if response:
             self.response_ready.emit(response)
@@ -0,0 +1,107 @@
+# workers/export_worker.py
+import os
+import time
+
+from PyQt5.QtCore import QObject, pyqtSignal
+
+from core import exporter, pdf_report
+from core.chart_cache import data_fingerprint
+from core.snapshot import MarketSnapshot
+
+
+class ExportWorker(QObject):
+    """Background worker for data (CSV/Parquet/Arrow) and PDF exports.
+
+    With `tickers` set (an empty list means the whole local store) every
+    ticker is exported from the parquet store - data on a thread pool, PDFs
+    in worker processes; otherwise the given snapshot/DataFrame is exported.
+    `finished` carries the output file, or the folder for a batch, and
+    `summary` holds rows/bytes/throughput or the PDF timing breakdown.
+    """
+    finished = pyqtSignal(str, str)  # (path, export_type)
+    progress = pyqtSignal(int, int, str)  # (done, total, message)
+    error = pyqtSignal(str)
+
+    def __init__(self, df, ticker, export_type, tickers=None, max_workers=4,
+                 chunk_rows=exporter.CHUNK_ROWS):
+        super().__init__()
+        # Export only reads: a snapshot's frame shares its read-only buffers
+        self.df = df.frame() if isinstance(df, MarketSnapshot) else df
+        # The chart PNG is cached per data version: reuse the snapshot's
+        # full-history fingerprint (memoized, shared with the chart cache)
+        self.version = data_fingerprint(df) if isinstance(df, MarketSnapshot) else None
+        self.ticker = ticker
+        self.export_type = export_type
+        self.tickers = tickers
+        self.max_workers = max_workers
+        self.chunk_rows = chunk_rows
+        self.summary = {}
+
+    def run(self):
+        try:
+            os.makedirs(exporter.EXPORT_FOLDER, exist_ok=True)
+            if self.tickers is not None:
+                path = self._export_batch()
+            elif self.export_type == "pdf":
+                path = self._create_pdf()
+            else:
+                path = self._export_frame()
+            self.finished.emit(path, self.export_type)
+        except Exception as e:
+            self.error.emit(str(e))
+
+    def _export_frame(self):
+        path = exporter.export_path(self.ticker, self.export_type)
+        total = len(self.df)
+        t0 = time.perf_counter()
+        rows = exporter.export_frame(
+            self.df, path, self.export_type, self.chunk_rows,
+            progress=lambda rows: self.progress.emit(rows, total, f"{rows:,}/{total:,} rows"),
+        )
+        seconds = time.perf_counter() - t0
+        self.summary = {
+            "rows": rows, "bytes": os.path.getsize(path), "seconds": seconds,
+            "rows_per_s": rows / seconds if seconds else 0.0,
+        }
+        print(f"💾 Exported {rows:,} rows to {path} in {seconds * 1000:.0f} ms")
+        return path
+
+    def _export_batch(self):
+        def progress(done, total, result):
+            if "error" in result:
+                message = f"⚠️ {result['ticker']}: {result['error']}"
+            elif "rows" in result:
+                message = f"{result['ticker']} ({result['rows']:,} rows)"
+            else:
+                message = f"{result['ticker']} ({result['total_ms']:.0f} ms)"
+            self.progress.emit(done, total, message)
+
+        if self.export_type == "pdf":
+            self.summary = s = pdf_report.build_reports(
+                self.tickers or None, self.max_workers, progress=progress
+            )
+            print(f"📄 Built {s['exported']}/{s['tickers']} PDF reports in {s['seconds']:.2f}s "
+                  f"({s['charts_cached']} cached charts)")
+            if s["failed"] and not s["exported"]:
+                raise RuntimeError(next(r["error"] for r in s["results"] if "error" in r))
+            return pdf_report.REPORT_FOLDER
+
+        self.summary = exporter.export_many(
+            self.tickers or None, self.export_type, max_workers=self.max_workers,
+            chunk_rows=self.chunk_rows, progress=progress,
+        )
+        s = self.summary
+        print(f"📦 Exported {s['exported']}/{s['tickers']} tickers as {s['format']}: "
+              f"{s['rows']:,} rows, {s['bytes'] / 1e6:.1f} MB in {s['seconds']:.2f}s "
+              f"({s['rows_per_s']:,.0f} rows/s, {s['mb_per_s']:.1f} MB/s)")
+        if s["failed"] and not s["exported"]:
+            raise RuntimeError(next(r["error"] for r in s["results"] if "error" in r))
+        return exporter.EXPORT_FOLDER
+
+    def _create_pdf(self):
+        result = pdf_report.build_report(self.ticker, self.df, version=self.version)
+        self.summary = result
+        chart = "cached" if result["chart_cached"] else f"{result['chart_ms']:.0f} ms"
+        print(f"📄 PDF for {self.ticker} in {result['total_ms']:.0f} ms (chart {chart}, "
+              f"table {result['table_ms']:.0f} ms, build {result['build_ms']:.0f} ms)")
+        return result["path"]
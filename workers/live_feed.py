@@ -0,0 +1,251 @@
+# workers/live_feed.py
+"""
+One websocket for every live ticker.
+
+`LiveFeedService` owns a single event loop thread and a single streaming
+connection. Subscribers register a callback per ticker; the service sends
+subscribe/unsubscribe frames only when the first subscriber for a symbol
+arrives or the last one leaves, so switching tickers or watching a large
+watchlist never reconnects. Callbacks run on the feed thread and must be
+quick (or hand work to Qt via signals).
+
+The connection comes from `socket_factory`, which defaults to the data
+provider's (`core.providers`): yfinance's `AsyncWebSocket` online, simulated
+ticks with the local provider. Pass `lambda: ReplayWebSocket(messages)` to
+drive the whole pipeline offline from recorded messages, and a
+`core.tick_log.TickRecorder` as `recorder` to capture a live session for
+later replay.
+"""
+import asyncio
+import threading
+import time
+
+from PyQt5.QtCore import QThread, pyqtSignal
+
+from core.providers import YFinanceProvider, get_provider
+
+
+def yahoo_socket():
+    return YFinanceProvider().live_socket()
+
+
+def provider_socket():
+    return get_provider().live_socket()
+
+
+class ReplayWebSocket:
+    """Local stand-in for AsyncWebSocket that replays recorded messages.
+
+    `messages` are decoded feed dicts (each with an "id"), or `(recv_ts, dict)`
+    pairs as produced by `core.tick_log.read_ticks`. Only messages for
+    subscribed symbols are delivered. Timed messages are paced by their
+    recorded gaps divided by `speed` (1.0 = real time, 10.0 = 10x,
+    None = as fast as possible); plain dicts are `interval` seconds apart.
+    Once exhausted `listen()` idles until `close()` unless `repeat` is set.
+
+    `clock()` returns the recorded time of the message being delivered, so
+    throttles driven by it behave identically at any replay speed.
+    """
+
+    def __init__(self, messages, interval=0.0, repeat=False, speed=1.0):
+        self.messages = [m if isinstance(m, tuple) else (None, m) for m in messages]
+        self.interval = interval
+        self.repeat = repeat
+        self.speed = speed
+        self.subscribed = set()
+        self.closed = False
+        self.delivered = 0
+        self.finished = False
+        self._now = None
+
+    @classmethod
+    def from_log(cls, path, speed=1.0, repeat=False):
+        from core.tick_log import read_ticks
+        return cls(list(read_ticks(path)), repeat=repeat, speed=speed)
+
+    def clock(self):
+        return self._now if self._now is not None else time.time()
+
+    async def subscribe(self, symbols):
+        self.subscribed.update([symbols] if isinstance(symbols, str) else symbols)
+
+    async def unsubscribe(self, symbols):
+        self.subscribed.difference_update([symbols] if isinstance(symbols, str) else symbols)
+
+    async def _pace(self, prev_ts, recv_ts):
+        if recv_ts is None or prev_ts is None:
+            delay = self.interval
+        elif self.speed:
+            delay = max(0.0, recv_ts - prev_ts) / self.speed
+        else:
+            delay = 0.0
+        # Yield to the loop even at max speed so subscribe/stop calls get in
+        await asyncio.sleep(delay)
+
+    async def listen(self, message_handler):
+        while not self.closed:
+            prev_ts = None
+            for recv_ts, message in self.messages:
+                if self.closed:
+                    return
+                await self._pace(prev_ts, recv_ts)
+                prev_ts = recv_ts
+                if message.get("id") in self.subscribed:
+                    self._now = recv_ts
+                    result = message_handler(dict(message))
+                    if asyncio.iscoroutine(result):
+                        await result
+                    self.delivered += 1
+            if not self.repeat:
+                break
+        self.finished = True
+        while not self.closed:
+            await asyncio.sleep(0.05)
+
+    async def close(self):
+        self.closed = True
+
+
+class LiveFeedService(QThread):
+    error = pyqtSignal(str)
+
+    RECONNECT_DELAY_S = 1.0
+    MAX_RECONNECT_DELAY_S = 30.0
+
+    def __init__(self, socket_factory=provider_socket, recorder=None, parent=None):
+        super().__init__(parent)
+        self.socket_factory = socket_factory
+        self.recorder = recorder  # core.tick_log.TickRecorder, or None
+        self.loop = None
+        self.websocket = None
+        self.running = True
+        self._listen_task = None
+        self._lock = threading.Lock()
+        # ticker -> list of callbacks(data)
+        self._subscribers = {}
+        self.messages_received = 0
+
+    # ---------------- Subscriptions (any thread) ---------------- #
+    def subscribe(self, ticker, callback):
+        ticker = ticker.upper().strip()
+        with self._lock:
+            callbacks = self._subscribers.setdefault(ticker, [])
+            first = not callbacks
+            callbacks.append(callback)
+        if first:
+            self._send("subscribe", ticker)
+
+    def unsubscribe(self, ticker, callback):
+        ticker = ticker.upper().strip()
+        with self._lock:
+            callbacks = self._subscribers.get(ticker, [])
+            if callback in callbacks:
+                callbacks.remove(callback)
+            last = ticker in self._subscribers and not callbacks
+            if last:
+                del self._subscribers[ticker]
+        if last:
+            self._send("unsubscribe", ticker)
+
+    def symbols(self):
+        with self._lock:
+            return sorted(self._subscribers)
+
+    def _send(self, action, ticker):
+        loop = self.loop
+        if loop is None or not loop.is_running():
+            return  # picked up by _connect() once the loop is up
+        asyncio.run_coroutine_threadsafe(self._send_async(action, [ticker]), loop)
+
+    async def _send_async(self, action, symbols):
+        if self.websocket is None:
+            return
+        try:
+            await getattr(self.websocket, action)(symbols)
+        except Exception as e:
+            self.error.emit(f"Live feed {action} failed for {symbols}: {e}")
+
+    # ---------------- Feed loop ---------------- #
+    async def _dispatch(self, data):
+        ticker = data.get("id")
+        if not ticker:
+            return
+        self.messages_received += 1
+        if self.recorder is not None:
+            self.recorder.record(data)
+        with self._lock:
+            callbacks = list(self._subscribers.get(ticker, ()))
+        for callback in callbacks:
+            try:
+                callback(data)
+            except Exception as e:
+                self.error.emit(f"Live feed subscriber error ({ticker}): {e}")
+
+    async def _connect(self):
+        self.websocket = self.socket_factory()
+        if self.websocket is None:
+            self.error.emit("Live prices unavailable - AsyncWebSocket not supported")
+            return False
+        symbols = self.symbols()
+        if symbols:
+            await self.websocket.subscribe(symbols)
+        return True
+
+    async def _run_async(self):
+        delay = self.RECONNECT_DELAY_S
+        while self.running:
+            try:
+                if not await self._connect():
+                    return
+                delay = self.RECONNECT_DELAY_S
+                # yfinance's listen() never returns on its own (it reconnects
+                # internally), so stop() cancels this task instead
+                self._listen_task = asyncio.ensure_future(self.websocket.listen(self._dispatch))
+                await self._listen_task
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                if self.running:
+                    self.error.emit(f"Live feed dropped: {e}")
+            if self.running:
+                # Reconnect and resubscribe everything, backing off on repeats
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, self.MAX_RECONNECT_DELAY_S)
+
+    def run(self):
+        try:
+            self.loop = asyncio.new_event_loop()
+            asyncio.set_event_loop(self.loop)
+            self.loop.run_until_complete(self._run_async())
+        except Exception as e:
+            if self.running:
+                self.error.emit(f"WebSocket loop error: {e}")
+        finally:
+            if self.recorder is not None:
+                self.recorder.close()
+            if self.loop:
+                try:
+                    self.loop.close()
+                except:
+                    pass
+
+    def stop(self):
+        """Close the shared connection and end the feed thread"""
+        print("🛑 Stopping live feed service...")
+        self.running = False
+        loop = self.loop
+        if loop and loop.is_running():
+            try:
+                asyncio.run_coroutine_threadsafe(self._shutdown(), loop)
+            except:
+                pass
+        print("✓ Live feed service stopped")
+
+    async def _shutdown(self):
+        if self._listen_task is not None and not self._listen_task.done():
+            self._listen_task.cancel()
+        if self.websocket is not None:
+            try:
+                await self.websocket.close()
+            except Exception:
+                pass
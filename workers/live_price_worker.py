@@ -1,59 +1,64 @@
 # live_price_worker.py
-import asyncio
-import threading
 import time
-import os
 import pandas as pd
-import yfinance as yf
-from datetime import datetime
-from PyQt5.QtCore import QThread, pyqtSignal
-
-
-class LivePriceWorker(QThread):
-    price_update = pyqtSignal(str, float)
+from PyQt5.QtCore import QObject, pyqtSignal
+
+from core import parquet_store
+from core.bar_builder import INTRADAY_TIMEFRAMES, BarBuilder
+from core.history_cache import get_history, put_history
+from core.tick_channel import TickChannel
+from core.write_behind import write_behind
+
+
+class LivePriceWorker(QObject):
+    """Per-ticker subscriber on the shared LiveFeedService.
+
+    Publishes every tick to a coalescing TickChannel that the GUI drains at
+    its own rate, aggregates ticks into 1m-1d bars and hands persistence of
+    completed bars plus today's daily row to the write-behind queue, so a
+    slow disk never stalls the feed thread. It owns no connection or
+    event loop of its own: start()/stop() just subscribe and unsubscribe, so
+    switching tickers never reconnects.
+    """
+    bars_closed = pyqtSignal(str, list)  # ticker, timeframes with a new bar
     error = pyqtSignal(str)
 
-    def __init__(self, ticker, parent=None):
+    def __init__(self, ticker, feed, channel=None, writer=None, parent=None, clock=time.time):
         super().__init__(parent)
-        self._last_emit_ts = 0.0
-        self._emit_interval = 0.5
-        self._last_parquet_write_ts = 0.0
-        self._parquet_write_interval = 5.0
-        self._pending_price = None
+        self.feed = feed
+        self.channel = channel if channel is not None else TickChannel()
+        self.writer = writer if writer is not None else write_behind
+        # Replays pass the recorded clock when messages carry no timestamp
+        self.clock = clock
         self.ticker = ticker.upper().strip()
-        self.loop = None
-        self.websocket = None
-        self.running = True
-        self.parquet_path = f"./csv_data_files/{self.ticker}.parquet"
-        self.ohlc_thread = None
-        self._df_cache = None
-        self._df_cache_time = 0.0
-        self._df_cache_ttl = 10.0
+        self.bars = BarBuilder(self.ticker)
+        # Flushes merge per worker, not per ticker: an old worker's queued
+        # flush must not replace a new one's (each drains its own builder)
+        self._flush_key = (self.ticker, id(self))
+        self.running = False
 
     def _get_cached_df(self):
-        """Get DataFrame from cache or load from disk"""
-        now = time.time()
-        if self._df_cache is None or (now - self._df_cache_time) > self._df_cache_ttl:
-            if os.path.exists(self.parquet_path):
-                self._df_cache = pd.read_parquet(self.parquet_path)
-                self._df_cache_time = now
-            else:
-                self._df_cache = None
-        return self._df_cache
+        """Shared read-only history view - copy() before writing values"""
+        return get_history(self.ticker)
 
     def _save_df(self, df):
-        """Save DataFrame and update cache"""
-        df.to_parquet(self.parquet_path, index=False, engine="pyarrow")
-        self._df_cache = df
-        self._df_cache_time = time.time()
-
-    def _safe_float(self, val):
-        """Safely convert value to float, handling Series"""
-        if hasattr(val, 'iloc'):
-            return float(val.iloc[0])
-        return float(val)
-
-    async def _message_handler(self, data):
+        """Atomically save DataFrame and republish it to the shared cache.
+
+        Call with `parquet_store.write_lock(self.ticker)` held around the
+        read-modify-write so a DataWorker sync doesn't lose our update.
+        """
+        table, version = parquet_store.save(self.ticker, df)
+        put_history(self.ticker, table, version)
+
+    def _tick_time(self, data):
+        """Exchange timestamp (ms) from the message, else the receive clock"""
+        try:
+            return float(data["time"]) / 1000.0
+        except (KeyError, TypeError, ValueError):
+            return self.clock()
+
+    def _message_handler(self, data):
+        """Called on the feed thread for every message for self.ticker"""
         try:
             price = None
             if "id" in data and "price" in data:
@@ -64,174 +69,100 @@ class LivePriceWorker(QThread):
             if price is None:
                 return
 
-            now = time.time()
+            price = float(price)
+            ts = self._tick_time(data)
+            closed = self.bars.on_tick(ts, price, data.get("day_volume"))
+            if closed:
+                self.bars_closed.emit(self.ticker, closed)
 
-            if now - self._last_emit_ts >= self._emit_interval:
-                self._last_emit_ts = now
-                try:
-                    self.price_update.emit(self.ticker, float(price))
-                except Exception:
-                    pass
+            # Latest value wins; the GUI drains the channel at its frame rate
+            self.channel.publish(self.ticker, price, self.bars.last_volume, ts, self.bars.day_volume)
 
-            self._pending_price = float(price)
-            if now - self._last_parquet_write_ts >= self._parquet_write_interval:
-                self._last_parquet_write_ts = now
-                self._update_close_price(float(price))
+            # Merged per worker: one write per flush interval however many ticks
+            self.writer.submit(self._flush_key, self._flush_bars)
 
         except Exception as e:
             self.error.emit(f"Error parsing message: {e}")
 
-    def _update_close_price(self, price: float):
+    def _merge_daily(self, df, bar, day_volume=None):
+        """Upsert one 1d bar into the daily history frame (already a copy)"""
+        date = pd.Timestamp(bar[0], unit="s")
+        hit = df.index[df["Date"] == date] if not df.empty else []
+        if len(hit):
+            i = hit[-1]
+            # Keep the day's open/range from the downloaded history; the
+            # builder only saw ticks since the app started
+            if pd.isna(df.at[i, "Open"]):
+                df.at[i, "Open"] = bar[1]
+            df.at[i, "High"] = bar[2] if pd.isna(df.at[i, "High"]) else max(df.at[i, "High"], bar[2])
+            df.at[i, "Low"] = bar[3] if pd.isna(df.at[i, "Low"]) else min(df.at[i, "Low"], bar[3])
+            df.at[i, "Close"] = bar[4]
+            volume = day_volume if day_volume is not None else max(float(df.at[i, "Volume"]), bar[5])
+            df.at[i, "Volume"] = int(volume)
+            return df
+        new_row = pd.DataFrame([{
+            "Date": date, "Open": bar[1], "High": bar[2], "Low": bar[3],
+            "Close": bar[4], "Volume": day_volume if day_volume is not None else bar[5],
+        }])
+        return pd.concat([df, new_row], ignore_index=True)
+
+    def _flush_bars(self):
+        """One batched write: completed intraday bars + today's daily row.
+
+        Runs on the write-behind thread and reads the builder's state at that
+        moment, so merged submissions lose nothing.
+        """
         try:
-            df = self._get_cached_df()
-            if df is None:
-                return
+            with parquet_store.write_lock(self.ticker):
+                for tf, frame in self.bars.drain(INTRADAY_TIMEFRAMES).items():
+                    parquet_store.append_bars(self.ticker, tf, frame)
 
-            today = datetime.now().strftime("%Y-%m-%d")
-            
-            # Ensure Date column is string for comparison
-            if "Date" in df.columns:
-                df["Date"] = pd.to_datetime(df["Date"]).dt.strftime("%Y-%m-%d")
-
-            if not df.empty and str(df.iloc[-1]["Date"]) == today:
-                df.loc[df.index[-1], "Close"] = price
-            else:
-                new_row = pd.DataFrame([{
-                    "Date": today, "Open": None, "High": None,
-                    "Low": None, "Close": price, "Volume": None
-                }])
-                df = pd.concat([df, new_row], ignore_index=True)
-
-            for col in ["Open", "High", "Low", "Close", "Volume"]:
-                if col in df.columns:
-                    df[col] = pd.to_numeric(df[col], errors="coerce")
-
-            self._save_df(df)
-        except Exception as e:
-            self.error.emit(f"Error updating Parquet with price: {e}")
-
-    def _periodic_ohlc_updater(self):
-        """Fetch OHLCV data every 5 minutes"""
-        while self.running:
-            try:
                 df = self._get_cached_df()
-                if df is None:
-                    time.sleep(60)
-                    continue
-
-                df_latest = yf.download(
-                    self.ticker, period="1d", interval="1m", progress=False
-                )
-
-                if not df_latest.empty:
-                    latest_row = df_latest.iloc[-1]
-
-                    # Use safe_float to handle Series properly
-                    o = self._safe_float(latest_row["Open"])
-                    h = self._safe_float(latest_row["High"])
-                    l = self._safe_float(latest_row["Low"])
-                    c = self._safe_float(latest_row["Close"])
-                    v = self._safe_float(latest_row["Volume"])
-
-                    today = datetime.now().strftime("%Y-%m-%d")
-                    
-                    # Ensure Date is string for comparison
-                    if "Date" in df.columns:
-                        df["Date"] = pd.to_datetime(df["Date"]).dt.strftime("%Y-%m-%d")
-
-                    if not df.empty and str(df.iloc[-1]["Date"]) == today:
-                        df.at[df.index[-1], "Open"] = o
-                        df.at[df.index[-1], "High"] = h
-                        df.at[df.index[-1], "Low"] = l
-                        df.at[df.index[-1], "Close"] = c
-                        df.at[df.index[-1], "Volume"] = v
-                    else:
-                        new_row = pd.DataFrame([{
-                            "Date": today, "Open": o, "High": h,
-                            "Low": l, "Close": c, "Volume": v
-                        }])
-                        df = pd.concat([df, new_row], ignore_index=True)
-
-                    for col in ["Open", "High", "Low", "Close", "Volume"]:
-                        if col in df.columns:
-                            df[col] = pd.to_numeric(df[col], errors="coerce")
-
-                    self._save_df(df)
-
-            except Exception as e:
-                if self.running:
-                    self.error.emit(f"OHLC updater error: {e}")
-
-            for _ in range(60):
-                if not self.running:
-                    break
-                time.sleep(5)
-
-    async def _run_async(self):
-        try:
-            try:
-                from yfinance import AsyncWebSocket
-            except ImportError:
-                # AsyncWebSocket not available in this yfinance version
-                self.error.emit("Live prices unavailable - AsyncWebSocket not supported")
-                return
-
-            self.websocket = AsyncWebSocket(
-                url="wss://streamer.finance.yahoo.com/?version=2",
-                verbose=False
-            )
-            await self.websocket.subscribe(self.ticker)
-
-            while self.running:
-                try:
-                    await asyncio.wait_for(
-                        self.websocket.listen(self._message_handler),
-                        timeout=1.0
-                    )
-                except asyncio.TimeoutError:
-                    continue
-
+                today = self.bars.current("1d")
+                if df is None or today is None:
+                    # Finished days stay pending until there is a history
+                    # to merge them into
+                    return
+                df = df.copy()  # values are written below
+
+                finished_days = self.bars.drain(("1d",)).get("1d")
+                if finished_days is not None:
+                    for row in finished_days.itertuples(index=False):
+                        bar = [pd.Timestamp(row.Date).value // 10**9, row.Open, row.High,
+                               row.Low, row.Close, row.Volume]
+                        df = self._merge_daily(df, bar)
+                df = self._merge_daily(df, today, self.bars.day_volume)
+
+                self._save_df(df)
         except Exception as e:
-            if self.running:
-                self.error.emit(str(e))
-
-    def run(self):
-        try:
-            self.ohlc_thread = threading.Thread(
-                target=self._periodic_ohlc_updater,
-                daemon=True
-            )
-            self.ohlc_thread.start()
-
-            self.loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(self.loop)
-            self.loop.run_until_complete(self._run_async())
+            self.error.emit(f"Error flushing live bars: {e}")
+
+    def intraday_frame(self, timeframe):
+        """Stored bars for `timeframe` merged with the ones still in memory"""
+        stored = parquet_store.load_bars(self.ticker, timeframe)
+        live = self.bars.frame(timeframe)
+        if stored.empty:
+            return live
+        if live.empty:
+            return stored
+        merged = pd.concat([stored, live]).drop_duplicates(subset=["Date"], keep="last")
+        return merged.sort_values("Date").reset_index(drop=True)
+
+    def start(self):
+        if self.running:
+            return
+        self.running = True
+        self.feed.subscribe(self.ticker, self._message_handler)
 
-        except Exception as e:
-            if self.running:
-                self.error.emit(f"WebSocket loop error: {e}")
-        finally:
-            if self.loop:
-                try:
-                    self.loop.close()
-                except:
-                    pass
+    def isRunning(self):
+        return self.running
 
     def stop(self):
-        """Stop the worker gracefully"""
+        """Unsubscribe from the shared feed and queue a flush of the open bars"""
         print(f"🛑 Stopping LivePriceWorker for {self.ticker}...")
         self.running = False
-
-        if self.loop and self.loop.is_running():
-            self.loop.call_soon_threadsafe(self.loop.stop)
-
-        if self.websocket:
-            try:
-                asyncio.run_coroutine_threadsafe(
-                    self.websocket.close(),
-                    self.loop
-                )
-            except:
-                pass
-
-        print(f"✓ LivePriceWorker for {self.ticker} stopped")
\ No newline at end of file
+        self.feed.unsubscribe(self.ticker, self._message_handler)
+        self.channel.discard(self.ticker)
+        if self.bars.ticks:
+            self.writer.submit(self._flush_key, self._flush_bars)
+        print(f"✓ LivePriceWorker for {self.ticker} stopped")
@@ -0,0 +1,109 @@
+# workers/prefetcher.py
+import os
+
+from PyQt5.QtCore import QObject, QTimer, pyqtSignal
+
+from core import parquet_store, perf
+from core.data_handler import load_market_data
+from core.prefetch import CALLS_PER_TICKER, Budget, PrefetchCache, candidates, load_recent, note_viewed
+from workers.scheduler import BACKGROUND
+
+# Derived columns every view of a ticker reads (chart defaults, AI report)
+WARM_COLUMNS = ("SMA_20", "EMA_20", "RSI_14", "MACD_HIST", "BB_UPPER", "BB_LOWER")
+
+
+class Prefetcher(QObject):
+    """Warms likely-next tickers while the user is idle.
+
+    A round starts IDLE_DELAY_MS after the last load and runs as one
+    BACKGROUND scheduler task (key "prefetch"): for each candidate it loads
+    the data exactly like a search would, computes the common derived
+    columns and renders the chart with the current options. `cancel()` -
+    called first thing on every real search - drops the round at the next
+    step. Set STOCKDASH_PREFETCH=0 to turn it off.
+    """
+    IDLE_DELAY_MS = 4000
+    TICKERS_PER_ROUND = 3
+
+    # (ticker, snapshot version, chart options, is_dark, Figure) - GUI thread
+    figure_ready = pyqtSignal(str, object, object, bool, object)
+
+    def __init__(self, scheduler, watchlist=list, chart_state=lambda: None, render=None,
+                 parent=None):
+        super().__init__(parent)
+        self.scheduler = scheduler
+        self.cache = PrefetchCache()
+        self.budget = Budget()
+        self.recent = load_recent()
+        self.current = None
+        self.enabled = os.getenv("STOCKDASH_PREFETCH", "1") != "0"
+        self._watchlist = watchlist  # () -> watchlist symbols
+        self._chart_state = chart_state  # () -> (options, is_dark)
+        self._render = render  # (snapshot, ticker, options, is_dark) -> Figure, off the GUI thread
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(self.IDLE_DELAY_MS)
+        self._timer.timeout.connect(self._start_round)
+
+    # ---------------- Control (GUI thread) ---------------- #
+    def viewed(self, ticker):
+        """The user is now looking at `ticker`; plan the next round around it"""
+        self.current = ticker
+        note_viewed(self.recent, ticker)
+        self.schedule()
+
+    def schedule(self):
+        if self.enabled:
+            self._timer.start()
+
+    def cancel(self):
+        self._timer.stop()
+        self.scheduler.cancel("prefetch")
+
+    def take(self, ticker):
+        """A warm (snapshot, fundamentals, details, news) for `ticker`, or None"""
+        return self.cache.take(ticker)
+
+    def _start_round(self):
+        if self.budget.calls_left() < CALLS_PER_TICKER:
+            return
+        exclude = [self.current] if self.current else []
+        exclude += [t for t in self.cache.tickers() if self.cache.warm(t)]
+        tickers = candidates(
+            self.recent, self._watchlist(), parquet_store.tickers(),
+            exclude=exclude, limit=self.TICKERS_PER_ROUND,
+        )
+        if tickers:
+            chart_state = self._chart_state() if self._render else None
+            self.scheduler.submit(
+                self._run_round, tickers, chart_state,
+                key="prefetch", name=f"prefetch {', '.join(tickers)}", priority=BACKGROUND,
+            )
+
+    # ---------------- Round (pool thread) ---------------- #
+    def _run_round(self, tickers, chart_state, token):
+        has_cpu = self.budget.round_clock()
+        for ticker in tickers:
+            if token.cancelled or not has_cpu():
+                return
+            if not self.budget.take_calls(CALLS_PER_TICKER):
+                print("⏸️ Prefetch network budget used up for now")
+                return
+            with perf.span("prefetch.ticker", ticker=ticker):
+                result = load_market_data(ticker, cancelled=lambda: token.cancelled)
+                if result is None or token.cancelled:
+                    continue
+                snapshot = result[0]
+                for name in WARM_COLUMNS:
+                    snapshot[name]
+                self.cache.put(ticker, result)
+                perf.count("prefetch.tickers")
+                print(f"🔥 Prefetched {ticker} ({len(snapshot)} bars)")
+
+                if chart_state is None or token.cancelled or not has_cpu():
+                    continue
+                options, is_dark = chart_state
+                fig = self._render(snapshot, ticker, options, is_dark)
+                if fig is not None and not token.cancelled:
+                    self.figure_ready.emit(ticker, snapshot.version, options, is_dark, fig)
@@ -0,0 +1,382 @@
+# workers/scheduler.py
+"""
+One scheduler for every background job in the app.
+
+Jobs run on a bounded pool of threads or, for CPU-heavy pure functions, on
+a spawn-context process pool. Each job gets a `CancelToken`. A job
+submitted with a `key` supersedes the queued or running job with the same
+key ("latest request wins"): the old token is cancelled and its result is
+dropped, so switching tickers quickly never piles up work or blocks the GUI
+in `wait()`.
+
+Interactive jobs (what the user is looking at) always go first, and one
+thread is kept free for them so long background jobs cannot starve the UI.
+
+Worker objects (QObject with `run()` and signals) are submitted as-is with
+`submit_worker()`: `run()` executes on a pool thread and its signals are
+queued to their receivers on the GUI thread as usual.
+"""
+import heapq
+import itertools
+import threading
+import time
+from collections import deque
+
+from PyQt5.QtCore import QObject, Qt, pyqtSignal
+
+from core.process_pool import process_pool
+
+INTERACTIVE = 0
+BACKGROUND = 10
+
+
+class TaskCancelled(Exception):
+    pass
+
+
+class CancelToken:
+    """Cooperative cancellation flag shared by the scheduler and one job"""
+
+    def __init__(self):
+        self._event = threading.Event()
+        self._lock = threading.Lock()
+        self._callbacks = []
+
+    @property
+    def cancelled(self):
+        return self._event.is_set()
+
+    def cancel(self):
+        with self._lock:
+            if self._event.is_set():
+                return
+            self._event.set()
+            callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception as e:
+                print(f"⚠️ Cancel callback failed: {e}")
+
+    def on_cancel(self, callback):
+        """Run `callback` on cancellation (immediately if already cancelled)"""
+        with self._lock:
+            if not self._event.is_set():
+                self._callbacks.append(callback)
+                return
+        callback()
+
+    def raise_if_cancelled(self):
+        if self._event.is_set():
+            raise TaskCancelled()
+
+    def wait(self, timeout):
+        """Sleep up to `timeout` seconds; True if cancelled meanwhile"""
+        return self._event.wait(timeout)
+
+
+class Task:
+    __slots__ = (
+        "id", "key", "name", "priority", "process", "fn", "args", "kwargs", "token",
+        "state", "submitted", "started", "ended", "result", "error",
+        "on_done", "on_error", "worker",
+    )
+
+    def __init__(self, task_id, fn, args, kwargs, key, name, priority, process,
+                 on_done, on_error, worker=None):
+        self.id = task_id
+        self.key = key
+        self.name = name or key or getattr(fn, "__qualname__", "task")
+        self.priority = priority
+        self.process = process
+        self.fn, self.args, self.kwargs = fn, args, kwargs
+        self.token = CancelToken()
+        self.state = "queued"
+        self.submitted = time.monotonic()
+        self.started = None
+        self.ended = None
+        self.result = None
+        self.error = None
+        self.on_done = on_done
+        self.on_error = on_error
+        self.worker = worker
+
+    def info(self, now=None):
+        now = now or time.monotonic()
+        started = self.started or now
+        return {
+            "id": self.id, "name": self.name, "key": self.key,
+            "priority": "interactive" if self.priority <= INTERACTIVE else "background",
+            "pool": "process" if self.process else "thread",
+            "state": self.state,
+            "queued_ms": (started - self.submitted) * 1000,
+            "run_ms": ((self.ended or now) - self.started) * 1000 if self.started else 0.0,
+        }
+
+
+class TaskScheduler(QObject):
+    tasks_changed = pyqtSignal()
+    _task_ended = pyqtSignal(object)  # pool thread -> GUI thread
+
+    def __init__(self, max_threads=4, max_processes=None, reserved_interactive=1, parent=None):
+        super().__init__(parent)
+        self.max_threads = max(1, max_threads)
+        self.max_processes = max_processes
+        # Background jobs may use all threads but these
+        self.reserved_interactive = min(reserved_interactive, self.max_threads - 1)
+        self._cond = threading.Condition()
+        self._queue = []  # heap of (priority, seq, task)
+        self._seq = itertools.count()
+        self._ids = itertools.count(1)
+        self._queued = {}
+        self._running = {}
+        self._by_key = {}
+        self._recent = deque(maxlen=50)
+        self._background_running = 0
+        self._shutdown = False
+        self._process_pool = None
+        self.stats = {"submitted": 0, "superseded": 0, "completed": 0, "failed": 0, "cancelled": 0}
+
+        # Always queued, even from the GUI thread: it can be emitted by code
+        # that holds the lock (a future cancelled under it runs its callback)
+        self._task_ended.connect(self._on_task_ended, Qt.QueuedConnection)
+        self._threads = [
+            threading.Thread(target=self._worker_loop, name=f"scheduler-{i}", daemon=True)
+            for i in range(self.max_threads)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    # ---------------- Submitting ---------------- #
+    def submit(self, fn, *args, key=None, name=None, priority=INTERACTIVE, process=False,
+               on_done=None, on_error=None, **kwargs):
+        """Queue `fn(*args, **kwargs)`; returns the Task.
+
+        Thread jobs may accept a `token` keyword to poll for cancellation.
+        `process=True` runs a picklable top-level function in the process
+        pool instead. `on_done(result)` / `on_error(message)` run on the GUI
+        thread, and never for a cancelled or superseded job.
+        """
+        return self._enqueue(Task(
+            next(self._ids), fn, args, kwargs, key, name, priority, process, on_done, on_error
+        ))
+
+    def submit_worker(self, worker, key=None, name=None, priority=INTERACTIVE):
+        """Run a worker object's `run()` on the pool.
+
+        Cancelling calls the worker's `cancel()`/`stop()` if it has one and
+        blocks its signals, so a superseded worker can't deliver stale results.
+        The worker is deleteLater()'d once it has finished.
+        """
+        task = Task(next(self._ids), worker.run, (), {}, key,
+                    name or type(worker).__name__, priority, False, None, None, worker)
+        for hook in ("cancel", "stop"):
+            if callable(getattr(worker, hook, None)):
+                task.token.on_cancel(getattr(worker, hook))
+                break
+        task.token.on_cancel(lambda: worker.blockSignals(True))
+        return self._enqueue(task)
+
+    def _enqueue(self, task):
+        with self._cond:
+            if self._shutdown:
+                raise RuntimeError("scheduler is shut down")
+            ended = []
+            if task.key is not None:
+                previous = self._by_key.get(task.key)
+                if previous is not None:
+                    ended += self._cancel_locked(previous)
+                    self.stats["superseded"] += 1
+                self._by_key[task.key] = task
+            self._queued[task.id] = task
+            heapq.heappush(self._queue, (task.priority, next(self._seq), task))
+            self.stats["submitted"] += 1
+            self._cond.notify()
+        self._emit_ended(ended)
+        return task
+
+    # ---------------- Cancelling ---------------- #
+    def _cancel_locked(self, task):
+        """Cancel `task`; returns the tasks that ended, to emit once unlocked"""
+        # Callbacks only set flags / post to loops, safe under the lock
+        task.token.cancel()
+        if task.state != "queued":
+            return []
+        # Left in the heap and skipped when popped
+        self._queued.pop(task.id, None)
+        task.state = "cancelled"
+        task.ended = time.monotonic()
+        self._finish_locked(task)
+        return [task]
+
+    def _emit_ended(self, ended):
+        # Outside the lock: slots may call back into the scheduler
+        for task in ended:
+            self._task_ended.emit(task)
+        self.tasks_changed.emit()
+
+    def cancel(self, key_or_task):
+        ended = []
+        with self._cond:
+            task = key_or_task if isinstance(key_or_task, Task) else self._by_key.get(key_or_task)
+            if task is not None and task.state in ("queued", "running"):
+                ended = self._cancel_locked(task)
+        self._emit_ended(ended)
+
+    def cancel_all(self):
+        ended = []
+        with self._cond:
+            for task in list(self._queued.values()) + list(self._running.values()):
+                ended += self._cancel_locked(task)
+        self._emit_ended(ended)
+
+    # ---------------- Pool threads ---------------- #
+    def _next_locked(self):
+        while self._queue:
+            priority, _, task = self._queue[0]
+            if task.state != "queued":
+                heapq.heappop(self._queue)
+                continue
+            if priority > INTERACTIVE and \
+                    self._background_running >= self.max_threads - self.reserved_interactive:
+                return None  # top of the heap is background: nothing interactive waits
+            heapq.heappop(self._queue)
+            return task
+        return None
+
+    def _worker_loop(self):
+        while True:
+            with self._cond:
+                task = self._next_locked()
+                while task is None:
+                    if self._shutdown:
+                        return
+                    self._cond.wait()
+                    task = self._next_locked()
+                del self._queued[task.id]
+                self._running[task.id] = task
+                task.state = "running"
+                task.started = time.monotonic()
+                if task.priority > INTERACTIVE:
+                    self._background_running += 1
+            self.tasks_changed.emit()
+
+            if task.process:
+                # Hands the job to the process pool; this thread is free again
+                self._start_in_process(task)
+                continue
+            try:
+                if task.worker is None and _accepts_token(task.fn):
+                    task.result = task.fn(*task.args, token=task.token, **task.kwargs)
+                else:
+                    task.result = task.fn(*task.args, **task.kwargs)
+            except TaskCancelled:
+                pass
+            except Exception as e:
+                task.error = str(e) or type(e).__name__
+            self._end(task)
+
+    def _end(self, task):
+        """A started task is over (result or error set)"""
+        task.ended = time.monotonic()
+        with self._cond:
+            self._running.pop(task.id, None)
+            if task.priority > INTERACTIVE and not task.process:
+                self._background_running -= 1
+            self._cond.notify_all()
+        self._task_ended.emit(task)
+
+    def _start_in_process(self, task):
+        with self._cond:
+            # The job holds no pool thread while the process runs it
+            if task.priority > INTERACTIVE:
+                self._background_running -= 1
+                self._cond.notify_all()
+            if self._process_pool is None:
+                self._process_pool = process_pool(self.max_processes)
+            pool = self._process_pool
+        try:
+            future = pool.submit(task.fn, *task.args, **task.kwargs)
+        except Exception as e:
+            task.error = str(e) or type(e).__name__
+            self._end(task)
+            return
+        # A started process job can't be interrupted; when cancelled its
+        # result is dropped. The callback runs on the pool's manager thread.
+        task.token.on_cancel(future.cancel)
+        future.add_done_callback(lambda future: self._process_done(task, future))
+
+    def _process_done(self, task, future):
+        if not future.cancelled():
+            error = future.exception()
+            if error is not None:
+                task.error = str(error) or type(error).__name__
+            else:
+                task.result = future.result()
+        self._end(task)
+
+    # ---------------- GUI thread ---------------- #
+    def _finish_locked(self, task):
+        if self._by_key.get(task.key) is task:
+            del self._by_key[task.key]
+        self._recent.append(task)
+
+    def _on_task_ended(self, task):
+        if task.state != "cancelled":
+            with self._cond:
+                self._finish_locked(task)
+            if task.token.cancelled:
+                task.state = "cancelled"
+            elif task.error is not None:
+                task.state = "failed"
+            else:
+                task.state = "done"
+            self.stats["completed" if task.state == "done" else task.state] += 1
+
+            if task.state == "done" and task.on_done:
+                task.on_done(task.result)
+            elif task.state == "failed":
+                if task.on_error:
+                    task.on_error(task.error)
+                else:
+                    print(f"⚠️ Task {task.name} failed: {task.error}")
+        else:
+            self.stats["cancelled"] += 1
+
+        if task.worker is not None:
+            # Emitted once per task, after run() returned or instead of it
+            task.worker.deleteLater()
+            task.worker = None
+        self.tasks_changed.emit()
+
+    # ---------------- Introspection ---------------- #
+    def snapshot(self):
+        """Queued, running and recently finished tasks with their durations"""
+        now = time.monotonic()
+        with self._cond:
+            tasks = list(self._running.values()) + list(self._queued.values()) + list(self._recent)
+        return [task.info(now) for task in tasks]
+
+    def running(self, key):
+        """True while a task for `key` is queued or running"""
+        with self._cond:
+            return key in self._by_key
+
+    def shutdown(self, timeout=2.0):
+        """Cancel everything and stop the pools; True if all threads exited"""
+        self.cancel_all()
+        with self._cond:
+            self._shutdown = True
+            self._cond.notify_all()
+            pool, self._process_pool = self._process_pool, None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+        deadline = time.monotonic() + timeout
+        for thread in self._threads:
+            thread.join(max(0.0, deadline - time.monotonic()))
+        return not any(thread.is_alive() for thread in self._threads)
+
+
+def _accepts_token(fn):
+    code = getattr(fn, "__code__", None)
+    return code is not None and "token" in code.co_varnames[:code.co_argcount + code.co_kwonlyargcount]
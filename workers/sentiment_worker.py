@@ -3,15 +3,17 @@ import asyncio
 import json
 from typing import List, Optional
 
-from PyQt5.QtCore import QThread, pyqtSignal
+from PyQt5.QtCore import QObject, pyqtSignal
 
 # NOTE: import AsyncGroq lazily inside run() to avoid any network calls in main thread
 from groq import AsyncGroq
 
+from core import perf
 
-class SentimentWorker(QThread):
+
+class SentimentWorker(QObject):
     """
-    Runs sentiment analysis using the Groq Async client inside a dedicated QThread
+    Runs sentiment analysis using the Groq Async client on a scheduler thread
     with its own asyncio event loop. Supports safe cancellation via stop().
     Emits:
       - sentiment_ready: dict -> {"score": int, "label": str, "reasoning": str}
@@ -93,7 +95,9 @@ Respond ONLY with valid JSON, no markdown formatting.
             )
 
             # Await the LLM call with timeout (so it can be cancelled or fail fast)
-            response = await asyncio.wait_for(coro, timeout=self.timeout)
+            perf.count("groq.calls")
+            with perf.span("groq.sentiment", headlines=len(self.headlines)):
+                response = await asyncio.wait_for(coro, timeout=self.timeout)
 
             # If the task was cancelled, raise to upper layer
             if not self._is_running:
@@ -138,7 +142,7 @@ Respond ONLY with valid JSON, no markdown formatting.
 
     def run(self):
         """
-        Start an asyncio loop in this thread, create a client, and run the sentiment call.
+        Start an asyncio loop on the calling (pool) thread, create a client, and run the sentiment call.
         """
         # mark running
         self._is_running = True
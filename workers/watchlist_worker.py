@@ -0,0 +1,91 @@
+# workers/watchlist_worker.py
+import time
+
+from PyQt5.QtCore import QObject, pyqtSignal
+
+from core.data_handler import get_stock_data
+from core.history_cache import get_history
+from core.tick_channel import TickChannel
+from core.watchlist import seed_row
+
+
+class WatchlistSeedWorker(QObject):
+    """Loads the stored history for watchlist rows off the GUI thread.
+
+    Tickers without a local store are downloaded once through
+    get_stock_data, which also adds them to the parquet store.
+    """
+    row_ready = pyqtSignal(str, dict)
+    error = pyqtSignal(str, str)
+
+    def __init__(self, tickers, parent=None):
+        super().__init__(parent)
+        self.tickers = list(tickers)
+        self._running = True
+
+    def run(self):
+        for ticker in self.tickers:
+            if not self._running:
+                return
+            try:
+                df = get_history(ticker)
+                if df is None:
+                    df = get_stock_data(ticker)
+                if df is None or df.empty:
+                    self.error.emit(ticker, "No data found")
+                    continue
+                row = seed_row(df)
+                if row is not None:
+                    self.row_ready.emit(ticker, row)
+            except Exception as e:
+                self.error.emit(ticker, str(e))
+
+    def stop(self):
+        self._running = False
+
+
+class WatchlistFeed(QObject):
+    """Subscribes watchlist symbols on the shared LiveFeedService.
+
+    Unlike LivePriceWorker there are no bars and nothing is persisted: each
+    tick is a slot overwrite in the watchlist's own TickChannel, which the
+    table drains once per frame.
+    """
+
+    def __init__(self, feed, channel=None, parent=None):
+        super().__init__(parent)
+        self.feed = feed
+        self.channel = channel if channel is not None else TickChannel()
+        self._symbols = set()
+
+    def _message_handler(self, data):
+        """Called on the feed thread for every watched symbol"""
+        price = data.get("price", data.get("regularMarketPrice"))
+        symbol = data.get("id")
+        if price is None or symbol is None:
+            return
+        try:
+            ts = float(data["time"]) / 1000.0 if "time" in data else time.time()
+            day_volume = data.get("day_volume")
+            self.channel.publish(
+                symbol, float(price), ts=ts,
+                day_volume=float(day_volume) if day_volume is not None else None,
+            )
+        except (TypeError, ValueError):
+            pass
+
+    def subscribe(self, symbol):
+        if symbol not in self._symbols:
+            self._symbols.add(symbol)
+            self.feed.subscribe(symbol, self._message_handler)
+
+    def unsubscribe(self, symbol):
+        if symbol in self._symbols:
+            self._symbols.discard(symbol)
+            self.feed.unsubscribe(symbol, self._message_handler)
+            self.channel.discard(symbol)
+
+    def stop(self):
+        for symbol in list(self._symbols):
+            self.unsubscribe(symbol)
+        print("✓ Watchlist feed unsubscribed")